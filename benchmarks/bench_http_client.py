@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Compare bare ``requests.get`` against the pooled session.
+
+A small keep-alive HTTP server is started on localhost and hit with the same
+number of requests through each client. The script prints requests/sec for
+both so the effect of connection reuse can be checked without touching the
+real APIs.
+
+Usage::
+
+    python benchmarks/bench_http_client.py --requests 2000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Ensure ``src`` can be imported when running as a script
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.client import build_session  # noqa: E402  (import after path setup)
+
+BODY = json.dumps({"results": [{"id": i} for i in range(20)], "pagination": {"pages": 1}}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802 - stdlib naming
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _run(get, url: str, n: int) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        resp = get(url, params={"page": i}, timeout=30)
+        resp.json()
+    return n / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/candidates/"
+    try:
+        bare = _run(requests.get, url, args.requests)
+        session = build_session()
+        pooled = _run(session.get, url, args.requests)
+        session.close()
+    finally:
+        server.shutdown()
+
+    print(f"bare requests.get : {bare:8.1f} req/s")
+    print(f"pooled session    : {pooled:8.1f} req/s")
+    print(f"speedup           : {pooled / bare:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Check and time the member-report queries against the model indexes.
+
+A temporary SQLite database is created from the SQLModel tables and filled
+with synthetic members, votes, contributions, independent expenditures,
+alignment events and badges. Each report query is run through
+``EXPLAIN QUERY PLAN`` and the script exits non-zero if one of them scans
+its table instead of using an index. The queries are then timed with the
+indexes and again after the secondary indexes are dropped.
+
+Usage::
+
+    python benchmarks/bench_member_queries.py --members 500 --contributions 500000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlmodel import SQLModel, create_engine
+
+# Ensure ``src`` can be imported when running as a script
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src import load  # noqa: E402  (import after path setup)
+from src.models import (  # noqa: E402
+    AlignmentEvent,
+    Badge,
+    Contribution,
+    IndependentExpenditure,
+    Member,
+    MemberFinance,
+    MemberVote,
+    RollCall,
+)
+
+# The queries behind a member report; none of them may scan a whole table.
+REPORT_QUERIES: Dict[str, str] = {
+    "contributions_by_date": (
+        "SELECT date, amount, contributor_name FROM contribution "
+        "WHERE recipient_fec_id = :cand_id AND date BETWEEN :start AND :end ORDER BY date"
+    ),
+    "vote_history": (
+        "SELECT mv.vote_id, mv.position, r.date FROM membervote mv "
+        "JOIN rollcall r ON r.vote_id = mv.vote_id WHERE mv.member_id = :member_id"
+    ),
+    "outside_spending": (
+        "SELECT support_oppose, SUM(amount) FROM independentexpenditure "
+        "WHERE candidate_id = :cand_id AND cycle = :cycle GROUP BY support_oppose"
+    ),
+    "alignment_events": "SELECT vote_id, alignment_score FROM alignmentevent WHERE member_id = :member_id",
+    "finance_by_cycle": (
+        "SELECT total_pac, total_indiv FROM memberfinance WHERE member_id = :member_id AND cycle = :cycle"
+    ),
+    "badges": "SELECT badge_code, label FROM badge WHERE member_id = :member_id",
+}
+
+
+def _populate(engine, members: int, contributions: int, votes: int) -> None:
+    rng = random.Random(0)
+    ids = [f"M{i:06d}" for i in range(members)]
+    cands = [f"H{i:08d}" for i in range(members)]
+    start = date(2023, 1, 1)
+    load.bulk_insert(Member, ({
+        "member_id": m, "first": "F", "last": "L", "chamber": "House", "party": "D", "state": "XX",
+    } for m in ids), engine=engine)
+    load.bulk_insert(RollCall, ({
+        "vote_id": f"v{i}", "question": "q", "result": "Passed", "date": start + timedelta(days=i % 700),
+        "chamber": "House",
+    } for i in range(votes)), engine=engine)
+    load.bulk_insert(MemberVote, ({
+        "vote_id": f"v{i}", "member_id": m, "position": "Yea",
+    } for i in range(votes) for m in ids), engine=engine)
+    load.bulk_insert(Contribution, ({
+        "recipient_fec_id": rng.choice(cands), "contributor_name": "DONOR", "amount": 100.0,
+        "date": start + timedelta(days=rng.randrange(730)), "cycle": 2024,
+    } for _ in range(contributions)), engine=engine)
+    load.bulk_insert(IndependentExpenditure, ({
+        "candidate_id": rng.choice(cands), "amount": 1000.0, "date": start, "cycle": rng.choice([2022, 2024]),
+        "support_oppose": rng.choice("SO"),
+    } for _ in range(contributions // 10)), engine=engine)
+    load.bulk_insert(AlignmentEvent, ({
+        "member_id": rng.choice(ids), "vote_id": f"v{rng.randrange(votes)}", "alignment_score": 0.5,
+    } for _ in range(contributions // 10)), engine=engine)
+    load.bulk_insert(MemberFinance, ({
+        "member_id": m, "cycle": cycle, "total_pac": 1.0, "total_indiv": 1.0,
+    } for m in ids for cycle in (2022, 2024)), engine=engine)
+    load.bulk_insert(Badge, ({"member_id": m, "badge_code": "B", "label": "Badge"} for m in ids), engine=engine)
+
+
+def _params(members: int) -> Dict[str, object]:
+    i = members // 2
+    return {"member_id": f"M{i:06d}", "cand_id": f"H{i:08d}", "cycle": 2024,
+            "start": date(2023, 6, 1), "end": date(2023, 12, 31)}
+
+
+def _plan(conn, sql: str, params: Dict[str, object]) -> List[str]:
+    return [row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params)]
+
+
+def _time(conn, sql: str, params: Dict[str, object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        conn.execute(text(sql), params).fetchall()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=500)
+    parser.add_argument("--contributions", type=int, default=200_000)
+    parser.add_argument("--votes", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        SQLModel.metadata.create_all(engine)
+        _populate(engine, args.members, args.contributions, args.votes)
+        params = _params(args.members)
+        failures = []
+        with engine.connect() as conn:
+            conn.execute(text("ANALYZE"))
+            indexed = {}
+            for name, sql in REPORT_QUERIES.items():
+                plan = _plan(conn, sql, params)
+                if any(step.startswith("SCAN ") for step in plan):
+                    failures.append(name)
+                print(f"{name:<22} {' | '.join(plan)}")
+                indexed[name] = _time(conn, sql, params, args.repeat)
+
+        secondary = [index for table in SQLModel.metadata.sorted_tables for index in table.indexes]
+        for index in secondary:
+            index.drop(engine)
+        with engine.connect() as conn:
+            print(f"\n{'query':<22} {'indexed':>10} {'no index':>10}")
+            for name, sql in REPORT_QUERIES.items():
+                scan = _time(conn, sql, params, args.repeat)
+                print(f"{name:<22} {indexed[name]:8.2f}ms {scan:8.2f}ms")
+        engine.dispose()
+
+    if failures:
+        sys.exit(f"queries scanning their table: {', '.join(failures)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -36,6 +36,20 @@ CREATE TABLE contributions (
 
 CREATE INDEX idx_contributions_recipient_date ON contributions(recipient_fec_id, date);
 
+CREATE TABLE independent_expenditures (
+    id INTEGER PRIMARY KEY,
+    committee_id TEXT REFERENCES committees(committee_id),
+    candidate_id TEXT,
+    payee TEXT,
+    purpose TEXT,
+    amount NUMERIC,
+    date DATE,
+    support_oppose TEXT,
+    cycle INTEGER
+);
+
+CREATE INDEX idx_independent_expenditures_candidate_cycle ON independent_expenditures(candidate_id, cycle);
+
 CREATE TABLE bills (
     bill_id TEXT PRIMARY KEY,
     congress INTEGER,
@@ -85,7 +99,7 @@ CREATE TABLE alignment_events (
     drivers JSON
 );
 
-CREATE INDEX idx_alignment_events_member ON alignment_events(member_id);
+CREATE INDEX idx_alignment_events_member_vote ON alignment_events(member_id, vote_id);
 
 CREATE TABLE badges (
     member_id TEXT REFERENCES members(member_id),
@@ -3,12 +3,15 @@ from __future__ import annotations
 from typing import Dict, List, Optional
 
 from .config import get_settings
+from .pagination import fetch_offset_pages
 from .utils import get_json
 
 API_URL = "https://api.congress.gov/v3"
 
 
-def fetch_bills(from_date: Optional[str] = None, limit: int = 250) -> List[Dict]:
+def fetch_bills(
+    from_date: Optional[str] = None, limit: int = 250, concurrency: Optional[int] = None
+) -> List[Dict]:
     """Fetch bill summaries from Congress.gov.
 
     Parameters
@@ -17,18 +20,20 @@ def fetch_bills(from_date: Optional[str] = None, limit: int = 250) -> List[Dict]
         Optional ISO ``fromDateTime`` filter for incremental updates.
     limit:
         Number of records per page (max 250).
+    concurrency:
+        Maximum number of pages fetched at once once the total count is known.
     """
 
     settings = get_settings()
     headers = {"X-Api-Key": settings.congress_api_key}
-    params: Dict[str, Optional[str | int]] = {"format": "json", "limit": limit}
+    params: Dict[str, str | int] = {"format": "json", "limit": limit}
     if from_date:
         params["fromDateTime"] = from_date
     url = f"{API_URL}/bill"
-    items: List[Dict] = []
-    while url:
-        data = get_json(url, params=params, headers=headers)
-        items.extend(data.get("bills", {}).get("bill", []))
-        url = data.get("pagination", {}).get("next")
-        params = None  # next URLs already contain query parameters
-    return items
+    return fetch_offset_pages(
+        lambda u, p: get_json(u, params=p, headers=headers),
+        url,
+        params,
+        lambda data: data.get("bills", {}).get("bill", []),
+        concurrency=concurrency,
+    )
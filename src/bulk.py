@@ -0,0 +1,260 @@
+"""Local artifact cache and single-pass indexes for FEC bulk files."""
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import pickle
+import time
+import urllib.error
+import urllib.request
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .utils import RAW_DIR
+
+BULK_URL = "https://www.fec.gov/files/bulk-downloads"
+BULK_DIR = RAW_DIR / "bulk"
+# Seconds a bulk file is reused before the server is asked whether it changed.
+BULK_MAX_AGE = 6 * 3600
+
+# In-process copies of loaded indexes, keyed by (kind, source path) and
+# holding (fingerprint, index): a changed file replaces its old entry, and
+# past MAX_INDEXES the least recently used index is dropped.
+MAX_INDEXES = 8
+_indexes: "OrderedDict[Tuple[str, str], Tuple[Tuple[str, int, int], Any]]" = OrderedDict()
+
+
+def _validators(headers: Optional[Any]) -> Dict[str, Optional[str]]:
+    return {name: headers.get(name) if headers else None for name in ("ETag", "Last-Modified", "Content-Length")}
+
+
+def _changed(stored: Dict[str, Any], current: Dict[str, Optional[str]], size: int) -> bool:
+    """Whether the server's validators show a different file than the local copy."""
+    for name in ("ETag", "Last-Modified"):
+        if stored.get(name) and current.get(name):
+            return stored[name] != current[name]
+    length = current.get("Content-Length")
+    return length is not None and int(length) != size
+
+
+def fetch_bulk_file(cycle: int, fname: str) -> Path:
+    """Return the local copy of a bulk file, downloading it when missing or changed.
+
+    A copy last checked more than :data:`BULK_MAX_AGE` seconds ago is
+    compared with a ``HEAD`` request against the ``ETag``, ``Last-Modified``
+    and size recorded when it was downloaded, and fetched again when the
+    server has a different file. The copy is kept if the server cannot be
+    reached.
+    """
+    dest = BULK_DIR / str(cycle) / fname
+    url = f"{BULK_URL}/{cycle}/{fname}"
+    meta_path = dest.with_name(dest.name + ".json")
+    meta = json.loads(meta_path.read_text()) if meta_path.exists() else {}
+    if dest.exists():
+        if time.time() - meta.get("checked", 0) < BULK_MAX_AGE:
+            return dest
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, method="HEAD"), timeout=60) as resp:
+                current = _validators(resp.headers)
+        except urllib.error.URLError:
+            return dest
+        if not _changed(meta, current, dest.stat().st_size):
+            meta_path.write_text(json.dumps({**meta, "checked": time.time()}))
+            return dest
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part = dest.with_name(dest.name + ".part")
+    _, headers = urllib.request.urlretrieve(url, part)
+    part.replace(dest)
+    meta_path.write_text(json.dumps({**_validators(headers), "checked": time.time()}))
+    return dest
+
+
+def extract_member(zip_path: Path) -> Path:
+    """Unpack the data file inside ``zip_path`` next to it and return its path.
+
+    The member is only extracted again when the archive is newer than the
+    extracted copy.
+    """
+    with zipfile.ZipFile(zip_path) as zf:
+        name = zf.namelist()[0]
+        dest = zip_path.with_name(Path(name).name)
+        if dest.exists() and dest.stat().st_mtime >= zip_path.stat().st_mtime:
+            return dest
+        part = dest.with_name(dest.name + ".part")
+        with zf.open(name) as src, part.open("wb") as out:
+            while chunk := src.read(1 << 20):
+                out.write(chunk)
+    part.replace(dest)
+    return dest
+
+
+def load_index(source: Path, kind: str, build: Callable[[Path], Any]) -> Any:
+    """Return the index ``build`` produces for ``source``, building it only once.
+
+    Indexes are pickled under ``BULK_DIR/index`` together with the size and
+    mtime of the source file, and rebuilt when the file changes. ``kind``
+    separates different indexes over the same file.
+    """
+    stat = source.stat()
+    fingerprint = (str(source.resolve()), stat.st_size, stat.st_mtime_ns)
+    memo_key = (kind, fingerprint[0])
+    memo = _indexes.get(memo_key)
+    if memo is not None and memo[0] == fingerprint:
+        _indexes.move_to_end(memo_key)
+        return memo[1]
+
+    name = hashlib.sha256(f"{kind}:{fingerprint[0]}".encode()).hexdigest()[:32]
+    index_path = BULK_DIR / "index" / f"{name}.pickle"
+    index = None
+    if index_path.exists():
+        with index_path.open("rb") as fh:
+            stored_fingerprint, stored = pickle.load(fh)
+        if stored_fingerprint == fingerprint:
+            index = stored
+    if index is None:
+        index = build(source)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        part = index_path.with_name(index_path.name + ".part")
+        with part.open("wb") as fh:
+            pickle.dump((fingerprint, index), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        part.replace(index_path)
+    _indexes[memo_key] = (fingerprint, index)
+    _indexes.move_to_end(memo_key)
+    while len(_indexes) > MAX_INDEXES:
+        _indexes.popitem(last=False)
+    return index
+
+
+def _records(fh: BinaryIO) -> Iterator[Tuple[int, bytes]]:
+    """Yield ``(byte_offset, raw_record)`` for each CSV record in ``fh``.
+
+    Quoted fields may contain newlines, so a line with an odd number of
+    quotes is joined with the following line(s).
+    """
+    while True:
+        offset = fh.tell()
+        line = fh.readline()
+        if not line:
+            return
+        while line.count(b'"') % 2:
+            more = fh.readline()
+            if not more:
+                break
+            line += more
+        yield offset, line
+
+
+def _parse(record: bytes) -> List[str]:
+    return next(csv.reader([record.decode("latin-1")]))
+
+
+@dataclass
+class ScheduleEIndex:
+    """Per-candidate totals and row offsets for one Schedule E bulk file."""
+
+    path: Path
+    fieldnames: List[str]
+    totals: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    offsets: Dict[str, List[int]] = field(default_factory=dict)
+
+    def rows(self, candidate_id: str) -> List[Dict[str, str]]:
+        """Return the raw rows for ``candidate_id`` by seeking to their offsets."""
+        rows: List[Dict[str, str]] = []
+        with self.path.open("rb") as fh:
+            for offset in self.offsets.get(candidate_id, []):
+                fh.seek(offset)
+                _, record = next(_records(fh))
+                rows.append(dict(zip(self.fieldnames, _parse(record))))
+        return rows
+
+
+def _amount(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def _build_schedule_e_index(path: Path) -> ScheduleEIndex:
+    """Scan a Schedule E CSV once, aggregating every candidate at the same time."""
+    with path.open("rb") as fh:
+        records = _records(fh)
+        _, header = next(records, (0, b""))
+        index = ScheduleEIndex(path, _parse(header) if header else [])
+        cols = {name: i for i, name in enumerate(index.fieldnames)}
+        cand_col, amt_col, sup_col = cols.get("cand_id"), cols.get("exp_amo"), cols.get("sup_opp")
+        if cand_col is None:
+            return index
+        offset = 0
+
+        def lines() -> Iterator[str]:
+            nonlocal offset
+            for offset, record in records:
+                yield record.decode("latin-1")
+
+        for row in csv.reader(lines()):
+            if len(row) <= cand_col:
+                continue
+            cand = row[cand_col]
+            index.offsets.setdefault(cand, []).append(offset)
+            totals = index.totals.setdefault(cand, {"support": 0.0, "oppose": 0.0})
+            side = row[sup_col][:1].upper() if sup_col is not None and len(row) > sup_col else ""
+            if side in ("S", "O") and amt_col is not None and len(row) > amt_col:
+                totals["support" if side == "S" else "oppose"] += _amount(row[amt_col])
+    return index
+
+
+def schedule_e_index(cycle: int) -> ScheduleEIndex:
+    """Return the index over the cycle's independent expenditure file."""
+    path = extract_member(fetch_bulk_file(cycle, f"independent-expenditure-{cycle}.zip"))
+    return load_index(path, "schedule-e", _build_schedule_e_index)
+
+
+def schedule_e_totals(cycle: int, candidate_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, float]]:
+    """Return support/oppose totals per candidate from the bulk file.
+
+    With ``candidate_ids`` only those candidates are returned (zero totals
+    for candidates without expenditures); otherwise every candidate is.
+    """
+    totals = schedule_e_index(cycle).totals
+    if candidate_ids is None:
+        return dict(totals)
+    return {cid: totals.get(cid, {"support": 0.0, "oppose": 0.0}) for cid in candidate_ids}
+
+
+CandidateTotalsIndex = Dict[Tuple[str, str], List[Dict[str, str]]]
+
+
+def _index_rows(rows: Iterable[Dict[str, str]],
+                key: Callable[[Dict[str, str]], Tuple[str, str]]) -> CandidateTotalsIndex:
+    index: CandidateTotalsIndex = {}
+    for row in rows:
+        index.setdefault(key(row), []).append(row)
+    return index
+
+
+def candidate_totals_index(cycle: int) -> CandidateTotalsIndex:
+    """Index the cycle's bulk ``ccl`` file by ``(CAND_ID, cycle)``."""
+    zip_path = fetch_bulk_file(cycle, "ccl.csv.zip")
+
+    def build(path: Path) -> CandidateTotalsIndex:
+        with zipfile.ZipFile(path) as zf, zf.open(zf.namelist()[0]) as fh:
+            reader = csv.DictReader(io.TextIOWrapper(fh, encoding="latin-1"))
+            return _index_rows(reader, lambda r: ((r.get("CAND_ID") or "").upper(), str(cycle)))
+
+    return load_index(zip_path, f"ccl-{cycle}", build)
+
+
+def candidate_totals_file_index(path: Path) -> CandidateTotalsIndex:
+    """Index a ``candidate_totals.csv`` export by ``(candidate_id, cycle)``."""
+
+    def build(source: Path) -> CandidateTotalsIndex:
+        with source.open(newline="") as fh:
+            return _index_rows(csv.DictReader(fh), lambda r: (r.get("candidate_id") or "", str(r.get("cycle"))))
+
+    return load_index(path, "candidate-totals", build)
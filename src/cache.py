@@ -0,0 +1,198 @@
+"""Bounded, compressed SQLite store for cached API responses."""
+from __future__ import annotations
+
+import gzip
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Mapping, NamedTuple, Optional
+from urllib.parse import urlparse
+
+from .config import get_settings
+
+try:  # pragma: no cover - optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# Seconds a cached response stays fresh, keyed by a fragment of the URL path.
+# The longest matching fragment wins; endpoints with no match never expire.
+DEFAULT_TTLS: Dict[str, Optional[float]] = {
+    "/member": 24 * 3600,
+    "/committee": 24 * 3600,
+    "/bill": 24 * 3600,
+    "/house-vote": 24 * 3600,
+    "/congressional-record": 24 * 3600,
+    "/candidate": 7 * 24 * 3600,
+    "/schedules/": 24 * 3600,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+"""
+
+
+class CachedResponse(NamedTuple):
+    """A cached body together with the validators needed to revalidate it."""
+
+    data: Any
+    fresh: bool
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+def _compress(raw: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(raw)
+    return gzip.compress(raw, compresslevel=6)
+
+
+def _decompress(body: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(body)
+    return gzip.decompress(body)
+
+
+class ResponseCache:
+    """Single-file response cache with compression, TTLs and LRU eviction.
+
+    Parameters
+    ----------
+    path:
+        SQLite database file holding the cached bodies.
+    max_bytes:
+        Upper bound on the total compressed size. The least recently used
+        entries are evicted once it is exceeded.
+    ttls:
+        Freshness per endpoint, see :data:`DEFAULT_TTLS`.
+    codec:
+        ``"zstd"`` when :mod:`zstandard` is installed, otherwise ``"gzip"``.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = 2 * 1024 ** 3,
+                 ttls: Optional[Mapping[str, Optional[float]]] = None, codec: Optional[str] = None) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.codec = codec or ("zstd" if zstandard is not None else "gzip")
+        self._lock = threading.Lock()
+        self._stats: Counter = Counter()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        for column in ("etag", "last_modified"):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def endpoint(url: str) -> str:
+        return urlparse(url).path
+
+    def ttl(self, endpoint: str) -> Optional[float]:
+        """Return the freshness window for ``endpoint`` in seconds."""
+        matches = [frag for frag in self.ttls if frag in endpoint]
+        if not matches:
+            return None
+        return self.ttls[max(matches, key=len)]
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """Return the entry for ``key``, fresh or stale, or ``None``.
+
+        Stale entries are returned so the caller can revalidate them with
+        their stored ``ETag``/``Last-Modified`` validators.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT endpoint, codec, body, size, stored_at, etag, last_modified FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            endpoint, codec, body, size, stored_at, etag, last_modified = row
+            now = time.time()
+            ttl = self.ttl(endpoint)
+            fresh = ttl is None or now - stored_at <= ttl
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._stats["hits" if fresh else "expired"] += 1
+            self._stats["bytes_read"] += size
+        return CachedResponse(json.loads(_decompress(body, codec)), fresh, etag, last_modified)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the decoded response for ``key`` if present and fresh."""
+        entry = self.lookup(key)
+        return entry.data if entry is not None and entry.fresh else None
+
+    def put(self, key: str, url: str, data: Any, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """Store ``data`` under ``key`` and evict old entries if over budget."""
+        body = _compress(json.dumps(data, separators=(",", ":")).encode(), self.codec)
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, endpoint, codec, body, size, stored_at, accessed_at, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, self.endpoint(url), self.codec, body, len(body), now, now, etag, last_modified),
+            )
+            self._total += len(body) - (old[0] if old else 0)
+            self._stats["bytes_written"] += len(body)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def refresh(self, key: str) -> None:
+        """Mark ``key`` fresh again after the server answered 304 Not Modified."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+            self._stats["revalidated"] += 1
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the store is under 90% of ``max_bytes``."""
+        target = self.max_bytes * 0.9
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at")
+        doomed = []
+        for key, size in rows:
+            if self._total <= target:
+                break
+            doomed.append((key,))
+            self._total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self._stats["evictions"] += len(doomed)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/byte counters plus the current entry count and size."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {**self._stats, "entries": entries, "total_bytes": self._total}
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@lru_cache()
+def get_cache() -> ResponseCache:
+    """Return the process-wide response cache configured from settings."""
+    settings = get_settings()
+    ttls = {**DEFAULT_TTLS, **settings.cache_ttls}
+    return ResponseCache(Path(settings.cache_path), settings.cache_max_bytes, ttls)
@@ -19,7 +19,15 @@ from . import (
     votes,
     voter_history,
 )
-from .models import Bill, Committee, CongressionalRecord, Member, MemberVote
+from .models import (
+    Bill,
+    Committee,
+    CongressionalRecord,
+    Contribution,
+    IndependentExpenditure,
+    Member,
+    MemberVote,
+)
 
 app = typer.Typer()
 ingest_app = typer.Typer()
@@ -129,13 +137,13 @@ def ingest_fec(
             "cycle": int(cycles),
         }
     ]
-    contribs = normalize.normalize_contributions(raw)
-    load.load_objects(contribs)
+    contribs = normalize.normalize_contributions_frame(raw)
+    load.copy_insert(Contribution, contribs)
 
     if schedule_e:
         ie_raw = fec.fetch_independent_expenditures("H0XX00001", int(cycles))
-        expenditures = normalize.normalize_independent_expenditures(ie_raw)
-        load.load_objects(expenditures)
+        expenditures = normalize.normalize_independent_expenditures_frame(ie_raw)
+        load.copy_insert(IndependentExpenditure, expenditures)
 
 
 @ingest_app.command("candidate-totals")
@@ -222,8 +230,8 @@ def normalize_all(kind: str = typer.Argument("all")) -> None:  # pragma: no cove
             "cycle": 2024,
         }
     ]
-    contribs = normalize.normalize_contributions(raw)
-    load.load_objects(contribs)
+    contribs = normalize.normalize_contributions_frame(raw)
+    load.copy_insert(Contribution, contribs)
 
 
 @app.command("analyze")
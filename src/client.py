@@ -0,0 +1,40 @@
+"""Shared HTTP session with pooled keep-alive connections."""
+from __future__ import annotations
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import get_settings
+
+
+def build_session(pool_connections: int = 10, pool_maxsize: int = 10) -> requests.Session:
+    """Return a session that keeps connections alive between requests.
+
+    Parameters
+    ----------
+    pool_connections:
+        Number of per-host connection pools to keep around.
+    pool_maxsize:
+        Maximum number of idle connections kept in each host pool.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache()
+def get_session() -> requests.Session:
+    """Return the process-wide session used for all API calls."""
+    settings = get_settings()
+    return build_session(settings.http_pool_connections, settings.http_pool_maxsize)
+
+
+def close_session() -> None:
+    """Close pooled connections and drop the cached session."""
+    if get_session.cache_info().currsize:
+        get_session().close()
+    get_session.cache_clear()
@@ -1,5 +1,7 @@
 """Configuration management for the campaign pipeline."""
 from functools import lru_cache
+from typing import Dict
+
 from pydantic import BaseSettings
 
 
@@ -11,6 +13,16 @@ class Settings(BaseSettings):
     db_url: str = "sqlite:///campaign.db"
     congress_data_dir: str = ""
     fec_data_dir: str = ""
+    http_pool_connections: int = 10
+    http_pool_maxsize: int = 10
+    http_timeout: float = 30.0
+    api_concurrency: int = 4
+    fec_hourly_quota: int = 1000
+    congress_hourly_quota: int = 5000
+    http_max_attempts: int = 5
+    cache_path: str = "data/raw/responses.sqlite"
+    cache_max_bytes: int = 2 * 1024 ** 3
+    cache_ttls: Dict[str, float] = {}
 
     class Config:
         env_file = ".env"
@@ -1,18 +1,17 @@
 """Access FEC API for contributions and campaign finance data."""
 from __future__ import annotations
 
-import csv
-import io
-import tempfile
-import urllib.request
-import zipfile
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional
 
+from . import bulk as bulk_files
 from .config import get_settings
+from .pagination import fetch_pages
 from .utils import get_json
 
 API_URL = "https://api.open.fec.gov/v1"
+# Number of candidate IDs sent in one multi-candidate API request.
+BATCH_SIZE = 50
 
 
 def fetch_candidate_ids(bioguide_id: str) -> List[str]:
@@ -61,35 +60,48 @@ def link_members_to_candidates(members: Iterable[Dict[str, str]], mapping: Dict[
     return result
 
 
-def _fetch_all_pages(url: str, params: Dict) -> List[Dict]:
-    """Fetch all pages for a given endpoint."""
-    results: List[Dict] = []
-    page = 1
-    while True:
-        params["page"] = page
-        data = get_json(url, params=params)
+def _fetch_all_pages(url: str, params: Dict, concurrency: Optional[int] = None, retries: int = 2) -> List[Dict]:
+    """Fetch all pages for a given endpoint.
+
+    Page 1 is fetched first to learn ``pagination.pages``; pages 2..N are then
+    requested concurrently, each with its own copy of ``params``. Results are
+    returned in page order.
+    """
+    if concurrency is None:
+        concurrency = get_settings().api_concurrency
+    first = get_json(url, params={**params, "page": 1})
+    results: List[Dict] = list(first.get("results", []))
+    pages = int(first.get("pagination", {}).get("pages", 1) or 1)
+    param_sets = [{**params, "page": page} for page in range(2, pages + 1)]
+    for data in fetch_pages(lambda p: get_json(url, params=p), param_sets, concurrency, retries):
         results.extend(data.get("results", []))
-        pagination = data.get("pagination", {})
-        pages = pagination.get("pages", page)
-        if page >= pages:
-            break
-        page += 1
     return results
 
 
-def _download_bulk_candidate_totals(cycle: int, candidate_id: str) -> List[Dict]:
-    """Download candidate totals in bulk CSV format."""
-    base = f"https://www.fec.gov/files/bulk-downloads/{cycle}"
-    url = f"{base}/ccl.csv.zip"
-    with tempfile.TemporaryDirectory() as tmpdir:
-        zip_path = Path(tmpdir) / "ccl.zip"
-        urllib.request.urlretrieve(url, zip_path)
-        with zipfile.ZipFile(zip_path) as zf:
-            name = zf.namelist()[0]
-            with zf.open(name) as fh:
-                reader = csv.DictReader(io.TextIOWrapper(fh, encoding="latin-1"))
-                cid = candidate_id.upper()
-                return [row for row in reader if row.get("CAND_ID") == cid]
+def _group_by_candidate(rows: Iterable[Dict], candidate_ids: List[str]) -> Dict[str, List[Dict]]:
+    grouped: Dict[str, List[Dict]] = {cid: [] for cid in candidate_ids}
+    for row in rows:
+        cid = row.get("candidate_id")
+        if cid in grouped:
+            grouped[cid].append(row)
+    return grouped
+
+
+def _fetch_many(url: str, candidate_ids: Iterable[str], params: Dict) -> Dict[str, List[Dict]]:
+    """Fetch an endpoint for many candidates, ``BATCH_SIZE`` IDs per request."""
+    ids = list(dict.fromkeys(candidate_ids))
+    rows: List[Dict] = []
+    for start in range(0, len(ids), BATCH_SIZE):
+        batch = ids[start:start + BATCH_SIZE]
+        rows.extend(_fetch_all_pages(url, {**params, "candidate_id": batch}))
+    return _group_by_candidate(rows, ids)
+
+
+def _candidate_totals_path(fec_data_dir: str) -> Optional[Path]:
+    if not fec_data_dir:
+        return None
+    path = Path(fec_data_dir) / "candidate_totals.csv"
+    return path if path.exists() else None
 
 
 def fetch_candidate_totals(candidate_id: str, cycle: int, bulk: bool = False) -> List[Dict]:
@@ -102,23 +114,19 @@ def fetch_candidate_totals(candidate_id: str, cycle: int, bulk: bool = False) ->
     cycle: int
         Two-year election cycle.
     bulk: bool, optional
-        If ``True``, download bulk CSV data instead of calling the API.
+        If ``True``, read the cycle's bulk CSV instead of calling the API.
+
+    Bulk and ``FEC_DATA_DIR`` files are indexed by ``(candidate_id, cycle)``
+    once per file version, so each lookup is a dictionary access.
     """
     if bulk:
-        return _download_bulk_candidate_totals(cycle, candidate_id)
+        return bulk_files.candidate_totals_index(cycle).get((candidate_id.upper(), str(cycle)), [])
 
     settings = get_settings()
-    if settings.fec_data_dir:
-        path = Path(settings.fec_data_dir) / "candidate_totals.csv"
-        if path.exists():
-            with path.open() as fh:
-                reader = csv.DictReader(fh)
-                return [
-                    r
-                    for r in reader
-                    if r.get("candidate_id") == candidate_id
-                    and str(r.get("cycle")) == str(cycle)
-                ]
+    totals_path = _candidate_totals_path(settings.fec_data_dir)
+    if totals_path:
+        index = bulk_files.candidate_totals_file_index(totals_path)
+        return index.get((candidate_id, str(cycle)), [])
 
     url = f"{API_URL}/candidate/totals/"
     params = {
@@ -130,18 +138,35 @@ def fetch_candidate_totals(candidate_id: str, cycle: int, bulk: bool = False) ->
     return _fetch_all_pages(url, params)
 
 
-def _download_bulk_schedule_e(cycle: int, candidate_id: str) -> List[Dict]:
-    """Download Schedule E independent expenditures in bulk CSV format."""
-    base = f"https://www.fec.gov/files/bulk-downloads/{cycle}"
-    url = f"{base}/independent-expenditure-{cycle}.zip"
-    with tempfile.TemporaryDirectory() as tmpdir:
-        zip_path = Path(tmpdir) / "ie.zip"
-        urllib.request.urlretrieve(url, zip_path)
-        with zipfile.ZipFile(zip_path) as zf:
-            name = zf.namelist()[0]
-            with zf.open(name) as fh:
-                reader = csv.DictReader(io.TextIOWrapper(fh, encoding="latin-1"))
-                return [row for row in reader if row.get("cand_id") == candidate_id]
+def fetch_candidate_totals_many(
+    candidate_ids: Iterable[str], cycle: int, bulk: bool = False
+) -> Dict[str, List[Dict]]:
+    """Fetch candidate totals for many candidates in one call.
+
+    Returns a mapping from candidate ID to its rows, so all linked candidates
+    for a cycle can be covered at once. Bulk and ``FEC_DATA_DIR`` lookups are
+    answered from the on-disk index; otherwise candidate IDs are sent to the
+    API in batches.
+    """
+    ids = list(dict.fromkeys(candidate_ids))
+    if bulk:
+        index = bulk_files.candidate_totals_index(cycle)
+        return {cid: index.get((cid.upper(), str(cycle)), []) for cid in ids}
+
+    settings = get_settings()
+    totals_path = _candidate_totals_path(settings.fec_data_dir)
+    if totals_path:
+        index = bulk_files.candidate_totals_file_index(totals_path)
+        return {cid: index.get((cid, str(cycle)), []) for cid in ids}
+
+    url = f"{API_URL}/candidate/totals/"
+    params = {"api_key": settings.fec_api_key, "cycle": cycle, "per_page": 100}
+    return _fetch_many(url, ids, params)
+
+
+def _bulk_schedule_e(cycle: int, candidate_id: str) -> List[Dict]:
+    """Return a candidate's Schedule E rows from the cached bulk file."""
+    return bulk_files.schedule_e_index(cycle).rows(candidate_id)
 
 
 def fetch_independent_expenditures(
@@ -156,10 +181,12 @@ def fetch_independent_expenditures(
     cycle: int
         Two-year election cycle.
     bulk: bool, optional
-        If ``True``, download bulk CSV data instead of calling the API.
+        If ``True``, read the cycle's bulk file instead of calling the API.
+        The file is downloaded once and indexed for every candidate in a
+        single pass, so repeated lookups do not rescan it.
     """
     if bulk:
-        return _download_bulk_schedule_e(cycle, candidate_id)
+        return _bulk_schedule_e(cycle, candidate_id)
 
     settings = get_settings()
     url = f"{API_URL}/schedules/schedule_e/"
@@ -172,3 +199,23 @@ def fetch_independent_expenditures(
     return _fetch_all_pages(url, params)
 
 
+def fetch_independent_expenditures_many(
+    candidate_ids: Iterable[str], cycle: int, bulk: bool = False
+) -> Dict[str, List[Dict]]:
+    """Fetch Schedule E independent expenditures for many candidates.
+
+    Returns a mapping from candidate ID to its expenditures. With ``bulk``
+    the rows come from the cycle's indexed bulk file instead of the API.
+    """
+    if bulk:
+        index = bulk_files.schedule_e_index(cycle)
+        return {cid: index.rows(cid) for cid in dict.fromkeys(candidate_ids)}
+
+    settings = get_settings()
+    url = f"{API_URL}/schedules/schedule_e/"
+    params = {
+        "api_key": settings.fec_api_key,
+        "two_year_transaction_period": cycle,
+        "per_page": 100,
+    }
+    return _fetch_many(url, candidate_ids, params)
@@ -1,29 +1,257 @@
 """Load normalized data into the database."""
 from __future__ import annotations
 
-from typing import Iterable
+import csv
+import io
+import json
+from functools import lru_cache
+from itertools import chain, groupby, islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Type, Union
 
-from sqlmodel import Session, SQLModel, create_engine
+import pandas as pd
+from sqlalchemy import Table, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel, create_engine
 
 from .config import get_settings
 
+# Rows sent to the database per executemany call.
+CHUNK_SIZE = 5000
+# Rows encoded per read of the COPY stream.
+COPY_CHUNK_SIZE = 10_000
+# NULL marker in COPY CSV; unquoted empty fields would be ambiguous with "".
+COPY_NULL = "\\N"
 
-def get_engine():
-    settings = get_settings()
-    return create_engine(settings.db_url)
+Rows = Union[Iterable[Union[Mapping[str, Any], SQLModel]], Mapping[str, Sequence[Any]], pd.DataFrame]
+
+
+@lru_cache()
+def _engine(db_url: str) -> Engine:
+    url = make_url(db_url)
+    if url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:"):
+        # Opening a SQLite file is cheap, and pooled connections would keep
+        # writing to a database file that has since been deleted or replaced.
+        return create_engine(db_url, poolclass=NullPool)
+    return create_engine(db_url)
+
+
+def get_engine() -> Engine:
+    """Return the engine for ``Settings.db_url``, created once per URL."""
+    return _engine(get_settings().db_url)
 
 
 def init_db() -> None:
-    """Create database tables."""
+    """Create database tables and any indexes missing from existing tables."""
     engine = get_engine()
     SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
 
 
-def load_objects(objs: Iterable[SQLModel]) -> None:
-    """Persist SQLModel objects to the database."""
-    engine = get_engine()
-    with Session(engine) as session:
-        for obj in objs:
-            session.add(obj)
-        session.commit()
+def _defaults(model: Type[SQLModel], table: Table) -> Dict[str, Any]:
+    """Values of the model's optional fields, used for keys missing from a row."""
+    defaults = {}
+    for name, field in model.__fields__.items():
+        if name in table.c and not field.required:
+            defaults[name] = field.default_factory if field.default_factory else field.default
+    return defaults
+
+
+def _frame_rows(frame: pd.DataFrame, start: int) -> List[Dict[str, Any]]:
+    # Object dtype unboxes numpy scalars, which the DB-API drivers reject,
+    # and lets NaN/NaT become None.
+    chunk = frame.iloc[start:start + CHUNK_SIZE].astype(object)
+    return chunk.where(chunk.notna(), None).to_dict("records")
+
+
+def _row_dicts(model: Type[SQLModel], table: Table, rows: Rows) -> Iterator[Dict[str, Any]]:
+    if isinstance(rows, pd.DataFrame):
+        frame = rows
+        rows = (row for start in range(0, len(frame), CHUNK_SIZE) for row in _frame_rows(frame, start))
+    elif isinstance(rows, Mapping):
+        columns = list(rows)
+        rows = (dict(zip(columns, values)) for values in zip(*rows.values()))
+    defaults = _defaults(model, table)
+    auto = table.autoincrement_column
+    for row in rows:
+        if isinstance(row, SQLModel):
+            values = {c.name: getattr(row, c.name) for c in table.columns}
+        else:
+            values = {
+                name: row[name] if name in row else (default() if callable(default) else default)
+                for name, default in defaults.items()
+            }
+            values.update((k, v) for k, v in row.items() if k in table.c)
+        if auto is not None and values.get(auto.name) is None:
+            values.pop(auto.name, None)
+        yield values
+
+
+def _insert_statement(table: Table, dialect: str, columns: Sequence[str], upsert: bool):
+    """``INSERT`` for ``columns``, upserting on the primary key where the dialect allows it."""
+    key = [c.name for c in table.primary_key.columns]
+    if not upsert or dialect not in ("sqlite", "postgresql") or not set(key) <= set(columns):
+        return insert(table)
+    stmt = (sqlite.insert if dialect == "sqlite" else postgresql.insert)(table)
+    updates = {c: stmt.excluded[c] for c in columns if c not in key}
+    if not updates:
+        return stmt.on_conflict_do_nothing(index_elements=key)
+    return stmt.on_conflict_do_update(index_elements=key, set_=updates)
+
+
+def bulk_insert(model: Type[SQLModel], rows: Rows, upsert: bool = True,
+                chunk_size: int = CHUNK_SIZE, engine: Optional[Engine] = None) -> int:
+    """Insert ``rows`` into ``model``'s table with Core ``executemany`` and return the row count.
+
+    ``rows`` may be model instances, dicts keyed by column name (a
+    generator keeps memory bounded to one chunk), or a column batch given as
+    a mapping of column name to values or a DataFrame. Values must already
+    have the column's Python type. Missing optional fields take the model's
+    defaults and unset autoincrement ids are assigned by the database.
+
+    With ``upsert`` rows whose primary key already exists are updated in
+    place on SQLite and Postgres (``ON CONFLICT``); other dialects get a
+    plain insert. Everything is written in one transaction.
+    """
+    table: Table = model.__table__
+    engine = engine or get_engine()
+    dialect = engine.dialect.name
+    values = _row_dicts(model, table, rows)
+    count = 0
+    with engine.begin() as conn:
+        while chunk := list(islice(values, chunk_size)):
+            # Rows of one executemany must share their keys; they only
+            # differ when some rows carry an explicit autoincrement id.
+            for columns, group in groupby(chunk, key=lambda r: tuple(r)):
+                params: List[Dict[str, Any]] = list(group)
+                conn.execute(_insert_statement(table, dialect, columns, upsert), params)
+            count += len(chunk)
+    return count
+
+
+def _copy_value(value: Any) -> Any:
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+class _CopyStream(io.RawIOBase):
+    """File-like CSV view of row dicts for ``copy_expert``, encoded a chunk at a time.
+
+    Reads advance an offset into the encoded chunk instead of slicing off
+    the unread rest, so a chunk is copied once however small the reads.
+    """
+
+    def __init__(self, rows: Iterator[Dict[str, Any]], columns: Sequence[str],
+                 chunk_size: int = COPY_CHUNK_SIZE) -> None:
+        self.rows = rows
+        self.columns = list(columns)
+        self.chunk_size = chunk_size
+        self.count = 0
+        self._buffer = bytearray()
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def _fill(self) -> bool:
+        chunk = list(islice(self.rows, self.chunk_size))
+        if not chunk:
+            return False
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerows([_copy_value(row.get(c)) for c in self.columns] for row in chunk)
+        del self._buffer[:self._pos]
+        self._pos = 0
+        self._buffer += out.getvalue().encode("utf-8")
+        self.count += len(chunk)
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while (size < 0 or len(self._buffer) - self._pos < size) and self._fill():
+            pass
+        end = len(self._buffer) if size < 0 else min(self._pos + size, len(self._buffer))
+        data = bytes(self._buffer[self._pos:end])
+        self._pos = end
+        return data
+
+
+def _merge_sql(table: Table, stage: str, columns: Sequence[str], upsert: bool) -> str:
+    """Statement moving the staged rows into ``table``.
+
+    Postgres rejects an upsert that touches the same key twice, so only the
+    last staged row per key is kept; COPY appends in order, so that is the
+    row with the highest ``ctid``.
+    """
+    key = [c.name for c in table.primary_key.columns]
+    cols = ", ".join(f'"{c}"' for c in columns)
+    if not upsert or not set(key) <= set(columns):
+        return f'INSERT INTO "{table.name}" ({cols}) SELECT {cols} FROM "{stage}"'
+    keys = ", ".join(f'"{c}"' for c in key)
+    updates = ", ".join(f'"{c}" = EXCLUDED."{c}"' for c in columns if c not in key)
+    return (
+        f'INSERT INTO "{table.name}" ({cols}) '
+        f'SELECT DISTINCT ON ({keys}) {cols} FROM "{stage}" ORDER BY {keys}, ctid DESC '
+        f"ON CONFLICT ({keys}) " + (f"DO UPDATE SET {updates}" if updates else "DO NOTHING")
+    )
+
+
+def copy_insert(model: Type[SQLModel], rows: Rows, upsert: bool = True,
+                engine: Optional[Engine] = None) -> int:
+    """Load ``rows`` into ``model``'s table through Postgres ``COPY`` and return the row count.
+
+    Rows are taken as in :func:`bulk_insert`, streamed as CSV through
+    ``copy_expert`` into a staging table and merged into the target with
+    one ``INSERT ... SELECT`` (an upsert on the primary key unless
+    ``upsert`` is false), all in one transaction. The staging table is
+    temporary and dropped at commit or rollback, so it is private to the
+    connection and concurrent loads of one table do not collide. Engines
+    that are not Postgres over psycopg2 fall back to :func:`bulk_insert`.
+    """
+    engine = engine or get_engine()
+    if engine.dialect.name != "postgresql" or engine.dialect.driver != "psycopg2":
+        return bulk_insert(model, rows, upsert=upsert, engine=engine)
+    table: Table = model.__table__
+    values = _row_dicts(model, table, rows)
+    first = next(values, None)
+    if first is None:
+        return 0
+    columns = list(first)
+    stage = f"_stage_{table.name}"
+    stream = _CopyStream(chain([first], values), columns)
+    cols = ", ".join(f'"{c}"' for c in columns)
+
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cur:
+            cur.execute(
+                f'CREATE TEMP TABLE "{stage}" ON COMMIT DROP AS SELECT {cols} FROM "{table.name}" WITH NO DATA'
+            )
+            cur.copy_expert(f"COPY \"{stage}\" ({cols}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')", stream)
+            cur.execute(_merge_sql(table, stage, columns, upsert))
+        raw.commit()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+    return stream.count
+
+
+def load_objects(objs: Iterable[SQLModel], upsert: bool = True) -> int:
+    """Persist SQLModel objects to the database and return how many were written.
 
+    Consecutive objects of the same model are written together, through
+    :func:`copy_insert` on Postgres and :func:`bulk_insert` elsewhere;
+    ``objs`` may be a generator.
+    """
+    count = 0
+    for model, group in groupby(objs, key=type):
+        count += copy_insert(model, group, upsert=upsert)
+    return count
@@ -3,39 +3,45 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import yaml
+from pipeline.legislators import load_legislators
 
 from .config import get_settings
-from .utils import get_json
+from .pagination import fetch_offset_pages
+from .utils import RAW_DIR, get_json
 
 API_URL = "https://api.congress.gov/v3"
+# Parsed legislator YAML, reused while the file is unchanged.
+SNAPSHOT_DIR = RAW_DIR / "snapshots"
+
+
+def _chamber(term_type: Optional[str]) -> str:
+    term_type = term_type or ""
+    return "Senate" if term_type == "sen" else "House" if term_type == "rep" else term_type
 
 
 def _load_from_repo(path: Path) -> List[Dict]:
-    """Load member data from a local clone of unitedstates/congress."""
-    data = yaml.safe_load(path.read_text())
-    items: List[Dict] = []
-    for entry in data:
-        ids = entry.get("id", {})
-        name = entry.get("name", {})
-        terms = entry.get("terms", [])
-        term = terms[-1] if terms else {}
-        chamber = term.get("type", "")
-        chamber = "Senate" if chamber == "sen" else "House" if chamber == "rep" else chamber
-        items.append(
-            {
-                "bioguideId": ids.get("bioguide"),
-                "firstName": name.get("first"),
-                "lastName": name.get("last"),
-                "chamber": chamber,
-                "party": term.get("party"),
-                "state": term.get("state"),
-            }
-        )
-    return items
-
-
-def fetch_members(from_date: Optional[str] = None, limit: int = 250) -> List[Dict]:
+    """Load member data from a local clone of unitedstates/congress.
+
+    The YAML is parsed by the data pipeline's
+    :func:`pipeline.legislators.load_legislators`, so repeated loads of an
+    unchanged file come from its snapshot in :data:`SNAPSHOT_DIR`.
+    """
+    return [
+        {
+            "bioguideId": p.bioguide_id,
+            "firstName": p.first_name,
+            "lastName": p.last_name,
+            "chamber": _chamber(p.term_type),
+            "party": p.party,
+            "state": p.state,
+        }
+        for p in load_legislators(path, SNAPSHOT_DIR)
+    ]
+
+
+def fetch_members(
+    from_date: Optional[str] = None, limit: int = 250, concurrency: Optional[int] = None
+) -> List[Dict]:
     """Fetch member metadata from a local repo or Congress.gov."""
     settings = get_settings()
     if settings.congress_data_dir:
@@ -48,14 +54,14 @@ def fetch_members(from_date: Optional[str] = None, limit: int = 250) -> List[Dic
             return _load_from_repo(local)
 
     headers = {"X-Api-Key": settings.congress_api_key}
-    params: Dict[str, Optional[str | int]] = {"format": "json", "limit": limit}
+    params: Dict[str, str | int] = {"format": "json", "limit": limit}
     if from_date:
         params["fromDateTime"] = from_date
     url = f"{API_URL}/member"
-    items: List[Dict] = []
-    while url:
-        data = get_json(url, params=params, headers=headers)
-        items.extend(data.get("members", {}).get("member", []))
-        url = data.get("pagination", {}).get("next")
-        params = None
-    return items
+    return fetch_offset_pages(
+        lambda u, p: get_json(u, params=p, headers=headers),
+        url,
+        params,
+        lambda data: data.get("members", {}).get("member", []),
+        concurrency=concurrency,
+    )
@@ -4,6 +4,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import List, Optional
 
+from sqlalchemy import Index
 from sqlmodel import JSON, Column, Field, SQLModel
 
 
@@ -28,6 +29,8 @@ class Committee(SQLModel, table=True):
 
 
 class Contribution(SQLModel, table=True):
+    __table_args__ = (Index("idx_contributions_recipient_date", "recipient_fec_id", "date"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     committee_id: Optional[str] = Field(default=None, foreign_key="committee.committee_id")
     recipient_fec_id: Optional[str] = None
@@ -42,6 +45,8 @@ class Contribution(SQLModel, table=True):
 
 
 class IndependentExpenditure(SQLModel, table=True):
+    __table_args__ = (Index("idx_independent_expenditures_candidate_cycle", "candidate_id", "cycle"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     committee_id: Optional[str] = Field(
         default=None, foreign_key="committee.committee_id"
@@ -77,6 +82,9 @@ class RollCall(SQLModel, table=True):
 
 
 class MemberVote(SQLModel, table=True):
+    # The primary key leads with vote_id; per-member lookups need their own index.
+    __table_args__ = (Index("idx_member_votes_member_vote", "member_id", "vote_id"),)
+
     vote_id: str = Field(foreign_key="rollcall.vote_id", primary_key=True)
     member_id: str = Field(foreign_key="member.member_id", primary_key=True)
     position: str
@@ -100,6 +108,8 @@ class MemberFinance(SQLModel, table=True):
 
 
 class AlignmentEvent(SQLModel, table=True):
+    __table_args__ = (Index("idx_alignment_events_member_vote", "member_id", "vote_id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     member_id: str = Field(foreign_key="member.member_id")
     vote_id: str = Field(foreign_key="rollcall.vote_id")
@@ -1,55 +1,122 @@
-"""Normalization helpers for raw API data."""
+"""Normalization helpers for raw API data.
+
+The ``*_frame`` normalizers work a batch at a time: they take a DataFrame,
+a mapping of columns, an Arrow record batch or table, or an iterable of raw
+dicts, and return a typed DataFrame with the model's columns. Dates are
+parsed for the whole column at once and repetitive string columns are
+categorical (dictionary-encoded), so nothing is done per row.
+:func:`to_models` turns such a frame into SQLModel objects for callers that
+need them; :func:`src.load.copy_insert` loads the frame directly.
+"""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Mapping, Type, TypeVar, Union
+
+import pandas as pd
+from sqlmodel import SQLModel
 
 from .models import Contribution, IndependentExpenditure
 
+ModelT = TypeVar("ModelT", bound=SQLModel)
+Records = Union[pd.DataFrame, Mapping[str, Any], Iterable[Dict[str, Any]]]
+
+# Raw key -> model column.
+CONTRIBUTION_COLUMNS = {
+    "committee_id": "committee_id",
+    "recipient_id": "recipient_fec_id",
+    "name": "contributor_name",
+    "employer": "contributor_employer",
+    "occupation": "contributor_occupation",
+    "type": "contributor_type",
+    "industry": "industry",
+    "amount": "amount",
+    "date": "date",
+    "cycle": "cycle",
+}
+INDEPENDENT_EXPENDITURE_COLUMNS = {
+    "committee_id": "committee_id",
+    "candidate_id": "candidate_id",
+    "payee": "payee",
+    "purpose": "purpose",
+    "amount": "amount",
+    "date": "date",
+    "support_oppose": "support_oppose",
+    "cycle": "cycle",
+}
+# Columns with few distinct values relative to their length.
+CATEGORICAL_COLUMNS = {
+    "committee_id", "recipient_fec_id", "contributor_employer", "contributor_occupation",
+    "contributor_type", "industry", "candidate_id", "payee", "purpose", "support_oppose",
+}
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def _frame(records: Records) -> pd.DataFrame:
+    if isinstance(records, pd.DataFrame):
+        return records
+    if hasattr(records, "to_pandas"):  # pyarrow RecordBatch or Table
+        return records.to_pandas()
+    if isinstance(records, Mapping):
+        return pd.DataFrame(records)
+    return pd.DataFrame.from_records(list(records))
+
+
+def _numeric(values: pd.Series, column: str) -> pd.Series:
+    """Parse ``values`` as numbers, using 0 only where a value is missing.
+
+    Raises ``ValueError`` for values that are present but not numeric.
+    """
+    parsed = pd.to_numeric(values, errors="coerce")
+    bad = parsed.isna() & values.notna()
+    if bad.any():
+        raise ValueError(f"invalid {column} values: {values[bad].unique()[:5].tolist()}")
+    return parsed.fillna(0)
+
+
+def _normalize_frame(records: Records, columns: Dict[str, str]) -> pd.DataFrame:
+    raw = _frame(records)
+    out = {}
+    for key, column in columns.items():
+        values = raw[key] if key in raw else pd.Series(None, index=raw.index, dtype=object)
+        if column == "amount":
+            values = _numeric(values, column).astype("float64")
+        elif column == "cycle":
+            values = _numeric(values, column).astype("int64")
+        elif column == "date":
+            values = pd.to_datetime(values, format=DATE_FORMAT)
+        elif column in CATEGORICAL_COLUMNS:
+            values = values.astype("category")
+        out[column] = values
+    return pd.DataFrame(out).reset_index(drop=True)
+
+
+def normalize_contributions_frame(records: Records) -> pd.DataFrame:
+    """Normalize a batch of raw contributions into :class:`Contribution` columns."""
+    return _normalize_frame(records, CONTRIBUTION_COLUMNS)
+
+
+def normalize_independent_expenditures_frame(records: Records) -> pd.DataFrame:
+    """Normalize a batch of raw schedule E rows into :class:`IndependentExpenditure` columns."""
+    return _normalize_frame(records, INDEPENDENT_EXPENDITURE_COLUMNS)
+
+
+def to_models(frame: pd.DataFrame, model: Type[ModelT]) -> List[ModelT]:
+    """Build ``model`` objects from a normalized frame; missing values become ``None``."""
+    frame = frame.copy()
+    for column in frame.columns:
+        if pd.api.types.is_datetime64_any_dtype(frame[column]):
+            frame[column] = frame[column].dt.date
+    frame = frame.astype(object).where(frame.notna(), None)
+    return [model(**row) for row in frame.to_dict("records")]
+
 
 def normalize_contributions(records: Iterable[Dict]) -> List[Contribution]:
     """Convert raw contribution dicts to :class:`Contribution` objects."""
-    normalized: List[Contribution] = []
-    for r in records:
-        date_val = r.get("date")
-        if isinstance(date_val, str):
-            date_val = datetime.strptime(date_val, "%Y-%m-%d").date()
-        normalized.append(
-            Contribution(
-                committee_id=r.get("committee_id"),
-                recipient_fec_id=r.get("recipient_id"),
-                contributor_name=r.get("name"),
-                contributor_employer=r.get("employer"),
-                contributor_occupation=r.get("occupation"),
-                contributor_type=r.get("type"),
-                industry=r.get("industry"),
-                amount=float(r.get("amount", 0)),
-                date=date_val,
-                cycle=int(r.get("cycle", 0)),
-            )
-        )
-    return normalized
+    return to_models(normalize_contributions_frame(records), Contribution)
 
 
 def normalize_independent_expenditures(
     records: Iterable[Dict],
 ) -> List[IndependentExpenditure]:
     """Convert raw schedule E dicts to :class:`IndependentExpenditure` objects."""
-    normalized: List[IndependentExpenditure] = []
-    for r in records:
-        date_val = r.get("date")
-        if isinstance(date_val, str):
-            date_val = datetime.strptime(date_val, "%Y-%m-%d").date()
-        normalized.append(
-            IndependentExpenditure(
-                committee_id=r.get("committee_id"),
-                candidate_id=r.get("candidate_id"),
-                payee=r.get("payee"),
-                purpose=r.get("purpose"),
-                amount=float(r.get("amount", 0)),
-                date=date_val,
-                support_oppose=r.get("support_oppose"),
-                cycle=int(r.get("cycle", 0)),
-            )
-        )
-    return normalized
+    return to_models(normalize_independent_expenditures_frame(records), IndependentExpenditure)
@@ -0,0 +1,98 @@
+"""Concurrent page fetching for paginated API list endpoints."""
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import requests
+
+from .config import get_settings
+
+Fetch = Callable[[str, Optional[Dict[str, Any]]], Any]
+
+
+def _with_retry(fetch: Callable[[Dict[str, Any]], Any], retries: int) -> Callable[[Dict[str, Any]], Any]:
+    """Wrap ``fetch`` so a failing page is retried ``retries`` more times."""
+    if retries <= 0:
+        return fetch
+
+    def wrapped(params: Dict[str, Any]) -> Any:
+        for attempt in range(retries + 1):
+            try:
+                return fetch(params)
+            except (RuntimeError, requests.RequestException):
+                if attempt == retries:
+                    raise
+                time.sleep(2 ** attempt)
+
+    return wrapped
+
+
+def fetch_pages(fetch: Callable[[Dict[str, Any]], Any], param_sets: Sequence[Dict[str, Any]],
+                concurrency: int, retries: int = 0) -> List[Any]:
+    """Call ``fetch`` once per parameter set, at most ``concurrency`` at a time.
+
+    Responses are returned in the same order as ``param_sets``. Each page is
+    retried independently up to ``retries`` times before the error is raised.
+    """
+    fetch = _with_retry(fetch, retries)
+    if concurrency <= 1 or len(param_sets) <= 1:
+        return [fetch(p) for p in param_sets]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(param_sets))) as pool:
+        return list(pool.map(fetch, param_sets))
+
+
+def fetch_offset_pages(
+    fetch: Fetch,
+    url: str,
+    params: Dict[str, Any],
+    extract: Callable[[Dict], List[Dict]],
+    concurrency: Optional[int] = None,
+    retries: int = 2,
+) -> List[Dict]:
+    """Fetch every page of a Congress.gov list endpoint.
+
+    The first page is requested with ``params``. When it reports
+    ``pagination.count`` the remaining ``offset`` values are known up front
+    and those pages are fetched concurrently; otherwise ``pagination.next``
+    is followed one page at a time.
+
+    Parameters
+    ----------
+    fetch:
+        Callable taking ``(url, params)`` and returning decoded JSON.
+    url:
+        List endpoint URL.
+    params:
+        Query parameters for the first page, including ``limit``.
+    extract:
+        Callable returning the records contained in one response.
+    concurrency:
+        Maximum number of pages in flight. Defaults to
+        ``Settings.api_concurrency``.
+    retries:
+        Extra attempts for each concurrently fetched page.
+    """
+    if concurrency is None:
+        concurrency = get_settings().api_concurrency
+    first = fetch(url, params)
+    items = list(extract(first))
+    pagination = first.get("pagination", {})
+    count = pagination.get("count")
+    limit = int(params.get("limit") or len(items) or 0)
+
+    if count is not None and limit:
+        start = int(params.get("offset") or 0)
+        offsets = range(start + limit, int(count), limit)
+        param_sets = [{**params, "offset": offset} for offset in offsets]
+        for data in fetch_pages(lambda p: fetch(url, p), param_sets, concurrency, retries):
+            items.extend(extract(data))
+        return items
+
+    next_url = pagination.get("next")
+    while next_url:
+        data = fetch(next_url, None)  # next URLs already contain query parameters
+        items.extend(extract(data))
+        next_url = data.get("pagination", {}).get("next")
+    return items
@@ -0,0 +1,135 @@
+"""Per-API-key token buckets shared by all API callers."""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+from .config import get_settings
+
+_limiters: Dict[str, "TokenBucket"] = {}
+_limiters_lock = threading.Lock()
+_stats: Counter = Counter()
+_stats_lock = threading.Lock()
+
+
+def record(event: str, amount: float = 1) -> None:
+    """Increment a throttle counter."""
+    with _stats_lock:
+        _stats[event] += amount
+
+
+def stats() -> Dict[str, float]:
+    """Return a snapshot of the throttle counters."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second.
+
+    ``capacity`` bounds the burst size. The bucket can additionally be
+    paused (after a ``Retry-After``) or drained to match the remaining quota
+    reported by the server.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Block until ``tokens`` are available and return the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now >= self._paused_until and self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                delay = max(self._paused_until - now, (tokens - self.tokens) / self.rate)
+            self._sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all callers for ``seconds``."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def observe(self, remaining: int) -> None:
+        """Lower the available tokens to the quota the server says is left."""
+        with self._lock:
+            self._refill(self._clock())
+            self.tokens = min(self.tokens, float(remaining))
+
+
+def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Return the delay requested by a ``Retry-After`` header, in seconds."""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _hourly_quota(host: str) -> Optional[int]:
+    settings = get_settings()
+    quotas = {
+        "api.open.fec.gov": settings.fec_hourly_quota,
+        "api.congress.gov": settings.congress_hourly_quota,
+    }
+    return quotas.get(host)
+
+
+def limiter_for(url: str, params: Optional[Mapping[str, Any]] = None,
+                headers: Optional[Mapping[str, str]] = None) -> Optional[TokenBucket]:
+    """Return the shared bucket for the API key used by a request.
+
+    Buckets are keyed by host and API key, so every caller using the same key
+    draws from the same hourly quota. Hosts without a configured quota are
+    not limited.
+    """
+    host = urlparse(url).hostname or ""
+    quota = _hourly_quota(host)
+    if not quota:
+        return None
+    api_key = (params or {}).get("api_key") or (headers or {}).get("X-Api-Key") or ""
+    key = f"{host}:{hashlib.sha256(str(api_key).encode()).hexdigest()[:16]}"
+    with _limiters_lock:
+        bucket = _limiters.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate=quota / 3600.0, capacity=quota)
+            _limiters[key] = bucket
+    return bucket
+
+
+def reset_limiters() -> None:
+    with _limiters_lock:
+        _limiters.clear()
@@ -7,34 +7,108 @@ import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import requests
+from . import ratelimit
+from .cache import CachedResponse, get_cache
+from .client import get_session
+from .config import get_settings
 
 RAW_DIR = Path("data/raw")
 RAW_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> Path:
-    """Return path for cached response."""
+def request_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Return the cache key identifying a request."""
     params = params or {}
-    key = hashlib.sha256((url + json.dumps(params, sort_keys=True)).encode()).hexdigest()
-    return RAW_DIR / f"{key}.json"
+    return hashlib.sha256((url + json.dumps(params, sort_keys=True)).encode()).hexdigest()
+
+
+def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> Path:
+    """Return path of the legacy flat-file cache entry for a request."""
+    return RAW_DIR / f"{request_key(url, params)}.json"
+
+
+def _cached(url: str, params: Dict[str, Any]) -> Optional[CachedResponse]:
+    """Look a request up in the response cache.
+
+    Entries still sitting in the old flat ``data/raw/*.json`` layout are moved
+    into the cache the first time they are read.
+    """
+    cache = get_cache()
+    key = request_key(url, params)
+    entry = cache.lookup(key)
+    if entry is not None:
+        return entry
+    legacy = cache_key(url, params)
+    if legacy.exists():
+        with legacy.open() as fh:
+            data = json.load(fh)
+        cache.put(key, url, data)
+        legacy.unlink()
+        return CachedResponse(data, fresh=True)
+    return None
+
+
+def _conditional_headers(headers: Optional[Dict[str, str]], entry: Optional[CachedResponse]) -> Optional[Dict[str, str]]:
+    """Add revalidation headers for a stale cache entry."""
+    if entry is None or not (entry.etag or entry.last_modified):
+        return headers
+    headers = dict(headers or {})
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
 
 
 def get_json(url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Any:
-    """GET a URL with basic retry and caching."""
+    """GET a URL with retry, rate limiting and caching.
+
+    Responses are stored in the shared :mod:`src.cache` store and reused
+    while fresh; stale entries are revalidated with ``If-None-Match`` /
+    ``If-Modified-Since`` and served from the cache on 304. Requests go through the shared pooled session from
+    :mod:`src.client` so paginated backfills reuse open connections. Calls
+    to the FEC and Congress.gov APIs draw from a token bucket shared per API
+    key; 429/503 responses honour ``Retry-After`` and pause every caller
+    using that key. Only 429 and 5xx responses are retried; other errors
+    fail at once, and there is no wait after the last attempt.
+    """
     params = params or {}
-    path = cache_key(url, params)
-    if path.exists():
-        with path.open() as fh:
-            return json.load(fh)
+    key = request_key(url, params)
+    entry = _cached(url, params)
+    if entry is not None and entry.fresh:
+        return entry.data
+    headers = _conditional_headers(headers, entry)
 
-    for attempt in range(3):
-        resp = requests.get(url, params=params, headers=headers, timeout=30)
+    session = get_session()
+    settings = get_settings()
+    limiter = ratelimit.limiter_for(url, params, headers)
+    for attempt in range(settings.http_max_attempts):
+        if limiter:
+            waited = limiter.acquire()
+            if waited:
+                ratelimit.record("wait_seconds", waited)
+        resp = session.get(url, params=params, headers=headers, timeout=settings.http_timeout)
+        ratelimit.record("requests")
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        if limiter and remaining is not None and remaining.isdigit():
+            limiter.observe(int(remaining))
+        if resp.status_code == 304 and entry is not None:
+            get_cache().refresh(key)
+            return entry.data
         if resp.status_code == 200:
             data = resp.json()
-            with path.open("w") as fh:
-                json.dump(data, fh)
+            get_cache().put(
+                key, url, data, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+            )
             return data
-        time.sleep(2 ** attempt)
+        if resp.status_code != 429 and resp.status_code < 500:
+            break
+        delay = ratelimit.retry_after(resp.headers)
+        if delay is None:
+            delay = 2 ** attempt
+        if resp.status_code in (429, 503) and limiter:
+            ratelimit.record("throttled")
+            limiter.pause(delay)
+        elif attempt + 1 < settings.http_max_attempts:
+            time.sleep(delay)
     raise RuntimeError(f"Request failed: {url}")
-
@@ -6,9 +6,28 @@ import sys
 
 import pytest
 
-# Ensure src package is importable
+# Ensure src package, and the pipeline package it shares code with, are importable
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "us_congress_pipeline" / "src"))
+
+
+@pytest.fixture(autouse=True)
+def bulk_dir(tmp_path, monkeypatch):
+    """Keep bulk downloads and their indexes out of the working tree."""
+    from src import bulk
+
+    monkeypatch.setattr(bulk, "BULK_DIR", tmp_path / "bulk")
+    return tmp_path / "bulk"
+
+
+@pytest.fixture(autouse=True)
+def snapshot_dir(tmp_path, monkeypatch):
+    """Keep parsed legislator snapshots out of the working tree."""
+    from src import members
+
+    monkeypatch.setattr(members, "SNAPSHOT_DIR", tmp_path / "snapshots")
+    return tmp_path / "snapshots"
 
 
 @pytest.fixture
@@ -23,3 +23,27 @@ def test_fetch_bills_pagination_and_headers(monkeypatch):
     assert calls[0]["params"]["fromDateTime"] == "2020-01-01"
     assert calls[0]["headers"]["X-Api-Key"] == "KEY"
     assert calls[1]["params"] is None
+
+
+def test_fetch_bills_concurrent_offsets(monkeypatch):
+    calls = []
+
+    def fake_get_json(url, params=None, headers=None):
+        calls.append(dict(params))
+        offset = params.get("offset", 0)
+        if offset == 0:
+            return {
+                "bills": {"bill": [{"billId": "b0"}, {"billId": "b1"}]},
+                "pagination": {"count": 5, "next": "next-url"},
+            }
+        return {"bills": {"bill": [{"billId": f"b{offset + i}"} for i in range(min(2, 5 - offset))]}}
+
+    class Dummy:
+        congress_api_key = "KEY"
+
+    monkeypatch.setattr(bills, "get_json", fake_get_json)
+    monkeypatch.setattr(bills, "get_settings", lambda: Dummy())
+    items = bills.fetch_bills(limit=2, concurrency=3)
+    assert [i["billId"] for i in items] == ["b0", "b1", "b2", "b3", "b4"]
+    assert sorted(c.get("offset", 0) for c in calls) == [0, 2, 4]
+    assert all(c["limit"] == 2 for c in calls)
@@ -0,0 +1,134 @@
+import shutil
+import urllib.error
+import urllib.request
+import zipfile
+
+from src import bulk, fec
+
+IE_CSV = (
+    "cand_id,spe_nam,exp_amo,sup_opp,pur\n"
+    "H0XX00001,PAC A,100.50,Support,TV\n"
+    "S0XX00002,PAC B,25,Oppose,\"Mail\nand digital\"\n"
+    "H0XX00001,PAC C,40,Oppose,Radio\n"
+    "H0XX00001,PAC D,9.5,S,Web\n"
+)
+
+
+def _stub_download(monkeypatch, tmp_path, name, data):
+    source = tmp_path / "source.zip"
+    with zipfile.ZipFile(source, "w") as z:
+        z.writestr(name, data)
+    calls = []
+
+    def fake_urlretrieve(url, dest):
+        calls.append(url)
+        shutil.copy(source, dest)
+        return str(dest), None
+
+    monkeypatch.setattr(urllib.request, "urlretrieve", fake_urlretrieve)
+    return calls
+
+
+def test_schedule_e_single_download_and_pass(monkeypatch, tmp_path):
+    calls = _stub_download(monkeypatch, tmp_path, "independent_expenditure_2024.csv", IE_CSV)
+    many = fec.fetch_independent_expenditures_many(["H0XX00001", "S0XX00002", "H9NONE"], 2024, bulk=True)
+    single = fec.fetch_independent_expenditures("S0XX00002", 2024, bulk=True)
+    assert len(calls) == 1
+    assert [r["spe_nam"] for r in many["H0XX00001"]] == ["PAC A", "PAC C", "PAC D"]
+    assert many["H9NONE"] == []
+    assert single == [{"cand_id": "S0XX00002", "spe_nam": "PAC B", "exp_amo": "25",
+                       "sup_opp": "Oppose", "pur": "Mail\nand digital"}]
+    totals = bulk.schedule_e_totals(2024, ["H0XX00001", "S0XX00002", "H9NONE"])
+    assert totals["H0XX00001"] == {"support": 110.0, "oppose": 40.0}
+    assert totals["S0XX00002"] == {"support": 0.0, "oppose": 25.0}
+    assert totals["H9NONE"] == {"support": 0.0, "oppose": 0.0}
+
+
+def test_candidate_totals_bulk_index_is_reused(monkeypatch, tmp_path):
+    calls = _stub_download(monkeypatch, tmp_path, "ccl.csv", "CAND_ID,TTL_RECEIPTS\nH1,100\nS2,5\nH1,7\n")
+    many = fec.fetch_candidate_totals_many(["h1", "S2", "H3"], 2024, bulk=True)
+    assert [r["TTL_RECEIPTS"] for r in many["h1"]] == ["100", "7"]
+    assert many["H3"] == []
+
+    bulk._indexes.clear()
+    monkeypatch.setattr(bulk.csv, "DictReader", None)  # a rebuild would fail
+    assert fec.fetch_candidate_totals("S2", 2024, bulk=True) == [{"CAND_ID": "S2", "TTL_RECEIPTS": "5"}]
+    assert len(calls) == 1
+
+
+def test_candidate_totals_data_dir_index_rebuilds_on_change(monkeypatch, tmp_path):
+    class Settings:
+        fec_data_dir = str(tmp_path)
+        fec_api_key = ""
+
+    monkeypatch.setattr(fec, "get_settings", lambda: Settings())
+    path = tmp_path / "candidate_totals.csv"
+    path.write_text("candidate_id,cycle,receipts\nH1,2024,10\nH1,2022,3\n")
+    assert fec.fetch_candidate_totals("H1", 2024) == [{"candidate_id": "H1", "cycle": "2024", "receipts": "10"}]
+
+    path.write_text("candidate_id,cycle,receipts\nH1,2024,99\nS2,2024,1\n")
+    many = fec.fetch_candidate_totals_many(["H1", "S2"], 2024)
+    assert many == {
+        "H1": [{"candidate_id": "H1", "cycle": "2024", "receipts": "99"}],
+        "S2": [{"candidate_id": "S2", "cycle": "2024", "receipts": "1"}],
+    }
+
+
+def test_memoized_indexes_are_replaced_and_bounded(monkeypatch, tmp_path):
+    monkeypatch.setattr(bulk, "_indexes", bulk.OrderedDict())
+    monkeypatch.setattr(bulk, "MAX_INDEXES", 2)
+    path = tmp_path / "data.csv"
+    path.write_text("v1")
+    assert bulk.load_index(path, "raw", lambda p: p.read_text()) == "v1"
+    path.write_text("v2!")
+    assert bulk.load_index(path, "raw", lambda p: p.read_text()) == "v2!"
+    assert list(bulk._indexes.values())[0][1] == "v2!" and len(bulk._indexes) == 1
+
+    for kind in ("a", "b"):
+        bulk.load_index(path, kind, lambda p: kind)
+    assert [key[0] for key in bulk._indexes] == ["a", "b"]
+
+
+def test_bulk_file_is_fetched_again_when_the_server_copy_changes(monkeypatch, tmp_path):
+    server = {"etag": '"v1"', "data": IE_CSV}
+    downloads, heads = [], []
+
+    def fake_urlretrieve(url, dest):
+        downloads.append(url)
+        with zipfile.ZipFile(dest, "w") as z:
+            z.writestr("independent_expenditure_2024.csv", server["data"])
+        return str(dest), {"ETag": server["etag"]}
+
+    class Head:
+        headers = None
+
+        def __enter__(self):
+            self.headers = {"ETag": server["etag"]}
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    def fake_urlopen(request, timeout=None):
+        heads.append(request.get_method())
+        if server["etag"] is None:
+            raise urllib.error.URLError("offline")
+        return Head()
+
+    monkeypatch.setattr(urllib.request, "urlretrieve", fake_urlretrieve)
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    assert bulk.schedule_e_totals(2024, ["S0XX00002"])["S0XX00002"]["oppose"] == 25.0
+    assert bulk.schedule_e_totals(2024, ["S0XX00002"])["S0XX00002"]["oppose"] == 25.0
+    assert (len(downloads), heads) == (1, [])
+
+    monkeypatch.setattr(bulk, "BULK_MAX_AGE", 0)
+    bulk.schedule_e_totals(2024)
+    assert (len(downloads), heads) == (1, ["HEAD"])
+
+    server.update(etag='"v2"', data=IE_CSV.replace("PAC B,25", "PAC B,30"))
+    assert bulk.schedule_e_totals(2024, ["S0XX00002"])["S0XX00002"]["oppose"] == 30.0
+    assert len(downloads) == 2
+
+    server["etag"] = None
+    assert bulk.schedule_e_totals(2024, ["S0XX00002"])["S0XX00002"]["oppose"] == 30.0
+    assert len(downloads) == 2
@@ -0,0 +1,90 @@
+import json
+
+from src import cache as cache_mod
+from src import utils
+from src.cache import ResponseCache
+
+
+def test_round_trip_and_stats(tmp_path):
+    cache = ResponseCache(tmp_path / "c.sqlite", codec="gzip")
+    assert cache.get("k") is None
+    cache.put("k", "https://api.congress.gov/v3/bill", {"bills": [1, 2, 3]})
+    assert cache.get("k") == {"bills": [1, 2, 3]}
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+    assert stats["bytes_written"] == stats["total_bytes"] > 0
+
+
+def test_ttl_per_endpoint(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "c.sqlite", ttls={"/member": 60, "/member/": None})
+    assert cache.ttl("/v3/member") == 60
+    assert cache.ttl("/v3/member/B000575") is None
+    assert cache.ttl("/v1/candidate/") is None
+    cache.put("m", "https://api.congress.gov/v3/member", {"a": 1})
+    now = cache_mod.time.time()
+    monkeypatch.setattr(cache_mod.time, "time", lambda: now + 120)
+    assert cache.get("m") is None
+    assert cache.stats()["expired"] == 1
+
+
+def test_lru_eviction(tmp_path, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr(cache_mod.time, "time", lambda: next(clock))
+    blob = {"x": "".join(chr(65 + (i * 7919) % 26) for i in range(2000))}
+    probe = ResponseCache(tmp_path / "probe.sqlite", codec="gzip")
+    probe.put("p", "u", blob)
+    size = probe.stats()["total_bytes"]
+
+    cache = ResponseCache(tmp_path / "c.sqlite", max_bytes=int(size * 2.5), codec="gzip")
+    cache.put("a", "u", blob)
+    cache.put("b", "u", blob)
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put("c", "u", blob)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_legacy_files_are_migrated(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "c.sqlite")
+    monkeypatch.setattr(utils, "RAW_DIR", tmp_path)
+    monkeypatch.setattr(utils, "get_cache", lambda: cache)
+    legacy = utils.cache_key("https://api.congress.gov/v3/bill", {"a": 1})
+    legacy.write_text(json.dumps({"old": True}))
+    assert utils.get_json("https://api.congress.gov/v3/bill", {"a": 1}) == {"old": True}
+    assert not legacy.exists()
+    assert cache.get(utils.request_key("https://api.congress.gov/v3/bill", {"a": 1})) == {"old": True}
+
+
+def test_stale_entry_revalidated_with_304(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "c.sqlite", ttls={"/member": 60})
+    url = "https://api.congress.gov/v3/member"
+    key = utils.request_key(url, {"format": "json"})
+    cache.put(key, url, {"members": ["old"]}, etag='"abc"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+    now = cache_mod.time.time()
+    monkeypatch.setattr(cache_mod.time, "time", lambda: now + 120)
+    sent = []
+
+    class Response:
+        status_code = 304
+        headers: dict = {}
+
+    class Session:
+        def get(self, url, params=None, headers=None, timeout=None):
+            sent.append(headers)
+            return Response()
+
+    monkeypatch.setattr(utils, "get_cache", lambda: cache)
+    monkeypatch.setattr(utils, "get_session", lambda: Session())
+    monkeypatch.setattr(utils.ratelimit, "limiter_for", lambda *a: None)
+    assert utils.get_json(url, {"format": "json"}, headers={"X-Api-Key": "K"}) == {"members": ["old"]}
+    assert sent == [{
+        "X-Api-Key": "K",
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }]
+    assert cache.stats()["revalidated"] == 1
+    entry = cache.lookup(key)
+    assert entry.fresh and entry.etag == '"abc"'
@@ -0,0 +1,43 @@
+from src import client, utils
+from src.cache import ResponseCache
+
+
+def test_session_is_shared_and_pooled(monkeypatch):
+    class Dummy:
+        http_pool_connections = 4
+        http_pool_maxsize = 32
+
+    client.close_session()
+    monkeypatch.setattr(client, "get_settings", lambda: Dummy())
+    try:
+        session = client.get_session()
+        assert client.get_session() is session
+        adapter = session.get_adapter("https://api.open.fec.gov/v1/")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+    finally:
+        client.close_session()
+
+
+def test_get_json_uses_shared_session(monkeypatch, tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite")
+    calls = []
+
+    class Response:
+        status_code = 200
+        headers: dict = {}
+
+        def json(self):
+            return {"ok": True}
+
+    class Session:
+        def get(self, url, params=None, headers=None, timeout=None):
+            calls.append(url)
+            return Response()
+
+    monkeypatch.setattr(utils, "RAW_DIR", tmp_path)
+    monkeypatch.setattr(utils, "get_cache", lambda: cache)
+    monkeypatch.setattr(utils, "get_session", lambda: Session())
+    assert utils.get_json("https://example.test/a") == {"ok": True}
+    assert utils.get_json("https://example.test/a") == {"ok": True}
+    assert calls == ["https://example.test/a"]
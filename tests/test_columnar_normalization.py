@@ -0,0 +1,54 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+from sqlmodel import Session, create_engine, select
+
+from src import load
+from src.models import Contribution, IndependentExpenditure
+from src.normalize import (
+    normalize_contributions,
+    normalize_contributions_frame,
+    normalize_independent_expenditures_frame,
+    to_models,
+)
+
+
+def test_contribution_frame_is_typed_and_categorical(raw_contribs):
+    batch = pd.DataFrame(raw_contribs * 3).assign(date=["2024-01-01", "2024-01-02", None])
+    frame = normalize_contributions_frame(batch)
+    assert list(frame.columns) == [c for c in Contribution.__fields__ if c != "id"]
+    assert frame["date"].dtype == "datetime64[ns]"
+    assert frame["amount"].dtype == "float64" and frame["cycle"].dtype == "int64"
+    assert isinstance(frame["recipient_fec_id"].dtype, pd.CategoricalDtype)
+    assert list(frame["recipient_fec_id"].cat.categories) == ["H0XX00001"]
+
+    objs = to_models(frame, Contribution)
+    assert [c.date for c in objs] == [date(2024, 1, 1), date(2024, 1, 2), None]
+    assert objs[0].contributor_name == "John Doe"
+
+
+def test_frames_accept_column_batches_and_load_without_models(raw_independent_expenditures, tmp_path):
+    columns = {k: [r[k] for r in raw_independent_expenditures] for k in raw_independent_expenditures[0]}
+    columns.pop("payee")
+    frame = normalize_independent_expenditures_frame(columns)
+    assert frame["payee"].isna().all()
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'ie.db'}")
+    IndependentExpenditure.metadata.create_all(engine)
+    assert load.copy_insert(IndependentExpenditure, frame, engine=engine) == 1
+    with Session(engine) as session:
+        (ie,) = session.exec(select(IndependentExpenditure)).all()
+    assert (ie.candidate_id, ie.payee, ie.date, ie.amount) == ("H0XX00001", None, date(2024, 2, 1), 5000.0)
+
+
+def test_unparseable_numbers_raise_but_missing_ones_default(raw_contribs):
+    with pytest.raises(ValueError, match="invalid amount"):
+        normalize_contributions_frame([{**raw_contribs[0], "amount": "abc"}])
+    with pytest.raises(ValueError, match="invalid cycle"):
+        normalize_contributions([{**raw_contribs[0], "cycle": "x"}])
+
+    missing = {k: v for k, v in raw_contribs[0].items() if k not in ("amount", "cycle")}
+    frame = normalize_contributions_frame([missing, {**raw_contribs[0], "amount": None}])
+    assert frame["amount"].tolist() == [0.0, 0.0]
+    assert frame["cycle"].tolist() == [0, 2024]
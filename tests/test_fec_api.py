@@ -1,4 +1,4 @@
-from src import fec
+from src import fec, pagination
 import shutil
 import zipfile
 import urllib.request
@@ -58,3 +58,39 @@ def test_fetch_candidate_totals_bulk(monkeypatch, tmp_path):
     monkeypatch.setattr(urllib.request, "urlretrieve", fake_urlretrieve)
     rows = fec.fetch_candidate_totals("H0XX00001", 2024, bulk=True)
     assert rows == [{"CAND_ID": "H0XX00001", "TTL_RECEIPTS": "100"}]
+
+
+def test_fetch_all_pages_ordered_with_retry(monkeypatch):
+    failures = {3: 1}
+
+    def fake_get_json(url, params):
+        page = params["page"]
+        if failures.get(page):
+            failures[page] -= 1
+            raise RuntimeError("boom")
+        return {"results": [{"page": page}], "pagination": {"page": page, "pages": 5}}
+
+    monkeypatch.setattr(fec, "get_json", fake_get_json)
+    monkeypatch.setattr(pagination.time, "sleep", lambda s: None)
+    params = {"per_page": 100}
+    data = fec._fetch_all_pages("url", params, concurrency=4)
+    assert [d["page"] for d in data] == [1, 2, 3, 4, 5]
+    assert params == {"per_page": 100}
+
+
+def test_fetch_candidate_totals_many(monkeypatch):
+    calls = []
+
+    def fake_get_json(url, params):
+        calls.append(params["candidate_id"])
+        return {
+            "results": [{"candidate_id": cid, "receipts": 1} for cid in params["candidate_id"]],
+            "pagination": {"page": 1, "pages": 1},
+        }
+
+    monkeypatch.setattr(fec, "get_json", fake_get_json)
+    monkeypatch.setattr(fec, "BATCH_SIZE", 2)
+    totals = fec.fetch_candidate_totals_many(["H1", "H2", "H1", "S3"], 2024)
+    assert calls == [["H1", "H2"], ["S3"]]
+    assert list(totals) == ["H1", "H2", "S3"]
+    assert totals["S3"] == [{"candidate_id": "S3", "receipts": 1}]
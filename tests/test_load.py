@@ -0,0 +1,161 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from sqlmodel import Session, create_engine, select
+
+from src import load
+from src.models import Badge, Contribution, Member, MemberVote
+
+
+class _FakeCursor:
+    """psycopg2 cursor stand-in that records statements and reads the COPY stream."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        self.conn.statements.append(sql)
+        if self.conn.fail_on and self.conn.fail_on in sql:
+            raise RuntimeError("merge failed")
+
+    def copy_expert(self, sql, stream):
+        self.conn.statements.append(sql)
+        self.conn.copied = stream.read()
+
+
+class _FakeConnection:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.statements = []
+        self.copied = b""
+        self.events = []
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def commit(self):
+        self.events.append("commit")
+
+    def rollback(self):
+        self.events.append("rollback")
+
+    def close(self):
+        self.events.append("close")
+
+
+def _postgres(conn):
+    return SimpleNamespace(dialect=SimpleNamespace(name="postgresql", driver="psycopg2"),
+                           raw_connection=lambda: conn)
+
+
+def _engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'load.db'}")
+    Member.metadata.create_all(engine)
+    return engine
+
+
+def test_bulk_insert_upserts_on_primary_key(tmp_path):
+    engine = _engine(tmp_path)
+    rows = [{"member_id": "A1", "first": "Ann", "last": "Able", "chamber": "House", "party": "D", "state": "XX"}]
+    assert load.bulk_insert(Member, rows, engine=engine) == 1
+    load.bulk_insert(Member, [{**rows[0], "party": "I"}], engine=engine)
+    load.bulk_insert(MemberVote, {"vote_id": ["v1", "v1"], "member_id": ["A1", "A1"], "position": ["Yea", "Nay"]},
+                     engine=engine)
+
+    with Session(engine) as session:
+        members = session.exec(select(Member)).all()
+        assert [(m.member_id, m.party, m.fec_candidate_ids) for m in members] == [("A1", "I", [])]
+        assert [v.position for v in session.exec(select(MemberVote)).all()] == ["Nay"]
+
+
+def test_bulk_insert_streams_generators_in_chunks(tmp_path):
+    engine = _engine(tmp_path)
+    rows = (
+        {"recipient_fec_id": "H1", "amount": float(i), "date": date(2024, 1, 1), "cycle": 2024}
+        for i in range(10)
+    )
+    assert load.bulk_insert(Contribution, rows, chunk_size=3, engine=engine) == 10
+    frame = pd.DataFrame({"recipient_fec_id": ["H2"] * 4, "amount": [1.0] * 4,
+                          "date": [date(2024, 2, 1)] * 4, "cycle": [2024] * 4})
+    assert load.bulk_insert(Contribution, frame, engine=engine) == 4
+
+    with Session(engine) as session:
+        contribs = session.exec(select(Contribution)).all()
+    assert [c.id for c in contribs] == list(range(1, 15))
+    assert sum(c.amount for c in contribs) == 49.0
+
+
+def test_load_objects_groups_models_and_fills_defaults(tmp_path, monkeypatch):
+    engine = _engine(tmp_path)
+    monkeypatch.setattr(load, "get_engine", lambda: engine)
+    objs = [
+        Member(member_id="A1", first="Ann", last="Able", chamber="House", party="D", state="XX"),
+        Badge(member_id="A1", badge_code="b1", label="One"),
+        Badge(member_id="A1", badge_code="b1", label="Uno"),
+    ]
+    assert load.load_objects(iter(objs)) == 3
+    load.bulk_insert(Badge, [{"member_id": "A1", "badge_code": "b2", "label": "Two"}], engine=engine)
+
+    with Session(engine) as session:
+        badges = session.exec(select(Badge)).all()
+    assert [(b.badge_code, b.label) for b in badges] == [("b1", "Uno"), ("b2", "Two")]
+    assert all(b.computed_at is not None for b in badges)
+
+
+def test_get_engine_is_cached():
+    assert load.get_engine() is load.get_engine()
+
+
+def test_copy_stream_encodes_rows_as_csv():
+    rows = iter([
+        {"member_id": "A1", "first": "Ann, Jr.", "district": None, "fec_candidate_ids": ["H1"]},
+        {"member_id": "B2", "first": "", "district": "3", "fec_candidate_ids": []},
+    ])
+    stream = load._CopyStream(rows, ["member_id", "first", "district", "fec_candidate_ids"], chunk_size=1)
+    data = b"".join(iter(lambda: stream.read(7), b""))
+    assert data.decode() == 'A1,"Ann, Jr.",\\N,"[""H1""]"\nB2,,3,[]\n'
+    assert stream.count == 2
+
+
+def test_copy_merge_keeps_last_staged_row_per_key():
+    sql = load._merge_sql(MemberVote.__table__, "_stage", ["vote_id", "member_id", "position"], upsert=True)
+    assert 'SELECT DISTINCT ON ("vote_id", "member_id")' in sql
+    assert 'ON CONFLICT ("vote_id", "member_id") DO UPDATE SET "position" = EXCLUDED."position"' in sql
+    plain = load._merge_sql(Contribution.__table__, "_stage", ["amount", "date", "cycle"], upsert=True)
+    assert "ON CONFLICT" not in plain
+
+
+def test_copy_insert_falls_back_to_executemany_off_postgres(tmp_path):
+    engine = _engine(tmp_path)
+    rows = [{"vote_id": "v1", "member_id": "A1", "position": "Yea"}]
+    assert load.copy_insert(MemberVote, rows, engine=engine) == 1
+
+
+def test_copy_insert_streams_through_a_temporary_stage():
+    conn = _FakeConnection()
+    rows = [{"vote_id": "v1", "member_id": "A1", "position": "Yea"},
+            {"vote_id": "v1", "member_id": "B2", "position": None}]
+    assert load.copy_insert(MemberVote, rows, engine=_postgres(conn)) == 2
+    create, copy, merge = conn.statements
+    assert create.startswith('CREATE TEMP TABLE "_stage_membervote" ON COMMIT DROP AS SELECT')
+    assert copy.startswith('COPY "_stage_membervote" ("vote_id", "member_id", "position") FROM STDIN')
+    assert merge.startswith('INSERT INTO "membervote"') and 'FROM "_stage_membervote"' in merge
+    assert not any("DROP TABLE" in sql for sql in conn.statements)
+    assert conn.copied == b"v1,A1,Yea\nv1,B2,\\N\n"
+    assert conn.events == ["commit", "close"]
+
+
+def test_copy_insert_rolls_back_when_the_merge_fails():
+    conn = _FakeConnection(fail_on="INSERT INTO")
+    with pytest.raises(RuntimeError, match="merge failed"):
+        load.copy_insert(MemberVote, [{"vote_id": "v1", "member_id": "A1", "position": "Yea"}],
+                         engine=_postgres(conn))
+    assert conn.events == ["rollback", "close"]
@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+
+from pipeline import legislators
+
+from src import members
+
+YAML = """
+- id: {bioguide: A000001, fec: [H0XX01001, S2XX00001]}
+  name: {first: Ann, last: Able}
+  terms:
+  - {type: rep, start: '2019-01-03', end: '2021-01-03', state: XX, district: 1, party: Democrat}
+  - {type: sen, start: '2021-01-03', end: '2027-01-03', state: XX, party: Democrat}
+- id: {bioguide: B000002, fec: H0YY02002}
+  name: {first: Bob, last: Baker}
+  terms: []
+"""
+
+
+def test_members_from_repo_use_the_snapshot(tmp_path, monkeypatch, snapshot_dir):
+    repo = tmp_path / "congress-legislators"
+    (repo / "data").mkdir(parents=True)
+    src = repo / "data" / "legislators-current.yaml"
+    src.write_text(YAML)
+    monkeypatch.setattr(members, "get_settings", lambda: SimpleNamespace(congress_data_dir=str(repo)))
+
+    first = members.fetch_members()
+    assert first == [
+        {"bioguideId": "A000001", "firstName": "Ann", "lastName": "Able", "chamber": "Senate",
+         "party": "Democrat", "state": "XX"},
+        {"bioguideId": "B000002", "firstName": "Bob", "lastName": "Baker", "chamber": "",
+         "party": None, "state": None},
+    ]
+    assert len(list(snapshot_dir.glob("*.pickle"))) == 1
+
+    calls = []
+    real_parse = legislators.parse
+    monkeypatch.setattr(legislators, "parse", lambda data: calls.append(data) or real_parse(data))
+    assert members.fetch_members() == first
+    assert calls == []
+
+    src.write_text(YAML.replace("Bob", "Robert"))
+    assert members.fetch_members()[1]["firstName"] == "Robert"
+    assert len(calls) == 1
+    assert len(list(snapshot_dir.glob("*.pickle"))) == 1
+
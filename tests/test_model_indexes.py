@@ -0,0 +1,35 @@
+from sqlalchemy import inspect, text
+from sqlmodel import SQLModel, create_engine
+
+from src import load
+
+QUERIES = {
+    "idx_contributions_recipient_date":
+        "SELECT amount FROM contribution WHERE recipient_fec_id = 'H1' AND date >= '2024-01-01' ORDER BY date",
+    "idx_member_votes_member_vote": "SELECT vote_id, position FROM membervote WHERE member_id = 'A1'",
+    "idx_independent_expenditures_candidate_cycle":
+        "SELECT SUM(amount) FROM independentexpenditure WHERE candidate_id = 'H1' AND cycle = 2024",
+    "idx_alignment_events_member_vote": "SELECT alignment_score FROM alignmentevent WHERE member_id = 'A1'",
+}
+
+
+def test_member_report_queries_use_model_indexes(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'idx.db'}")
+    SQLModel.metadata.create_all(engine)
+    with engine.connect() as conn:
+        for index, sql in QUERIES.items():
+            plan = " | ".join(row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+            assert f"USING INDEX {index}" in plan or f"USING COVERING INDEX {index}" in plan, plan
+
+
+def test_init_db_adds_indexes_to_existing_tables(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX idx_contributions_recipient_date"))
+    monkeypatch.setattr(load, "get_engine", lambda: engine)
+
+    load.init_db()
+
+    names = {index["name"] for index in inspect(engine).get_indexes("contribution")}
+    assert "idx_contributions_recipient_date" in names
@@ -0,0 +1,114 @@
+import pytest
+
+from src import ratelimit, utils
+from src.cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_token_bucket_blocks_at_quota():
+    clock = FakeClock()
+    bucket = ratelimit.TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0.5
+    bucket.pause(10)
+    assert bucket.acquire() == 10
+    bucket.observe(0)
+    assert bucket.acquire() == 0.5
+
+
+def test_retry_after_parsing():
+    assert ratelimit.retry_after({"Retry-After": "7"}) == 7
+    assert ratelimit.retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+    assert ratelimit.retry_after({}) is None
+
+
+def test_limiter_shared_per_key():
+    ratelimit.reset_limiters()
+    a = ratelimit.limiter_for("https://api.open.fec.gov/v1/candidate/", {"api_key": "K"})
+    b = ratelimit.limiter_for("https://api.open.fec.gov/v1/schedules/schedule_e/", {"api_key": "K"})
+    c = ratelimit.limiter_for("https://api.congress.gov/v3/bill", headers={"X-Api-Key": "K"})
+    assert a is b
+    assert a is not c
+    assert ratelimit.limiter_for("https://example.test/") is None
+
+
+def test_get_json_honours_retry_after(monkeypatch, tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite")
+    responses = [
+        (429, {"Retry-After": "3"}),
+        (200, {"X-RateLimit-Remaining": "10"}),
+    ]
+    paused = []
+
+    class Response:
+        def __init__(self, status, headers):
+            self.status_code = status
+            self.headers = headers
+
+        def json(self):
+            return {"ok": True}
+
+    class Session:
+        def get(self, url, params=None, headers=None, timeout=None):
+            return Response(*responses.pop(0))
+
+    class Bucket:
+        def acquire(self):
+            return 0
+
+        def pause(self, seconds):
+            paused.append(seconds)
+
+        def observe(self, remaining):
+            paused.append(("remaining", remaining))
+
+    ratelimit.reset_stats()
+    monkeypatch.setattr(utils, "RAW_DIR", tmp_path)
+    monkeypatch.setattr(utils, "get_cache", lambda: cache)
+    monkeypatch.setattr(utils, "get_session", lambda: Session())
+    monkeypatch.setattr(ratelimit, "limiter_for", lambda url, params, headers: Bucket())
+    assert utils.get_json("https://api.open.fec.gov/v1/x/", {"api_key": "K"}) == {"ok": True}
+    assert paused == [3.0, ("remaining", 10)]
+    assert ratelimit.stats()["throttled"] == 1
+    assert ratelimit.stats()["requests"] == 2
+
+
+def test_get_json_retries_only_throttling_and_server_errors(monkeypatch, tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite")
+    statuses = []
+    slept = []
+
+    class Response:
+        def __init__(self, status):
+            self.status_code = status
+            self.headers = {}
+
+    class Session:
+        def get(self, url, params=None, headers=None, timeout=None):
+            return Response(statuses.pop(0))
+
+    monkeypatch.setattr(utils, "get_cache", lambda: cache)
+    monkeypatch.setattr(utils, "get_session", lambda: Session())
+    monkeypatch.setattr(utils.time, "sleep", slept.append)
+    max_attempts = utils.get_settings().http_max_attempts
+
+    statuses[:] = [404, 200]
+    with pytest.raises(RuntimeError):
+        utils.get_json("https://example.test/missing")
+    assert statuses == [200] and slept == []
+
+    statuses[:] = [502] * max_attempts
+    with pytest.raises(RuntimeError):
+        utils.get_json("https://example.test/down")
+    assert statuses == [] and slept == [2 ** i for i in range(max_attempts - 1)]
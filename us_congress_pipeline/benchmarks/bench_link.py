@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Time the legislator/candidate linker against the old per-row loop.
+
+By default a synthetic crosswalk the size of the full historical
+``congress-legislators`` data (about 12,000 people) is generated. Pass
+``--legislators-repo`` to extract the real YAML instead. Candidate files
+are generated for every cycle so that each listed FEC id appears in each
+cycle.
+
+The old ``iterrows`` implementation is timed on the first
+``--legacy-limit`` legislators and scaled linearly, since a full run takes
+minutes.
+
+Usage::
+
+    python benchmarks/bench_link.py --cycles 2000 2024
+    python benchmarks/bench_link.py --legislators-repo data/raw/congress-legislators
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from pipeline import extract_legislators, link, paths  # noqa: E402  (import after path setup)
+
+
+def _synthetic(n: int) -> None:
+    ids = [f"X{i:06d}" for i in range(n)]
+    paths.write_table(pd.DataFrame({"bioguide_id": ids}), "legislators")
+    fec = [";".join(f"{'HS'[j % 2]}{i:06d}{j}" for j in range(i % 4)) or None for i in range(n)]
+    paths.write_table(
+        pd.DataFrame({"bioguide_id": ids, "fec_candidate_ids": fec}).astype({"fec_candidate_ids": "string"}),
+        "xwalk_ids",
+    )
+
+
+def _candidate_files(cycles: list[int]) -> None:
+    pairs = link.crosswalk_pairs()
+    for cycle in cycles:
+        paths.write_table(pd.DataFrame({"CAND_ID": pairs["cand_id"].unique()}), f"fec_candidates_{cycle}")
+
+
+def _iterrows_link(cycles: list[int], limit: int) -> int:
+    """The previous implementation, restricted to the first ``limit`` legislators."""
+    leg = paths.read_table("legislators", columns=["bioguide_id"]).head(limit)
+    xwalk = paths.read_table("xwalk_ids", columns=["bioguide_id", "fec_candidate_ids"])
+    links = 0
+    for cycle in cycles:
+        fec = paths.read_table(f"fec_candidates_{cycle}", columns=["CAND_ID"])
+        for _, row in leg.iterrows():
+            fec_ids = xwalk.loc[xwalk["bioguide_id"] == row["bioguide_id"], "fec_candidate_ids"].fillna("").iloc[0]
+            matched = fec[fec["CAND_ID"].isin([fid for fid in fec_ids.split(";") if fid])]
+            links += len(matched)
+    return links
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--legislators-repo", type=Path)
+    parser.add_argument("--legislators", type=int, default=12_000, help="synthetic crosswalk size")
+    parser.add_argument("--cycles", nargs=2, type=int, default=[2000, 2024], metavar=("FIRST", "LAST"))
+    parser.add_argument("--legacy-limit", type=int, default=500)
+    args = parser.parse_args()
+    cycles = list(range(args.cycles[0], args.cycles[1] + 1, 2))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths.INTERIM_DIR = Path(tmp)
+        if args.legislators_repo:
+            extract_legislators.extract(args.legislators_repo)
+        else:
+            _synthetic(args.legislators)
+        _candidate_files(cycles)
+        n_leg = len(paths.read_table("legislators", columns=["bioguide_id"]))
+
+        start = time.perf_counter()
+        link.link_legislators_candidates(cycles)
+        hashed = time.perf_counter() - start
+        n_links = len(paths.read_table("legislator_candidate_link"))
+
+        limit = min(args.legacy_limit, n_leg)
+        start = time.perf_counter()
+        _iterrows_link(cycles, limit)
+        legacy = (time.perf_counter() - start) * n_leg / limit
+
+    print(f"legislators       : {n_leg:8d}")
+    print(f"cycles            : {len(cycles):8d}")
+    print(f"links             : {n_links:8d}")
+    print(f"hash join         : {hashed:8.3f} s")
+    print(f"iterrows (scaled) : {legacy:8.3f} s")
+    print(f"speedup           : {legacy / hashed:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Time roll-call parsing: DataFrame per file versus column buffers.
+
+A synthetic congress of ``--rollcalls`` House votes with ``--members``
+positions each is generated in memory. The previous parser (full lxml tree,
+two DataFrames per roll call, one ``pd.concat`` at the end) is compared
+with ``VoteParser.rows`` feeding ``VoteBuffers``, which builds each table
+once. Both run in a single process.
+
+Usage::
+
+    python benchmarks/bench_vote_parser.py --rollcalls 1500 --members 435
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+from lxml import etree
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from pipeline.extract_votes import VoteBuffers, VoteParser  # noqa: E402  (import after path setup)
+
+POSITIONS = ["Yea", "Nay", "Present", "Not Voting"]
+
+
+def _rollcall(number: int, members: int) -> bytes:
+    records = "".join(
+        f"<record><id>M{m:06d}</id><vote>{POSITIONS[(m * 7 + number) % 4]}</vote></record>"
+        for m in range(members)
+    )
+    return (
+        f"<rollcall><vote_id>h{number}-118.2023</vote_id><chamber>house</chamber><congress>118</congress>"
+        f"<session>1</session><rollnumber>{number}</rollnumber><date>2023-01-01</date>"
+        f"<question>On Passage</question><result>Passed</result><bill>hr{number}-118</bill>"
+        f"<records>{records}</records></rollcall>"
+    ).encode()
+
+
+def _dataframe_per_file(docs: list[bytes]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """The previous implementation: a DOM and two DataFrames per roll call."""
+    votes, records = [], []
+    for data in docs:
+        root = etree.fromstring(data)
+        vote_id = root.findtext("vote_id") or "unknown"
+        row = {tag: root.findtext(tag) for tag in
+               ["chamber", "congress", "session", "rollnumber", "date", "question", "result"]}
+        votes.append(pd.DataFrame([{"vote_id": vote_id, **row, "bill_id": root.findtext("bill")}]))
+        records.append(pd.DataFrame([
+            {"vote_id": vote_id, "bioguide_id": rec.findtext("id"), "position": rec.findtext("vote")}
+            for rec in root.findall("records/record")
+        ]))
+    return pd.concat(votes, ignore_index=True), pd.concat(records, ignore_index=True)
+
+
+def _buffers(docs: list[bytes]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    parser = VoteParser()
+    buffers = VoteBuffers()
+    for data in docs:
+        buffers.add(*parser.rows(data, "rollcall.xml"))
+    return buffers.frames()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rollcalls", type=int, default=1500)
+    parser.add_argument("--members", type=int, default=435)
+    args = parser.parse_args()
+    docs = [_rollcall(i, args.members) for i in range(1, args.rollcalls + 1)]
+
+    timings = {}
+    for name, run in [("dataframe per file", _dataframe_per_file), ("column buffers", _buffers)]:
+        start = time.perf_counter()
+        votes, records = run(docs)
+        timings[name] = time.perf_counter() - start
+        assert len(votes) == args.rollcalls and len(records) == args.rollcalls * args.members
+
+    rows = args.rollcalls * args.members
+    for name, seconds in timings.items():
+        print(f"{name:<19}: {seconds:7.2f} s  {rows / seconds:12,.0f} records/s")
+    print(f"{'speedup':<19}: {timings['dataframe per file'] / timings['column buffers']:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import shutil
+import sys
 from pathlib import Path
 
 from . import paths
@@ -20,30 +21,40 @@ def cmd_download(args: argparse.Namespace) -> None:
     if args.clone:
         download.clone_legislators()
         download.clone_congress_tools()
+    options = {
+        "max_connections": args.connections,
+        "max_bytes_per_sec": args.max_rate * 1e6 if args.max_rate else None,
+    }
     if args.congresses:
-        download.fetch_govinfo_rollcalls(args.congresses)
+        download.fetch_govinfo_rollcalls(args.congresses, **options)
     if args.cycles:
-        download.fetch_fec_bulk(args.cycles)
+        download.fetch_fec_bulk(args.cycles, **options)
 
 
 def cmd_extract(args: argparse.Namespace) -> None:
-    extract_legislators.extract()
-    extract_votes.extract()
+    extract_legislators.extract(full=args.full)
+    errors = extract_votes.extract(workers=args.workers, full=args.full)
+    if errors:
+        print(f"{len(errors)} roll-call files could not be parsed; see the vote_extract_errors table",
+              file=sys.stderr)
     cycles = [int(p.name) for p in (paths.RAW_DIR / "fec").glob("*/")]
-    extract_fec.extract(cycles)
+    for name, stats in extract_fec.extract(cycles, full=args.full).items():
+        print(f"{name}: skipped {stats.skipped} malformed rows, nulled bad values in {stats.invalid} rows",
+              file=sys.stderr)
 
 
 def cmd_load(args: argparse.Namespace) -> None:
-    normalize.load_sqlite()
+    for stat in normalize.load_sqlite(batch_size=args.batch_size):
+        print(f"{stat.table}: {stat.rows} rows in {stat.seconds:.1f}s ({stat.rows_per_sec:,.0f} rows/s)")
 
 
 def cmd_link(args: argparse.Namespace) -> None:
-    cycles = [int(f.stem.split("_")[-1]) for f in paths.INTERIM_DIR.glob("fec_candidates_*.csv")]
+    cycles = [int(name.split("_")[-1]) for name in paths.table_names("fec_candidates_*")]
     link.link_legislators_candidates(sorted(set(cycles)))
 
 
 def cmd_metrics(args: argparse.Namespace) -> None:
-    metrics.build_metrics(args.cycles, args.congresses)
+    metrics.build_metrics(args.cycles, args.congresses, engine=args.engine)
 
 
 def cmd_export(args: argparse.Namespace) -> None:
@@ -51,6 +62,9 @@ def cmd_export(args: argparse.Namespace) -> None:
     out.mkdir(parents=True, exist_ok=True)
     for f in paths.OUTPUT_DIR.glob("*.csv"):
         shutil.copy(f, out / f.name)
+    if args.interim:
+        for name in paths.table_names():
+            paths.export_csv(name, out)
     with open(out / "DATADICT.md", "w") as f:
         f.write("See README for column descriptions.")
 
@@ -66,12 +80,18 @@ def build_parser() -> argparse.ArgumentParser:
     p_dl.add_argument("--congresses", nargs="*", type=int, default=[])
     p_dl.add_argument("--cycles", nargs="*", type=int, default=[])
     p_dl.add_argument("--clone", action="store_true", help="clone Git repos")
+    p_dl.add_argument("--connections", type=int, default=download.MAX_CONNECTIONS,
+                      help="files downloaded at the same time")
+    p_dl.add_argument("--max-rate", type=float, default=None, help="total bandwidth cap in MB/s")
     p_dl.set_defaults(func=cmd_download)
 
     p_ex = sub.add_parser("extract")
+    p_ex.add_argument("--full", action="store_true", help="re-extract every raw file, ignoring the manifest")
+    p_ex.add_argument("--workers", type=int, default=None, help="processes parsing roll calls (default: all cores)")
     p_ex.set_defaults(func=cmd_extract)
 
     p_load = sub.add_parser("load")
+    p_load.add_argument("--batch-size", type=int, default=normalize.BATCH_SIZE, help="rows per executemany call")
     p_load.set_defaults(func=cmd_load)
 
     p_link = sub.add_parser("link")
@@ -80,10 +100,13 @@ def build_parser() -> argparse.ArgumentParser:
     p_met = sub.add_parser("metrics")
     p_met.add_argument("--cycles", nargs="*", type=int, required=True)
     p_met.add_argument("--congresses", nargs="*", type=int, required=True)
+    p_met.add_argument("--engine", choices=metrics.ENGINES, default="pandas",
+                       help="duckdb runs the summaries out of core over the interim tables")
     p_met.set_defaults(func=cmd_metrics)
 
     p_export = sub.add_parser("export")
     p_export.add_argument("--out", required=True)
+    p_export.add_argument("--interim", action="store_true", help="also export interim tables as CSV")
     p_export.set_defaults(func=cmd_export)
 
     return p
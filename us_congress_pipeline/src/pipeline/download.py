@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import json
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, Optional, Tuple
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 try:  # pragma: no cover - optional dependency
     from tqdm import tqdm
 except Exception:  # pragma: no cover
     class tqdm:  # type: ignore
-        def __init__(self, iterable=None, total=None, unit=None, unit_scale=None, desc=None):
+        def __init__(self, iterable=None, total=None, initial=0, unit=None, unit_scale=None, desc=None):
             self.iterable = iterable
         def __enter__(self):
             return self
@@ -42,30 +48,175 @@ def clone_congress_tools() -> Path:
     return dest
 
 
-def _download(url: str, dest: Path) -> None:
-    dest.parent.mkdir(parents=True, exist_ok=True)
+# Bytes read from the socket and written to disk per call.
+CHUNK_SIZE = 1 << 20
+MAX_CONNECTIONS = 4
+
+
+class Throttle:
+    """Bandwidth cap shared by every download thread.
+
+    ``consume`` blocks until the bytes fit within ``bytes_per_sec``;
+    ``None`` disables the cap.
+    """
+
+    def __init__(self, bytes_per_sec: Optional[float] = None) -> None:
+        self.rate = bytes_per_sec
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def consume(self, n: int) -> None:
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(self._next, now)
+            self._next = start + n / self.rate
+        if start > now:
+            time.sleep(start - now)
+
+
+def _session(max_connections: int = MAX_CONNECTIONS) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _meta_path(part: Path) -> Path:
+    return part.with_name(part.name + ".json")
+
+
+def _remote_size(session: requests.Session, url: str) -> Optional[int]:
+    r = session.head(url, allow_redirects=True, timeout=60)
+    r.raise_for_status()
+    return int(r.headers["Content-Length"]) if "Content-Length" in r.headers else None
+
+
+def _download(url: str, dest: Path, session: Optional[requests.Session] = None,
+              throttle: Optional[Throttle] = None) -> None:
+    """Download ``url`` to ``dest`` through ``dest.part``, resuming a previous attempt.
+
+    A partial file is continued with a ``Range`` request guarded by
+    ``If-Range`` on the ETag (or Last-Modified) seen when it was started, so
+    a file that changed on the server is fetched again from the start. The
+    result must match the size the server announced before it is renamed
+    to ``dest``; an interrupted download keeps its ``.part`` for next time.
+    An existing ``dest`` is kept only if its size matches the server's
+    (checked with a ``HEAD`` request) and fetched again otherwise.
+    """
+    session = session or _session()
     if dest.exists():
-        return
-    with requests.get(url, stream=True) as r:
+        total = _remote_size(session, url)
+        if total is None or dest.stat().st_size == total:
+            return
+        dest.unlink()
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    throttle = throttle or Throttle()
+    part = dest.with_name(dest.name + ".part")
+    meta_path = _meta_path(part)
+    meta = json.loads(meta_path.read_text()) if part.exists() and meta_path.exists() else {}
+    offset = part.stat().st_size if meta else 0
+
+    headers = {}
+    validator = meta.get("etag") or meta.get("last_modified")
+    if offset and validator:
+        headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+    with session.get(url, headers=headers, stream=True, timeout=60) as r:
+        if r.status_code == 416 and offset:
+            if offset == meta.get("size"):
+                part.replace(dest)
+                meta_path.unlink(missing_ok=True)
+                return
+            part.unlink()
+            meta_path.unlink(missing_ok=True)
+            raise IOError(f"{url}: cannot resume at byte {offset}; partial file discarded")
         r.raise_for_status()
-        total = int(r.headers.get("content-length", 0))
-        with open(dest, "wb") as f, tqdm(total=total, unit="B", unit_scale=True, desc=dest.name) as pbar:
-            for chunk in r.iter_content(chunk_size=8192):
+        if r.status_code == 206:
+            start, total = _content_range(r.headers.get("Content-Range", ""))
+            if start != offset:
+                raise IOError(f"{url}: server resumed at byte {start}, expected {offset}")
+        else:
+            offset = 0
+            total = int(r.headers["Content-Length"]) if "Content-Length" in r.headers else None
+            meta = {"url": url, "etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified"),
+                    "size": total}
+            meta_path.write_text(json.dumps(meta))
+        mode = "ab" if offset else "wb"
+        with open(part, mode, buffering=CHUNK_SIZE) as f, \
+                tqdm(total=total, initial=offset, unit="B", unit_scale=True, desc=dest.name) as pbar:
+            for chunk in _chunks(r):
                 if chunk:
+                    throttle.consume(len(chunk))
                     f.write(chunk)
                     pbar.update(len(chunk))
 
+    size = part.stat().st_size
+    if total is not None and size != total:
+        raise IOError(f"{url}: got {size} of {total} bytes; rerun to resume")
+    part.replace(dest)
+    meta_path.unlink(missing_ok=True)
+
 
-def fetch_govinfo_rollcalls(congresses: Iterable[int]) -> None:
+def _chunks(r: requests.Response) -> Iterator[bytes]:
+    """Yield the body in pieces of up to ``CHUNK_SIZE`` as soon as they arrive.
+
+    ``read1`` hands over whatever is buffered instead of waiting for a full
+    chunk, so bytes received before a dropped connection still reach the
+    ``.part`` file.
+    """
+    if not hasattr(r.raw, "read1"):  # urllib3 < 2
+        yield from r.iter_content(chunk_size=CHUNK_SIZE)
+        return
+    try:
+        while chunk := r.raw.read1(CHUNK_SIZE, decode_content=True):
+            yield chunk
+    except urllib3.exceptions.HTTPError as exc:
+        raise requests.ConnectionError(exc) from exc
+
+
+def _content_range(value: str) -> Tuple[int, Optional[int]]:
+    """Parse ``bytes start-end/total`` into ``(start, total)``."""
+    span, _, total = value.replace("bytes", "").strip().partition("/")
+    return int(span.split("-")[0]), int(total) if total.strip().isdigit() else None
+
+
+def download_many(jobs: Iterable[Tuple[str, Path]], max_connections: int = MAX_CONNECTIONS,
+                  max_bytes_per_sec: Optional[float] = None) -> None:
+    """Download ``(url, dest)`` pairs concurrently.
+
+    At most ``max_connections`` transfers run at once and together they
+    stay under ``max_bytes_per_sec``. Every job is attempted; failures are
+    raised together at the end and their partial files kept for resuming.
+    """
+    session = _session(max_connections)
+    throttle = Throttle(max_bytes_per_sec)
+    failures = []
+    with ThreadPoolExecutor(max_workers=max_connections) as pool:
+        futures = {pool.submit(_download, url, dest, session, throttle): url for url, dest in jobs}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except (requests.RequestException, IOError) as exc:
+                failures.append(f"{futures[future]}: {exc}")
+    session.close()
+    if failures:
+        raise RuntimeError("downloads failed:\n" + "\n".join(sorted(failures)))
+
+
+def fetch_govinfo_rollcalls(congresses: Iterable[int], **options) -> None:
     base = "https://www.govinfo.gov/bulkdata/rollcallvote"
-    for congress in congresses:
-        for chamber in ("house", "senate"):
-            url = f"{base}/{congress}/{chamber}/rollcallvotes.zip"
-            dest = paths.RAW_DIR / "rollcalls" / str(congress) / f"{chamber}_rollcallvotes.zip"
-            _download(url, dest)
+    jobs = [
+        (f"{base}/{congress}/{chamber}/rollcallvotes.zip",
+         paths.RAW_DIR / "rollcalls" / str(congress) / f"{chamber}_rollcallvotes.zip")
+        for congress in congresses
+        for chamber in ("house", "senate")
+    ]
+    download_many(jobs, **options)
 
 
-def fetch_fec_bulk(cycles: Iterable[int]) -> None:
+def fetch_fec_bulk(cycles: Iterable[int], **options) -> None:
     base = "https://www.fec.gov/files/bulk-downloads"
     files = {
         "candidates": "cn.csv.zip",
@@ -75,8 +226,9 @@ def fetch_fec_bulk(cycles: Iterable[int]) -> None:
         "indiv_contrib": "itcont.zip",
         "disbursements": "oppexp.zip",
     }
-    for cycle in cycles:
-        for key, fname in files.items():
-            url = f"{base}/{cycle}/{fname}"
-            dest = paths.RAW_DIR / "fec" / str(cycle) / f"{key}.zip"
-            _download(url, dest)
+    jobs = [
+        (f"{base}/{cycle}/{fname}", paths.RAW_DIR / "fec" / str(cycle) / f"{key}.zip")
+        for cycle in cycles
+        for key, fname in files.items()
+    ]
+    download_many(jobs, **options)
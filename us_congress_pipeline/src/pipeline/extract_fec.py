@@ -1,39 +1,252 @@
 from __future__ import annotations
 
+import csv
+import io
 import zipfile
 from pathlib import Path
-from typing import Iterable
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 from . import paths
+from .manifest import Manifest
 
 
 FEC_FILES = {
-    "candidates": "fec_candidates_{cycle}.csv",
-    "committees": "fec_committees_{cycle}.csv",
-    "candidate_totals": "fec_candidate_totals_{cycle}.csv",
-    "committee_totals": "fec_committee_totals_{cycle}.csv",
-    "indiv_contrib": "fec_indiv_contrib_{cycle}.csv",
-    "disbursements": "fec_disbursements_{cycle}.csv",
+    "candidates": "fec_candidates_{cycle}",
+    "committees": "fec_committees_{cycle}",
+    "candidate_totals": "fec_candidate_totals_{cycle}",
+    "committee_totals": "fec_committee_totals_{cycle}",
+    "indiv_contrib": "fec_indiv_contrib_{cycle}",
+    "disbursements": "fec_disbursements_{cycle}",
 }
 
+# Column layout of the official pipe-delimited bulk files, which ship without
+# a header row. See https://www.fec.gov/campaign-finance-data/ for the
+# per-file data descriptions.
+FEC_COLUMNS: Dict[str, List[str]] = {
+    "candidates": [
+        "CAND_ID", "CAND_NAME", "CAND_PTY_AFFILIATION", "CAND_ELECTION_YR", "CAND_OFFICE_ST",
+        "CAND_OFFICE", "CAND_OFFICE_DISTRICT", "CAND_ICI", "CAND_STATUS", "CAND_PCC", "CAND_ST1",
+        "CAND_ST2", "CAND_CITY", "CAND_ST", "CAND_ZIP",
+    ],
+    "committees": [
+        "CMTE_ID", "CMTE_NM", "TRES_NM", "CMTE_ST1", "CMTE_ST2", "CMTE_CITY", "CMTE_ST", "CMTE_ZIP",
+        "CMTE_DSGN", "CMTE_TP", "CMTE_PTY_AFFILIATION", "CMTE_FILING_FREQ", "ORG_TP", "CONNECTED_ORG_NM",
+        "CAND_ID",
+    ],
+    "candidate_totals": [
+        "CAND_ID", "CAND_ELECTION_YR", "FEC_ELECTION_YR", "CMTE_ID", "CMTE_TP", "CMTE_DSGN", "LINKAGE_ID",
+    ],
+    "committee_totals": [
+        "CMTE_ID", "CMTE_NM", "CMTE_TP", "CMTE_DSGN", "CMTE_FILING_FREQ", "TTL_RECEIPTS", "TRANS_FROM_AFF",
+        "INDV_CONTRIB", "OTHER_POL_CMTE_CONTRIB", "CAND_CONTRIB", "CAND_LOANS", "TTL_LOANS_RECEIVED",
+        "TTL_DISB", "TRANF_TO_AFF", "INDV_REFUNDS", "OTHER_POL_CMTE_REFUNDS", "CAND_LOAN_REPAY",
+        "LOAN_REPAY", "COH_BOP", "COH_COP", "DEBTS_OWED_BY", "NONFED_TRANS_RECEIVED",
+        "CONTRIB_TO_OTHER_CMTE", "IND_EXP", "PTY_COORD_EXP", "NONFED_SHARE_EXP", "CVG_END_DT",
+    ],
+    "indiv_contrib": [
+        "CMTE_ID", "AMNDT_IND", "RPT_TP", "TRANSACTION_PGI", "IMAGE_NUM", "TRANSACTION_TP", "ENTITY_TP",
+        "NAME", "CITY", "STATE", "ZIP_CODE", "EMPLOYER", "OCCUPATION", "TRANSACTION_DT",
+        "TRANSACTION_AMT", "OTHER_ID", "TRAN_ID", "FILE_NUM", "MEMO_CD", "MEMO_TEXT", "SUB_ID",
+    ],
+    "disbursements": [
+        "CMTE_ID", "AMNDT_IND", "RPT_YR", "RPT_TP", "IMAGE_NUM", "LINE_NUM", "FORM_TP_CD", "SCHED_TP_CD",
+        "NAME", "CITY", "STATE", "ZIP_CODE", "TRANSACTION_DT", "TRANSACTION_AMT", "TRANSACTION_PGI",
+        "PURPOSE", "CATEGORY", "CATEGORY_DESC", "MEMO_CD", "MEMO_TEXT", "ENTITY_TP", "SUB_ID", "FILE_NUM",
+        "TRAN_ID", "BACK_REF_TRAN_ID",
+    ],
+}
+
+_MONEY = pa.float64()
+# Non-string column types; every other column is read as a string.
+FEC_TYPES: Dict[str, pa.DataType] = {
+    "CAND_ELECTION_YR": pa.int32(),
+    "FEC_ELECTION_YR": pa.int32(),
+    "RPT_YR": pa.int32(),
+    "LINKAGE_ID": pa.int64(),
+    "SUB_ID": pa.int64(),
+    "FILE_NUM": pa.int64(),
+    "TRANSACTION_DT": pa.date32(),
+    "CVG_END_DT": pa.date32(),
+    "TRANSACTION_AMT": _MONEY,
+    **{
+        col: _MONEY
+        for col in FEC_COLUMNS["committee_totals"]
+        if col not in ("CMTE_ID", "CMTE_NM", "CMTE_TP", "CMTE_DSGN", "CMTE_FILING_FREQ", "CVG_END_DT")
+    },
+}
+
+# Bytes of input parsed per record batch; bounds memory regardless of file size.
+BLOCK_SIZE = 16 << 20
+# Share of malformed rows above which a file is rejected rather than written
+# without them; a layout change makes every row fail the column count.
+MAX_SKIPPED_SHARE = 0.01
+# Bulk dates are MMDDYYYY; the header-style samples use ISO dates.
+DATE_FORMATS = ["%m%d%Y", "%m/%d/%Y", "%Y-%m-%d"]
+# Values the typed columns accept; anything else becomes null.
+_INTEGER = r"^[+-]?\d+$"
+_DECIMAL = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"
+
+
+class ExtractStats(NamedTuple):
+    rows: int
+    skipped: int
+    invalid: int = 0
+
+
+def _open_batches(zip_path: Path, key: str, block_size: int = BLOCK_SIZE,
+                  counts: Optional[Dict[str, int]] = None) -> Iterator[pa.RecordBatch]:
+    """Stream typed record batches out of the data file inside ``zip_path``.
+
+    Official bulk files are pipe-delimited without a header and get the
+    :data:`FEC_COLUMNS` layout; anything else is read as a CSV with a header
+    row. Either way only ``block_size`` bytes are parsed at a time. Rows
+    with the wrong number of fields are skipped and counted in
+    ``counts["skipped"]``; rows with a date or number that does not parse
+    keep a null in its place and are counted in ``counts["invalid"]``.
+    """
+    counts = counts if counts is not None else {}
+    counts.setdefault("skipped", 0)
+    counts.setdefault("invalid", 0)
+
+    def skip(row) -> str:
+        counts["skipped"] += 1
+        return "skip"
 
-def _unzip_to_csv(zip_path: Path, out_csv: Path) -> None:
-    out_csv.parent.mkdir(parents=True, exist_ok=True)
     with zipfile.ZipFile(zip_path) as z:
         name = z.namelist()[0]
         with z.open(name) as f:
-            df = pd.read_csv(f, dtype=str)
-        df.to_csv(out_csv, index=False)
+            first = io.TextIOWrapper(f, encoding="latin-1").readline().rstrip("\r\n")
+        if not first:
+            return
+        official = FEC_COLUMNS.get(key, [])
+        if official and first.count("|") >= len(official) - 1:
+            columns = list(official)
+            if first.count("|") == len(official):  # trailing delimiter, e.g. oppexp
+                columns.append("_TRAILING")
+            delimiter, skip_rows, quote_char = "|", 0, False
+        else:
+            columns = next(csv.reader([first]))
+            delimiter, skip_rows, quote_char = ",", 1, '"'
+
+        with z.open(name) as f:
+            reader = pacsv.open_csv(
+                f,
+                read_options=pacsv.ReadOptions(
+                    column_names=columns, skip_rows=skip_rows, block_size=block_size, encoding="latin-1"
+                ),
+                parse_options=pacsv.ParseOptions(
+                    delimiter=delimiter, quote_char=quote_char, invalid_row_handler=skip
+                ),
+                # Typed columns are converted per batch so a bad value nulls
+                # one cell instead of aborting the file.
+                convert_options=pacsv.ConvertOptions(column_types={col: pa.string() for col in columns}),
+            )
+            for batch in reader:
+                batch, invalid = _finish_batch(batch)
+                counts["invalid"] += invalid
+                yield batch
+
+
+def _convert(values: pa.Array, typ: pa.DataType) -> pa.Array:
+    """Cast the strings ``values`` to ``typ``, with null for values that do not parse."""
+    values = pc.utf8_trim_whitespace(values)
+    if pa.types.is_date(typ):
+        parsed = [pc.strptime(values, format=fmt, unit="s", error_is_null=True) for fmt in DATE_FORMATS]
+        return pc.coalesce(*parsed).cast(typ)
+    pattern = _INTEGER if pa.types.is_integer(typ) else _DECIMAL
+    valid = pc.fill_null(pc.match_substring_regex(values, pattern), False)
+    return pc.if_else(valid, values, pa.scalar(None, pa.string())).cast(typ)
+
+
+def _finish_batch(batch: pa.RecordBatch) -> Tuple[pa.RecordBatch, int]:
+    """Type the batch's columns and return it with the number of rows that had a bad value."""
+    arrays, fields = [], []
+    bad = None
+    for field, array in zip(batch.schema, batch.columns):
+        if field.name == "_TRAILING":
+            continue
+        typ = FEC_TYPES.get(field.name, pa.string())
+        if not pa.types.is_string(typ):
+            converted = _convert(array, typ)
+            lost = pc.and_(pc.not_equal(pc.utf8_trim_whitespace(array), ""), pc.is_null(converted))
+            lost = pc.fill_null(lost, False)
+            bad = lost if bad is None else pc.or_(bad, lost)
+            array = converted
+        arrays.append(array)
+        fields.append(pa.field(field.name, array.type))
+    invalid = 0 if bad is None else pc.sum(bad).as_py() or 0
+    return pa.RecordBatch.from_arrays(arrays, schema=pa.schema(fields)), invalid
+
 
+def stream_extract(zip_path: Path, key: str, out_path: Path, fmt: str = "parquet",
+                   block_size: int = BLOCK_SIZE) -> ExtractStats:
+    """Write a bulk file to ``out_path`` batch by batch and return the rows written and skipped.
 
-def extract(cycles: Iterable[int]) -> None:
+    Parquet output is zstd-compressed with one row group per parsed block;
+    ``fmt="csv"`` writes plain CSV, for one-off dumps of a bulk file.
+    Raises ``ValueError`` and removes ``out_path`` when more than
+    :data:`MAX_SKIPPED_SHARE` of the rows were skipped or had a value
+    nulled.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    rows = 0
+    counts: Dict[str, int] = {}
+    writer = None
+    try:
+        for batch in _open_batches(zip_path, key, block_size, counts):
+            if writer is None:
+                if fmt == "parquet":
+                    writer = pq.ParquetWriter(out_path, batch.schema, compression="zstd")
+                else:
+                    writer = pacsv.CSVWriter(str(out_path), batch.schema)
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    stats = ExtractStats(rows, counts.get("skipped", 0), counts.get("invalid", 0))
+    bad = stats.skipped + stats.invalid
+    if bad and bad > MAX_SKIPPED_SHARE * (rows + stats.skipped):
+        out_path.unlink(missing_ok=True)
+        raise ValueError(
+            f"{zip_path}: {bad} of {rows + stats.skipped} rows do not match the {key} layout; "
+            "the file format may have changed"
+        )
+    return stats
+
+
+def extract(cycles: Iterable[int], full: bool = False) -> Dict[str, ExtractStats]:
+    """Extract each cycle's bulk files into interim Parquet tables.
+
+    Returns the extract stats of the tables that had malformed rows or
+    unparseable values.
+
+    Bulk files that are unchanged since their table was built (see
+    :mod:`pipeline.manifest`) are skipped unless ``full`` is set. The
+    ``export --interim`` command dumps the tables as CSV for inspection.
+    """
+    state = Manifest.load("fec")
+    flawed: Dict[str, ExtractStats] = {}
+    if full:
+        state.clear()
     for cycle in cycles:
         cycle_dir = paths.RAW_DIR / "fec" / str(cycle)
-        for key, out_template in FEC_FILES.items():
+        for key, name_template in FEC_FILES.items():
             zip_path = cycle_dir / f"{key}.zip"
             if not zip_path.exists():
                 continue
-            out_csv = paths.INTERIM_DIR / out_template.format(cycle=cycle)
-            _unzip_to_csv(zip_path, out_csv)
+            name = name_template.format(cycle=cycle)
+            out_path = paths.table_path(name)
+            if not state.changed(zip_path) and out_path.exists():
+                continue
+            stats = stream_extract(zip_path, key, out_path)
+            if stats.skipped or stats.invalid:
+                flawed[name] = stats
+            state.record(zip_path, [out_path.name])
+            state.save()
+    return flawed
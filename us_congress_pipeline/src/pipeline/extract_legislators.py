@@ -1,53 +1,90 @@
 from __future__ import annotations
 
-import csv
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, List
 
 import pandas as pd
-import yaml
 
 from . import paths
+from .legislators import Legislator, load_legislators
+from .manifest import Manifest
 
 
-def _load_people(repo: Path) -> List[Dict[str, Any]]:
-    files = ["legislators-current.yaml", "legislators-historical.yaml"]
-    people: List[Dict[str, Any]] = []
-    for fname in files:
+LEGISLATOR_COLUMNS = [
+    "bioguide_id", "first_name", "last_name", "party", "state", "district", "office", "first_year", "last_year",
+]
+# One row per term, for matching members who changed seat or chamber.
+TERM_COLUMNS = ["bioguide_id", "party", "state", "district", "office", "first_year", "last_year"]
+# FEC office codes for the ``type`` of a term.
+OFFICES = {"rep": "H", "sen": "S"}
+
+
+def _year(value: Any) -> int | None:
+    return int(str(value)[:4]) if value else None
+
+
+LEGISLATOR_FILES = ["legislators-current.yaml", "legislators-historical.yaml"]
+
+
+def _load_people(repo: Path) -> List[Legislator]:
+    people: List[Legislator] = []
+    for fname in LEGISLATOR_FILES:
         fpath = repo / fname
         if fpath.exists():
-            with open(fpath) as f:
-                people.extend(yaml.safe_load(f))
+            people.extend(load_legislators(fpath))
     return people
 
 
-def extract(repo: Path | None = None) -> None:
+def extract(repo: Path | None = None, full: bool = False) -> None:
+    """Build the ``legislators``, ``legislator_terms`` and ``xwalk_ids`` tables from the YAML files.
+
+    Skipped when neither YAML file changed since the tables were built,
+    unless ``full`` is set.
+    """
     repo = repo or (paths.RAW_DIR / "congress-legislators")
+    sources = [repo / fname for fname in LEGISLATOR_FILES if (repo / fname).exists()]
+    state = Manifest.load("legislators")
+    outputs = ["legislators", "legislator_terms", "xwalk_ids"]
+    unchanged = set(state.files()) == {str(p) for p in sources} and not any(state.changed(p) for p in sources)
+    if not full and unchanged and all(paths.table_exists(name) for name in outputs):
+        return
     people = _load_people(repo)
     rows = []
+    terms = []
     xwalk = []
     for p in people:
-        bioguide = p.get("id", {}).get("bioguide")
-        name = p.get("name", {})
-        first = name.get("first")
-        last = name.get("last")
-        party = None
-        terms = p.get("terms", [])
-        if terms:
-            party = terms[-1].get("party")
         rows.append({
-            "bioguide_id": bioguide,
-            "first_name": first,
-            "last_name": last,
-            "party": party,
+            "bioguide_id": p.bioguide_id,
+            "first_name": p.first_name,
+            "last_name": p.last_name,
+            "party": p.party,
+            "state": p.state,
+            "district": p.district,
+            "office": OFFICES.get(p.term_type),
+            "first_year": _year(p.first_term_start),
+            "last_year": _year(p.last_term_end),
         })
-        ids = p.get("id", {})
-        fec_ids = ids.get("fec", [])
+        terms.extend({
+            "bioguide_id": p.bioguide_id,
+            "party": term.party,
+            "state": term.state,
+            "district": term.district,
+            "office": OFFICES.get(term.type),
+            "first_year": _year(term.start),
+            "last_year": _year(term.end),
+        } for term in p.terms)
         xwalk.append({
-            "bioguide_id": bioguide,
-            "govtrack_id": ids.get("govtrack"),
-            "icpsr_id": ids.get("icpsr"),
-            "fec_candidate_ids": ";".join(fec_ids) if isinstance(fec_ids, list) else fec_ids,
+            "bioguide_id": p.bioguide_id,
+            "govtrack_id": p.govtrack_id,
+            "icpsr_id": p.icpsr_id,
+            "fec_candidate_ids": ";".join(p.fec_ids),
         })
-    pd.DataFrame(rows).to_csv(paths.INTERIM_DIR / "legislators.csv", index=False)
-    pd.DataFrame(xwalk).to_csv(paths.INTERIM_DIR / "xwalk_ids.csv", index=False)
+    year_types = {"district": "Int64", "first_year": "Int64", "last_year": "Int64"}
+    paths.write_table(pd.DataFrame(rows, columns=LEGISLATOR_COLUMNS).astype(year_types), "legislators")
+    paths.write_table(pd.DataFrame(terms, columns=TERM_COLUMNS).astype(year_types), "legislator_terms")
+    xwalk_columns = ["bioguide_id", "govtrack_id", "icpsr_id", "fec_candidate_ids"]
+    paths.write_table(pd.DataFrame(xwalk, columns=xwalk_columns).astype({"fec_candidate_ids": "string"}), "xwalk_ids")
+    state.clear()
+    for path in sources:
+        state.record(path, outputs)
+    state.save()
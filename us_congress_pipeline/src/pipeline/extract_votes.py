@@ -1,84 +1,272 @@
 from __future__ import annotations
 
+import io
 import json
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
 from lxml import etree
 
 from . import paths
+from .manifest import Manifest
+
+# Numeric vote columns; everything else stays a string.
+VOTE_TYPES = {"congress": "Int64", "rollnumber": "Int64"}
+VOTE_SUFFIXES = (".xml", ".json")
+# Roll-call files handed to a worker at a time.
+BATCH_SIZE = 200
+
+# A roll-call file: a loose file, or a member of a zip archive.
+Source = Tuple[str, Optional[str]]
+
+
+VOTE_COLUMNS = ["vote_id", "chamber", "congress", "session", "rollnumber", "date", "question", "result", "bill_id"]
+RECORD_COLUMNS = ["vote_id", "bioguide_id", "position"]
+# Element (or JSON key) each vote column is read from.
+_FIELD_COLUMNS = {"bill" if col == "bill_id" else col: col for col in VOTE_COLUMNS}
+_XML_TAGS = ("record", "id", "vote", *_FIELD_COLUMNS)
+
+VOTE_SCHEMA = pa.schema([(col, pa.int64() if col in VOTE_TYPES else pa.string()) for col in VOTE_COLUMNS])
+RECORD_SCHEMA = pa.schema([(col, pa.string()) for col in RECORD_COLUMNS])
+ERROR_SCHEMA = pa.schema([("path", pa.string()), ("member", pa.string()), ("error", pa.string())])
+# Partitioned interim tables written by this stage.
+VOTE_TABLES = {"votes": VOTE_SCHEMA, "vote_records": RECORD_SCHEMA, "vote_extract_errors": ERROR_SCHEMA}
+
+VoteRow = Tuple[Any, ...]
+RecordRow = Tuple[Any, Any, Any]
 
 
 class VoteParser:
-    """Parse GovInfo roll-call vote XML or JSON."""
+    """Parse GovInfo roll-call vote XML or JSON.
+
+    :meth:`rows` returns plain tuples; :meth:`parse_file` and
+    :meth:`parse_bytes` wrap them in DataFrames for one-off use.
+    """
 
     def parse_file(self, fpath: Path) -> tuple[pd.DataFrame, pd.DataFrame]:
-        if fpath.suffix == ".json":
-            with open(fpath) as f:
-                data = json.load(f)
-            return self._from_json(data)
-        else:
-            tree = etree.parse(str(fpath))
-            return self._from_xml(tree)
-
-    def _from_json(self, data: dict) -> tuple[pd.DataFrame, pd.DataFrame]:
+        return self.parse_bytes(fpath.read_bytes(), fpath.name)
+
+    def parse_bytes(self, data: bytes, name: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Parse the contents of the roll-call file ``name``."""
+        vote, records = self.rows(data, name)
+        return pd.DataFrame([vote], columns=VOTE_COLUMNS), pd.DataFrame(records, columns=RECORD_COLUMNS)
+
+    def rows(self, data: bytes, name: str) -> Tuple[VoteRow, List[RecordRow]]:
+        """Return the vote row and its member records as tuples in column order."""
+        if name.endswith(".json"):
+            return self._rows_from_json(json.loads(data))
+        return self._rows_from_xml(data)
+
+    def _rows_from_json(self, data: dict) -> Tuple[VoteRow, List[RecordRow]]:
         vote_id = data["vote_id"]
-        vote_row = {
-            "vote_id": vote_id,
-            "chamber": data.get("chamber"),
-            "congress": data.get("congress"),
-            "session": data.get("session"),
-            "rollnumber": data.get("rollnumber"),
-            "date": data.get("date"),
-            "question": data.get("question"),
-            "result": data.get("result"),
-            "bill_id": data.get("bill")
-        }
-        records = [
-            {"vote_id": vote_id, "bioguide_id": r["id"], "position": r["vote"]}
-            for r in data.get("records", [])
-        ]
-        return pd.DataFrame([vote_row]), pd.DataFrame(records)
-
-    def _from_xml(self, tree: etree._ElementTree) -> tuple[pd.DataFrame, pd.DataFrame]:
-        root = tree.getroot()
-        vote_id = root.findtext("vote_id") or "unknown"
-        vote_row = {
-            "vote_id": vote_id,
-            "chamber": root.findtext("chamber"),
-            "congress": root.findtext("congress"),
-            "session": root.findtext("session"),
-            "rollnumber": root.findtext("rollnumber"),
-            "date": root.findtext("date"),
-            "question": root.findtext("question"),
-            "result": root.findtext("result"),
-            "bill_id": root.findtext("bill"),
-        }
-        records = []
-        for rec in root.findall("records/record"):
-            records.append({
-                "vote_id": vote_id,
-                "bioguide_id": rec.findtext("id"),
-                "position": rec.findtext("vote"),
-            })
-        return pd.DataFrame([vote_row]), pd.DataFrame(records)
-
-
-def extract(rollcall_dir: Path | None = None) -> None:
-    rollcall_dir = rollcall_dir or (paths.RAW_DIR / "rollcalls")
+        vote = tuple(data.get(field) for field in _FIELD_COLUMNS)
+        records = [(vote_id, r["id"], r["vote"]) for r in data.get("records", [])]
+        return vote, records
+
+    def _rows_from_xml(self, data: bytes) -> Tuple[VoteRow, List[RecordRow]]:
+        """Stream the document with ``iterparse``, clearing each record once read.
+
+        Only the vote fields and the ``id``/``vote`` of each record raise
+        events, so no tree is kept. As with ``findtext``, a field counts only
+        as a direct child of the root, and ``id``/``vote`` only as direct
+        children of a ``records/record`` element; same-named elements nested
+        elsewhere are ignored.
+        """
+        fields: Dict[str, Any] = {}
+        positions = []
+        bioguide_id = position = None
+        for _, elem in etree.iterparse(io.BytesIO(data), events=("end",), tag=_XML_TAGS):
+            tag, parent = elem.tag, elem.getparent()
+            if tag == "record":
+                if _is_record(elem):
+                    positions.append((bioguide_id, position))
+                    bioguide_id = position = None
+                elem.clear()
+            elif tag in ("id", "vote"):
+                if _is_record(parent):
+                    if tag == "id":
+                        bioguide_id = elem.text
+                    else:
+                        position = elem.text
+            elif parent is not None and parent.getparent() is None:
+                fields[_FIELD_COLUMNS[tag]] = elem.text or ""
+        vote_id = fields.get("vote_id") or "unknown"
+        fields["vote_id"] = vote_id
+        vote = tuple(fields.get(col) for col in VOTE_COLUMNS)
+        return vote, [(vote_id, b, p) for b, p in positions]
+
+
+def _is_record(elem: Optional[etree._Element]) -> bool:
+    """Whether ``elem`` is a member record, i.e. at ``records/record`` under the root."""
+    if elem is None or elem.tag != "record":
+        return False
+    records = elem.getparent()
+    if records is None or records.tag != "records":
+        return False
+    root = records.getparent()
+    return root is not None and root.getparent() is None
+
+
+class VoteBuffers:
+    """Column buffers the vote tables are built from in one go."""
+
+    def __init__(self) -> None:
+        self.votes: Dict[str, List[Any]] = {col: [] for col in VOTE_COLUMNS}
+        self.records: Dict[str, List[Any]] = {col: [] for col in RECORD_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.votes["vote_id"])
+
+    def add(self, vote: VoteRow, records: List[RecordRow]) -> None:
+        for col, value in zip(VOTE_COLUMNS, vote):
+            self.votes[col].append(value)
+        for col, values in zip(RECORD_COLUMNS, zip(*records)):
+            self.records[col].extend(values)
+
+    def extend(self, other: "VoteBuffers") -> None:
+        for col in VOTE_COLUMNS:
+            self.votes[col].extend(other.votes[col])
+        for col in RECORD_COLUMNS:
+            self.records[col].extend(other.records[col])
+
+    def frames(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        votes = pd.DataFrame(self.votes, columns=VOTE_COLUMNS)
+        for col in VOTE_COLUMNS:
+            if col in VOTE_TYPES:
+                votes[col] = pd.to_numeric(votes[col], errors="coerce").astype(VOTE_TYPES[col])
+            else:
+                votes[col] = votes[col].astype("string")
+        return votes, pd.DataFrame(self.records, columns=RECORD_COLUMNS).astype("string")
+
+
+def _partition_name(rollcall_dir: Path, path: Path) -> str:
+    rel = path.relative_to(rollcall_dir).as_posix()
+    return "_root" if rel == "." else rel.replace("/", "__")
+
+
+def _units(rollcall_dir: Path) -> Dict[str, List[Path]]:
+    """Group the raw files by the partition they are extracted into.
+
+    Each zip archive is its own partition; loose files share one partition
+    per directory.
+    """
+    units: Dict[str, List[Path]] = {}
+    for path in sorted(p for p in rollcall_dir.rglob("*") if p.is_file()):
+        if path.suffix == ".zip":
+            units[_partition_name(rollcall_dir, path)] = [path]
+        elif path.suffix in VOTE_SUFFIXES:
+            units.setdefault(_partition_name(rollcall_dir, path.parent), []).append(path)
+    return units
+
+
+def _batches(files: List[Path]) -> Iterator[List[Source]]:
+    """Split the files of one partition into batches of roll-call files."""
+    loose = [str(p) for p in files if p.suffix != ".zip"]
+    for i in range(0, len(loose), BATCH_SIZE):
+        yield [(path, None) for path in loose[i:i + BATCH_SIZE]]
+    for zip_path in (p for p in files if p.suffix == ".zip"):
+        with zipfile.ZipFile(zip_path) as zf:
+            members = [m.filename for m in zf.infolist() if not m.is_dir() and m.filename.endswith(VOTE_SUFFIXES)]
+        for i in range(0, len(members), BATCH_SIZE):
+            yield [(str(zip_path), member) for member in members[i:i + BATCH_SIZE]]
+
+
+def _dirty_units(rollcall_dir: Path, state: Manifest) -> Dict[str, List[Path]]:
+    """Partitions with a new, changed or removed raw file, or a missing output.
+
+    Partitions whose raw files are all gone are dropped here.
+    """
+    units = _units(rollcall_dir)
+    current = {str(p) for files in units.values() for p in files}
+    dirty = set()
+    for path in state.files():
+        if path in current:
+            continue
+        for output in state.outputs(path):
+            table, part = output.split("/", 1)
+            if part in units:
+                dirty.add(part)
+            else:
+                paths.drop_partition(table, part)
+        state.forget(path)
+    for part, files in units.items():
+        missing = not all(paths.partition_path(table, part).exists() for table in VOTE_TABLES)
+        if missing or any(state.changed(p) for p in files):
+            dirty.add(part)
+    return {part: units[part] for part in sorted(dirty)}
+
+
+def _parse_batch(batch: List[Source]) -> tuple[VoteBuffers, List[dict]]:
+    """Parse one batch of files, reading zip members without unpacking them."""
     parser = VoteParser()
-    votes: List[pd.DataFrame] = []
-    records: List[pd.DataFrame] = []
-    for fpath in rollcall_dir.rglob("*.xml"):
-        v, r = parser.parse_file(fpath)
-        votes.append(v)
-        records.append(r)
-    for fpath in rollcall_dir.rglob("*.json"):
-        v, r = parser.parse_file(fpath)
-        votes.append(v)
-        records.append(r)
-    if votes:
-        pd.concat(votes, ignore_index=True).to_csv(paths.INTERIM_DIR / "votes.csv", index=False)
-    if records:
-        pd.concat(records, ignore_index=True).to_csv(paths.INTERIM_DIR / "vote_records.csv", index=False)
+    buffers = VoteBuffers()
+    errors = []
+    archive: Optional[zipfile.ZipFile] = None
+    try:
+        for path, member in batch:
+            try:
+                if member is None:
+                    vote, records = parser.rows(Path(path).read_bytes(), path)
+                else:
+                    if archive is None or archive.filename != path:
+                        if archive is not None:
+                            archive.close()
+                        archive = zipfile.ZipFile(path)
+                    vote, records = parser.rows(archive.read(member), member)
+            except Exception as exc:  # noqa: BLE001 - reported per file
+                errors.append({"path": path, "member": member, "error": f"{type(exc).__name__}: {exc}"})
+                continue
+            buffers.add(vote, records)
+    finally:
+        if archive is not None:
+            archive.close()
+    return buffers, errors
+
+
+def extract(rollcall_dir: Path | None = None, workers: int | None = None, full: bool = False) -> List[dict]:
+    """Parse new or changed roll calls under ``rollcall_dir`` into the vote tables.
+
+    Loose ``*.xml``/``*.json`` files and the members of GovInfo
+    ``*_rollcallvotes.zip`` archives are parsed in batches across
+    ``workers`` processes (all cores by default; ``1`` parses in this
+    process). ``votes``, ``vote_records`` and ``vote_extract_errors`` are
+    partitioned by archive or directory, and only partitions whose raw files
+    changed since the last run (see :mod:`pipeline.manifest`) are rebuilt;
+    ``full=True`` rebuilds everything. Files that fail to parse are skipped
+    and recorded in ``vote_extract_errors``. Returns this run's errors.
+    """
+    rollcall_dir = rollcall_dir or (paths.RAW_DIR / "rollcalls")
+    workers = workers or os.cpu_count() or 1
+    state = Manifest.load("votes")
+    if full:
+        state.clear()
+        for table in VOTE_TABLES:
+            for part in paths.partitions(table):
+                paths.drop_partition(table, part)
+    units = _dirty_units(rollcall_dir, state)
+    jobs = [(part, batch) for part, files in units.items() for batch in _batches(files)]
+    buffers = {part: VoteBuffers() for part in units}
+    errors: Dict[str, List[dict]] = {part: [] for part in units}
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(jobs) > 1 else None
+    try:
+        results = (pool.map if pool else map)(_parse_batch, [batch for _, batch in jobs])
+        for (part, _), (batch, batch_errors) in zip(jobs, results):
+            buffers[part].extend(batch)
+            errors[part] += batch_errors
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    for part, files in units.items():
+        votes, records = buffers[part].frames()
+        error_frame = pd.DataFrame(errors[part], columns=ERROR_SCHEMA.names)
+        for table, frame in zip(VOTE_TABLES, (votes, records, error_frame)):
+            paths.write_partition(frame, table, part, schema=VOTE_TABLES[table])
+        for path in files:
+            state.record(path, [f"{table}/{part}" for table in VOTE_TABLES])
+    state.save()
+    return [e for part_errors in errors.values() for e in part_errors]
@@ -0,0 +1,123 @@
+"""Fast loading of the unitedstates/congress-legislators YAML files.
+
+Parsing ``legislators-historical.yaml`` with the pure-Python loader takes
+seconds, so :func:`load_legislators` parses with libyaml's ``CSafeLoader``
+when available and keeps a pickled snapshot of the result keyed by the
+file's content hash; later loads of the same file skip YAML entirely.
+"""
+from __future__ import annotations
+
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
+from . import paths
+
+# Bump when the fields of Legislator change so old snapshots are ignored.
+SNAPSHOT_VERSION = 2
+
+
+class Term(NamedTuple):
+    """One term in office; ``type`` is ``"rep"`` or ``"sen"``."""
+
+    type: Optional[str]
+    state: Optional[str]
+    district: Optional[int]
+    party: Optional[str]
+    start: Optional[str]
+    end: Optional[str]
+
+
+class Legislator(NamedTuple):
+    """One person from the YAML, reduced to the fields the pipelines use.
+
+    Term fields come from the most recent term; ``term_type`` is ``"rep"``
+    or ``"sen"``. ``terms`` holds every term, oldest first.
+    """
+
+    bioguide_id: Optional[str]
+    first_name: Optional[str]
+    last_name: Optional[str]
+    party: Optional[str]
+    state: Optional[str]
+    district: Optional[int]
+    term_type: Optional[str]
+    first_term_start: Optional[str]
+    last_term_end: Optional[str]
+    fec_ids: Tuple[str, ...]
+    govtrack_id: Optional[int]
+    icpsr_id: Optional[int]
+    terms: Tuple[Term, ...]
+
+
+def _term(term: Dict[str, Any]) -> Term:
+    return Term(
+        type=term.get("type"),
+        state=term.get("state"),
+        district=term.get("district"),
+        party=term.get("party"),
+        start=str(term["start"]) if term.get("start") else None,
+        end=str(term["end"]) if term.get("end") else None,
+    )
+
+
+def _record(person: Dict[str, Any]) -> Legislator:
+    ids = person.get("id", {})
+    name = person.get("name", {})
+    terms = person.get("terms", [])
+    last = terms[-1] if terms else {}
+    fec = ids.get("fec") or ()
+    return Legislator(
+        bioguide_id=ids.get("bioguide"),
+        first_name=name.get("first"),
+        last_name=name.get("last"),
+        party=last.get("party"),
+        state=last.get("state"),
+        district=last.get("district"),
+        term_type=last.get("type"),
+        first_term_start=str(terms[0]["start"]) if terms and terms[0].get("start") else None,
+        last_term_end=str(last["end"]) if last.get("end") else None,
+        fec_ids=(fec,) if isinstance(fec, str) else tuple(fec),
+        govtrack_id=ids.get("govtrack"),
+        icpsr_id=ids.get("icpsr"),
+        terms=tuple(_term(term) for term in terms),
+    )
+
+
+def parse(data: bytes) -> List[Legislator]:
+    """Parse a legislators YAML document into records."""
+    return [_record(person) for person in yaml.load(data, Loader=SafeLoader) or []]
+
+
+def load_legislators(path: Path, cache_dir: Optional[Path] = None) -> List[Legislator]:
+    """Return the records in the YAML file ``path``, using a snapshot when possible.
+
+    Snapshots live in ``cache_dir`` (``INTERIM_DIR/_snapshots`` by default)
+    and are named after the SHA-256 of the file, so an edited file is
+    parsed again while an unchanged one is only hashed and unpickled.
+    """
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()[:32]
+    cache_dir = cache_dir or (paths.INTERIM_DIR / "_snapshots")
+    snapshot = cache_dir / f"{path.stem}-v{SNAPSHOT_VERSION}-{digest}.pickle"
+    if snapshot.exists():
+        with snapshot.open("rb") as fh:
+            return [Legislator._make(row) for row in pickle.load(fh)]
+
+    records = parse(data)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{path.stem}-v*.pickle"):
+        stale.unlink()
+    tmp = snapshot.with_suffix(".tmp")
+    with tmp.open("wb") as fh:
+        pickle.dump([tuple(r) for r in records], fh, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp.replace(snapshot)
+    return records
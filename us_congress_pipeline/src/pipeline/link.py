@@ -1,31 +1,155 @@
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Dict
-
 import pandas as pd
 
 from . import paths
 
+LINK_COLUMNS = ["cycle", "bioguide_id", "cand_id", "method", "score"]
+
+# Columns of the FEC ``cn`` layout the fuzzy pass needs, renamed to the
+# legislator table's names.
+CANDIDATE_COLUMNS = {
+    "CAND_ID": "cand_id",
+    "CAND_NAME": "name",
+    "CAND_PTY_AFFILIATION": "party",
+    "CAND_OFFICE_ST": "state",
+    "CAND_OFFICE": "office",
+    "CAND_OFFICE_DISTRICT": "district",
+}
+PARTY_CODES = {"Democrat": "DEM", "Republican": "REP", "Independent": "IND", "DFL": "DEM"}
+
+# A fuzzy score is the weighted sum of the name similarity and whether party
+# and district agree; pairs scoring below the threshold are not linked.
+NAME_WEIGHT = 0.7
+PARTY_WEIGHT = 0.15
+DISTRICT_WEIGHT = 0.15
+FUZZY_THRESHOLD = 0.75
+
+
+def crosswalk_pairs() -> pd.DataFrame:
+    """Explode the ``;``-joined FEC ids in the crosswalk to (bioguide_id, cand_id) rows."""
+    leg = paths.read_table("legislators", columns=["bioguide_id"])
+    xwalk = paths.read_table("xwalk_ids", columns=["bioguide_id", "fec_candidate_ids"])
+    xwalk = xwalk[xwalk["bioguide_id"].isin(leg["bioguide_id"])].drop_duplicates("bioguide_id")
+    pairs = xwalk.assign(cand_id=xwalk["fec_candidate_ids"].str.split(";")).explode("cand_id")
+    pairs = pairs[pairs["cand_id"].notna() & (pairs["cand_id"] != "")]
+    return pairs[["bioguide_id", "cand_id"]].drop_duplicates().reset_index(drop=True)
+
+
+def _candidates(cycles: list[int], columns: list[str]) -> pd.DataFrame:
+    frames = [
+        paths.read_table(f"fec_candidates_{cycle}", columns=columns).assign(cycle=cycle)
+        for cycle in cycles
+    ]
+    if not frames:
+        return pd.DataFrame({**{c: pd.Series(dtype=str) for c in columns}, "cycle": pd.Series(dtype=int)})
+    return pd.concat(frames, ignore_index=True).drop_duplicates()
+
+
+def _normalize(names: pd.Series) -> pd.Series:
+    """Upper-case ASCII letters separated by single spaces."""
+    return (
+        names.fillna("").astype(str)
+        .str.normalize("NFKD").str.encode("ascii", "ignore").str.decode("ascii")
+        .str.upper().str.replace(r"[^A-Z ]+", " ", regex=True)
+        .str.split().str.join(" ")
+    )
+
+
+def _name_keys(last: pd.Series, first: pd.Series) -> pd.DataFrame:
+    last, first = _normalize(last), _normalize(first).str.split().str[0].fillna("")
+    return pd.DataFrame({
+        "name": (last + " " + first).str.strip(),
+        "last_key": last.str.replace(" ", "", regex=False).str[:4],
+    })
+
+
+def _trigram_similarity(left: pd.Series, right: pd.Series) -> pd.Series:
+    """Jaccard similarity of the character trigrams of ``left`` and ``right``, row by row.
+
+    Each distinct name is split into trigrams once; the overlap of every
+    pair is then counted with joins instead of comparing strings in Python.
+    """
+    names = pd.Series(pd.unique(pd.concat([left, right], ignore_index=True)))
+    grams = pd.DataFrame({
+        "name": names,
+        "gram": names.map(lambda s: list({f"  {s} "[i:i + 3] for i in range(len(s) + 1)})),
+    }).explode("gram")
+    sizes = grams.groupby("name").size()
+    pairs = pd.DataFrame({"left": left.to_numpy(), "right": right.to_numpy()})
+    hits = (
+        pairs.reset_index()
+        .merge(grams.rename(columns={"name": "left"}), on="left")
+        .merge(grams.rename(columns={"name": "right"}), on=["right", "gram"])
+    )
+    shared = hits.groupby("index").size().reindex(pairs.index, fill_value=0).to_numpy()
+    union = sizes.reindex(pairs["left"]).to_numpy() + sizes.reindex(pairs["right"]).to_numpy() - shared
+    return pd.Series(shared / union, index=left.index)
+
+
+def fuzzy_links(cycles: list[int], exclude: pd.DataFrame | None = None) -> pd.DataFrame:
+    """Propose links for legislators without FEC ids in the crosswalk.
+
+    Every term of a legislator (``legislator_terms``) is blocked on its
+    own (state, office, first four letters of the last name), and ``cn``
+    candidates are compared with a term only for cycles from two years
+    before it starts to its end, so members who changed seat or chamber are
+    matched under the office they held. ``exclude`` holds (cycle, cand_id) pairs that are
+    already linked. Each legislator gets at most one candidate per cycle and
+    vice versa, the best-scoring pair first.
+    """
+    cycles = [c for c in cycles if set(CANDIDATE_COLUMNS) <= set(paths.table_columns(f"fec_candidates_{c}"))]
+    if not cycles:
+        return pd.DataFrame(columns=LINK_COLUMNS)
+    leg = paths.read_table("legislators", columns=["bioguide_id", "first_name", "last_name"])
+    leg = leg[~leg["bioguide_id"].isin(crosswalk_pairs()["bioguide_id"])]
+    if leg.empty:
+        return pd.DataFrame(columns=LINK_COLUMNS)
+
+    leg = pd.concat([leg, _name_keys(leg["last_name"], leg["first_name"])], axis=1)
+    leg = leg.merge(paths.read_table("legislator_terms"), on="bioguide_id")
+    leg["party"] = leg["party"].map(lambda p: PARTY_CODES.get(p, str(p)[:3].upper()) if pd.notna(p) else None)
+    cand = _candidates(cycles, list(CANDIDATE_COLUMNS)).rename(columns=CANDIDATE_COLUMNS)
+    if exclude is not None and not exclude.empty:
+        linked = pd.MultiIndex.from_frame(exclude[["cycle", "cand_id"]])
+        cand = cand[~pd.MultiIndex.from_frame(cand[["cycle", "cand_id"]]).isin(linked)]
+    split = cand["name"].fillna("").str.split(",", n=1)
+    cand = pd.concat([cand.drop(columns="name"), _name_keys(split.str[0], split.str[1]).set_index(cand.index)], axis=1)
+    cand["party"] = cand["party"].replace(PARTY_CODES)
+    cand["district"] = pd.to_numeric(cand["district"], errors="coerce").astype("Int64")
+
+    pairs = leg.merge(cand, on=["state", "office", "last_key"], suffixes=("_leg", "_cand"))
+    in_office = (pairs["cycle"] >= pairs["first_year"] - 2) & (pairs["cycle"] <= pairs["last_year"])
+    pairs = pairs[in_office.fillna(True)].reset_index(drop=True)
+    if pairs.empty:
+        return pd.DataFrame(columns=LINK_COLUMNS)
+
+    same_party = (pairs["party_leg"] == pairs["party_cand"]).fillna(False)
+    same_district = ((pairs["office"] == "S") | (pairs["district_leg"] == pairs["district_cand"])).fillna(False)
+    pairs["score"] = (
+        NAME_WEIGHT * _trigram_similarity(pairs["name_leg"], pairs["name_cand"])
+        + PARTY_WEIGHT * same_party.astype(float)
+        + DISTRICT_WEIGHT * same_district.astype(float)
+    ).round(3)
+    best = (
+        pairs[pairs["score"] >= FUZZY_THRESHOLD]
+        .sort_values(["score", "cycle", "bioguide_id", "cand_id"], ascending=[False, True, True, True])
+        .drop_duplicates(["cycle", "bioguide_id"])
+        .drop_duplicates(["cycle", "cand_id"])
+    )
+    return best.assign(method="fuzzy")[LINK_COLUMNS]
+
 
 def link_legislators_candidates(cycles: list[int]) -> None:
-    leg = pd.read_csv(paths.INTERIM_DIR / "legislators.csv")
-    xwalk = pd.read_csv(paths.INTERIM_DIR / "xwalk_ids.csv")
-    links = []
-    for cycle in cycles:
-        fec = pd.read_csv(paths.INTERIM_DIR / f"fec_candidates_{cycle}.csv")
-        for _, row in leg.iterrows():
-            bioguide = row["bioguide_id"]
-            fec_ids = xwalk.loc[xwalk["bioguide_id"] == bioguide, "fec_candidate_ids"].fillna("").iloc[0]
-            fec_ids_list = [fid for fid in fec_ids.split(";") if fid]
-            matched = fec[fec["CAND_ID"].isin(fec_ids_list)]
-            if not matched.empty:
-                for fid in matched["CAND_ID"]:
-                    links.append({
-                        "cycle": cycle,
-                        "bioguide_id": bioguide,
-                        "cand_id": fid,
-                        "method": "yaml_direct",
-                        "score": 1.0,
-                    })
-    pd.DataFrame(links).to_csv(paths.INTERIM_DIR / "legislator_candidate_link.csv", index=False)
+    """Link legislators to candidates, by crosswalk id first and then by name.
+
+    All cycles' candidate files are joined against the exploded crosswalk in
+    a single hash join; legislators without crosswalk ids go through
+    :func:`fuzzy_links`.
+    """
+    direct = crosswalk_pairs().merge(_candidates(cycles, ["CAND_ID"]), left_on="cand_id", right_on="CAND_ID")
+    direct = direct.assign(method="yaml_direct", score=1.0)[LINK_COLUMNS]
+    fuzzy = fuzzy_links(cycles, exclude=direct)
+    links = pd.concat([direct, fuzzy], ignore_index=True) if not fuzzy.empty else direct
+    links = links.sort_values("cycle", kind="stable").astype({"cycle": int, "score": float})
+    paths.write_table(links.reset_index(drop=True), "legislator_candidate_link")
@@ -0,0 +1,96 @@
+"""Fingerprints of raw inputs and the interim outputs built from them.
+
+Each extract stage keeps a manifest under ``INTERIM_DIR/_manifest`` that
+maps every raw file it read to its size, mtime, content hash and the
+interim tables or partitions it produced. A later run only reprocesses
+files whose fingerprint changed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import paths
+
+CHUNK_SIZE = 1 << 20
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        while chunk := fh.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Manifest:
+    """Input fingerprints of one extract stage.
+
+    Entries are keyed by the raw file path and hold ``size``, ``mtime_ns``,
+    ``sha256`` and ``outputs``, the interim table or ``table/partition``
+    names produced from the file.
+    """
+
+    def __init__(self, path: Path, entries: Optional[Dict[str, dict]] = None) -> None:
+        self.path = path
+        self.entries: Dict[str, dict] = entries or {}
+        self._hashes: Dict[str, str] = {}
+
+    @classmethod
+    def load(cls, stage: str) -> "Manifest":
+        path = paths.INTERIM_DIR / "_manifest" / f"{stage}.json"
+        entries = json.loads(path.read_text()) if path.exists() else {}
+        return cls(path, entries)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self.entries, indent=1, sort_keys=True))
+        tmp.replace(self.path)
+
+    def _hash(self, path: Path) -> str:
+        key = str(path)
+        if key not in self._hashes:
+            self._hashes[key] = file_hash(path)
+        return self._hashes[key]
+
+    def changed(self, path: Path) -> bool:
+        """Whether ``path`` is new or its content differs from the recorded one.
+
+        The file is only hashed when its size or mtime moved; a touched but
+        identical file is not reported as changed.
+        """
+        entry = self.entries.get(str(path))
+        if entry is None:
+            return True
+        stat = path.stat()
+        if (stat.st_size, stat.st_mtime_ns) == (entry["size"], entry["mtime_ns"]):
+            return False
+        if stat.st_size == entry["size"] and self._hash(path) == entry["sha256"]:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            return False
+        return True
+
+    def outputs(self, path: str | Path) -> List[str]:
+        entry = self.entries.get(str(path))
+        return list(entry["outputs"]) if entry else []
+
+    def record(self, path: Path, outputs: List[str]) -> None:
+        stat = path.stat()
+        self.entries[str(path)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": self._hash(path),
+            "outputs": sorted(outputs),
+        }
+
+    def forget(self, path: str | Path) -> None:
+        self.entries.pop(str(path), None)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def files(self) -> List[str]:
+        return sorted(self.entries)
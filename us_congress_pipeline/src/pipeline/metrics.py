@@ -1,50 +1,131 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from . import paths
 
 
+# Receipt bands as (column, upper bound in dollars); amounts above the last
+# bound land in the last band.
+DOLLAR_BANDS = [("small_dollar", 200.0), ("mid_dollar", 2000.0), ("large_dollar", None)]
+
+
+def _receipt_bands(cycle: int, batch_size: int = 1 << 17) -> pd.DataFrame:
+    """Sum each candidate's individual receipts per dollar band in one pass.
+
+    The contributions table is streamed ``batch_size`` rows at a time and
+    only running per-candidate totals are kept, so memory grows with the
+    number of candidates rather than the number of contributions.
+    """
+    bounds = [upper for _, upper in DOLLAR_BANDS[:-1]]
+    columns = [name for name, _ in DOLLAR_BANDS] + ["contributions"]
+    totals = pd.DataFrame(columns=columns, dtype=float)
+    for batch in paths.iter_batches(f"fec_indiv_contrib_{cycle}", ["CAND_ID", "TRANSACTION_AMT"], batch_size):
+        amount = pd.to_numeric(batch.column("TRANSACTION_AMT").to_pandas(), errors="coerce").to_numpy(float)
+        known = ~np.isnan(amount)
+        band = np.searchsorted(bounds, amount, side="left")
+        part = pd.DataFrame(
+            {name: np.where(known & (band == i), amount, 0.0) for i, (name, _) in enumerate(DOLLAR_BANDS)}
+        )
+        part["contributions"] = known.astype(float)
+        part = part.groupby(batch.column("CAND_ID").to_pandas().to_numpy()).sum()
+        totals = part if totals.empty else totals.add(part, fill_value=0)
+    totals.index.name = "CAND_ID"
+    return totals
+
+
 def _finance_summary(cycle: int) -> Path:
-    totals = pd.read_csv(paths.INTERIM_DIR / f"fec_candidate_totals_{cycle}.csv")
-    receipts = pd.read_csv(paths.INTERIM_DIR / f"fec_indiv_contrib_{cycle}.csv")
-    receipts["TRANSACTION_AMT"] = receipts["TRANSACTION_AMT"].astype(float)
-    small = receipts[receipts["TRANSACTION_AMT"] <= 200].groupby("CAND_ID")["TRANSACTION_AMT"].sum()
-    out = totals[["CAND_ID", "TOTAL_RECEIPTS"]].merge(
-        small, left_on="CAND_ID", right_index=True, how="left"
-    )
-    out.rename(
-        columns={
-            "CAND_ID": "cand_id",
-            "TOTAL_RECEIPTS": "total_receipts",
-            "TRANSACTION_AMT": "small_dollar",
-        },
-        inplace=True,
-    )
-    out["small_dollar"] = out["small_dollar"].fillna(0)
+    totals = paths.read_table(f"fec_candidate_totals_{cycle}", columns=["CAND_ID", "TOTAL_RECEIPTS"])
+    totals["TOTAL_RECEIPTS"] = pd.to_numeric(totals["TOTAL_RECEIPTS"], errors="coerce")
+    out = totals.merge(_receipt_bands(cycle), left_on="CAND_ID", right_index=True, how="left")
+    out.rename(columns={"CAND_ID": "cand_id", "TOTAL_RECEIPTS": "total_receipts"}, inplace=True)
+    bands = [name for name, _ in DOLLAR_BANDS] + ["contributions"]
+    out[bands] = out[bands].fillna(0)
+    out["contributions"] = out["contributions"].astype(int)
     out_path = paths.OUTPUT_DIR / f"candidate_finance_summary_{cycle}.csv"
     out.to_csv(out_path, index=False)
     return out_path
 
 
-def _vote_summary(congress: int) -> Path:
-    votes = pd.read_csv(paths.INTERIM_DIR / "votes.csv")
-    records = pd.read_csv(paths.INTERIM_DIR / "vote_records.csv")
-    leg = pd.read_csv(paths.INTERIM_DIR / "legislators.csv")
-    total_votes = votes.shape[0]
-    records = records.merge(leg[["bioguide_id", "party"]], on="bioguide_id", how="left")
-    party_majority = records.groupby(["vote_id", "party"])["position"].agg(lambda x: x.value_counts().idxmax()).reset_index()
-    records = records.merge(party_majority, on=["vote_id", "party"], suffixes=("", "_party"))
-    records["unity"] = records["position"] == records["position_party"]
-    summary = records.groupby("bioguide_id").agg(
-        participated=("vote_id", "count"),
-        unity=("unity", "mean"),
+VoteTables = Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]
+
+# Tally columns in category-code order; other spellings are folded in first.
+POSITIONS = {"Yea": "yea", "Nay": "nay", "Present": "present", "Not Voting": "not_voting"}
+POSITION_ALIASES = {"Aye": "Yea", "Yes": "Yea", "No": "Nay"}
+
+
+def _load_vote_tables() -> VoteTables:
+    """Read the columns the vote summaries need from the interim tables."""
+    votes = paths.read_table("votes", columns=["vote_id", "congress"])
+    records = paths.read_table("vote_records", columns=["vote_id", "bioguide_id", "position"])
+    leg = paths.read_table("legislators", columns=["bioguide_id", "party"])
+    return votes, records, leg
+
+
+def _congress_records(congress: int, tables: VoteTables) -> Tuple[pd.DataFrame, int]:
+    """Records of the congress's roll calls with party and categorical position."""
+    votes, records, leg = tables
+    vote_ids = votes.loc[votes["congress"] == congress, "vote_id"]
+    records = records[records["vote_id"].isin(vote_ids)].merge(leg, on="bioguide_id", how="left")
+    records["position"] = pd.Categorical(records["position"].replace(POSITION_ALIASES), categories=list(POSITIONS))
+    return records, len(vote_ids)
+
+
+def party_tally(records: pd.DataFrame) -> pd.DataFrame:
+    """Count each party's positions on each roll call.
+
+    One row per (vote_id, party) with a count column per position and the
+    party's position: ``Yea`` or ``Nay``, whichever has more votes, and
+    missing when they tie (including when nobody voted either way).
+    """
+    records = records[records["party"].notna()]
+    grouped = records.groupby(["vote_id", "party"], sort=True)
+    keys = grouped.size().index
+    group = grouped.ngroup().to_numpy()
+    codes = records["position"].cat.codes.to_numpy()
+    known = codes >= 0
+    counts = np.bincount(
+        group[known] * len(POSITIONS) + codes[known], minlength=len(keys) * len(POSITIONS)
+    ).reshape(len(keys), len(POSITIONS))
+    tally = pd.DataFrame(counts, columns=list(POSITIONS.values()), index=keys).reset_index()
+    tally["party_position"] = np.select(
+        [tally["yea"] > tally["nay"], tally["nay"] > tally["yea"]], ["Yea", "Nay"], None
     )
-    summary["participation_rate"] = summary["participated"] / total_votes
-    out = summary.reset_index()[["bioguide_id", "participation_rate", "unity"]]
+    return tally
+
+
+def _vote_summary(congress: int, tables: Optional[VoteTables] = None) -> Path:
+    """Participation, party unity and defections of each member in ``congress``.
+
+    The party tally is also written to the ``vote_party_tally_{congress}``
+    interim table. Unity and defections only count Yea/Nay votes on roll
+    calls where the member's party took a position.
+    """
+    records, total_votes = _congress_records(congress, tables or _load_vote_tables())
+    tally = party_tally(records)
+    paths.write_table(tally, f"vote_party_tally_{congress}")
+
+    records = records.merge(tally[["vote_id", "party", "party_position"]], on=["vote_id", "party"], how="left")
+    position = records["position"].astype("string")
+    party_vote = position.isin(["Yea", "Nay"]) & records["party_position"].notna()
+    flags = pd.DataFrame({
+        "bioguide_id": records["bioguide_id"],
+        "cast": position.isin(["Yea", "Nay", "Present"]),
+        "party_votes": party_vote,
+        "defections": party_vote & (position != records["party_position"]).fillna(False),
+    })
+    summary = flags.groupby("bioguide_id").sum()
+    out = pd.DataFrame({
+        "participation_rate": summary["cast"] / total_votes,
+        "unity": 1 - summary["defections"] / summary["party_votes"],
+        "party_votes": summary["party_votes"],
+        "defections": summary["defections"],
+        "defection_rate": summary["defections"] / summary["party_votes"],
+    }).reset_index()
     out_path = paths.OUTPUT_DIR / f"incumbent_vote_summary_{congress}.csv"
     out.to_csv(out_path, index=False)
     return out_path
@@ -53,7 +134,7 @@ def _vote_summary(congress: int) -> Path:
 def _alignment(cycle: int, congress: int) -> Path:
     finance = pd.read_csv(paths.OUTPUT_DIR / f"candidate_finance_summary_{cycle}.csv")
     votes = pd.read_csv(paths.OUTPUT_DIR / f"incumbent_vote_summary_{congress}.csv")
-    links = pd.read_csv(paths.INTERIM_DIR / "legislator_candidate_link.csv")
+    links = paths.read_table("legislator_candidate_link")
     df = links.merge(finance, on="cand_id", how="left").merge(votes, on="bioguide_id", how="left")
     df["flag"] = (df["total_receipts"] > 100000) & (df["unity"] < 0.5)
     out_path = paths.OUTPUT_DIR / f"alignment_flags_{cycle}_{congress}.csv"
@@ -61,12 +142,29 @@ def _alignment(cycle: int, congress: int) -> Path:
     return out_path
 
 
-def build_metrics(cycles: Iterable[int], congresses: Iterable[int]) -> None:
+ENGINES = ("pandas", "duckdb")
+
+
+def build_metrics(cycles: Iterable[int], congresses: Iterable[int], engine: str = "pandas") -> None:
+    """Write the finance, vote and alignment summaries to ``OUTPUT_DIR``.
+
+    ``engine="duckdb"`` runs the same summaries out of core with
+    :mod:`pipeline.metrics_duckdb`; the outputs are identical.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"unknown metrics engine: {engine}")
+    if engine == "duckdb":
+        from . import metrics_duckdb
+
+        metrics_duckdb.build_metrics(cycles, congresses)
+        return
     paths.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     for cycle in cycles:
         _finance_summary(cycle)
+    congresses = list(congresses)
+    tables = _load_vote_tables() if congresses else None
     for congress in congresses:
-        _vote_summary(congress)
+        _vote_summary(congress, tables)
     for cycle in cycles:
         for congress in congresses:
             _alignment(cycle, congress)
@@ -0,0 +1,170 @@
+"""DuckDB implementation of :mod:`pipeline.metrics`.
+
+The same summaries as the pandas engine, expressed as SQL over the interim
+Parquet tables. DuckDB scans only the referenced columns, pushes filters
+into the scan, runs on all cores and spills to ``WAREHOUSE_DIR/duckdb_tmp``
+when an aggregation does not fit in memory, so full-cycle contribution
+files never have to be loaded as a whole.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+import duckdb
+
+from . import metrics, paths
+
+
+def _quote(value: object) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _scan(name: str) -> str:
+    source = paths.table_source(name)
+    if source.is_dir():
+        return f"read_parquet({_quote(source / '*.parquet')}, union_by_name = true)"
+    return f"read_parquet({_quote(source)})"
+
+
+def connect(memory_limit: Optional[str] = None, threads: Optional[int] = None) -> duckdb.DuckDBPyConnection:
+    """Return an in-memory connection configured to spill to disk."""
+    con = duckdb.connect()
+    tmp = paths.WAREHOUSE_DIR / "duckdb_tmp"
+    tmp.mkdir(parents=True, exist_ok=True)
+    con.execute(f"SET temp_directory = {_quote(tmp)}")
+    con.execute("SET preserve_insertion_order = true")
+    if memory_limit:
+        con.execute(f"SET memory_limit = {_quote(memory_limit)}")
+    if threads:
+        con.execute(f"SET threads = {int(threads)}")
+    return con
+
+
+def _copy(con: duckdb.DuckDBPyConnection, query: str, out_path: Path) -> Path:
+    con.execute(f"COPY ({query}) TO {_quote(out_path)} (HEADER, DELIMITER ',')")
+    return out_path
+
+
+def _finance_summary(con: duckdb.DuckDBPyConnection, cycle: int) -> Path:
+    bands, lower = [], None
+    for name, upper in metrics.DOLLAR_BANDS:
+        conds = ["amount IS NOT NULL"]
+        if lower is not None:
+            conds.append(f"amount > {lower}")
+        if upper is not None:
+            conds.append(f"amount <= {upper}")
+        bands.append(f"COALESCE(SUM(amount) FILTER (WHERE {' AND '.join(conds)}), 0) AS {name}")
+        lower = upper
+    query = f"""
+        WITH totals AS (
+            SELECT row_number() OVER () AS rn, CAND_ID,
+                   TRY_CAST(TOTAL_RECEIPTS AS DOUBLE) AS total_receipts
+            FROM {_scan(f"fec_candidate_totals_{cycle}")}
+        ), receipts AS (
+            SELECT CAND_ID, TRY_CAST(TRANSACTION_AMT AS DOUBLE) AS amount
+            FROM {_scan(f"fec_indiv_contrib_{cycle}")}
+        ), bands AS (
+            SELECT CAND_ID, {", ".join(bands)},
+                   COUNT(amount) AS contributions
+            FROM receipts
+            GROUP BY CAND_ID
+        )
+        SELECT t.CAND_ID AS cand_id, t.total_receipts,
+               {", ".join(f"COALESCE(b.{name}, 0) AS {name}" for name, _ in metrics.DOLLAR_BANDS)},
+               COALESCE(b.contributions, 0) AS contributions
+        FROM totals t LEFT JOIN bands b ON t.CAND_ID = b.CAND_ID
+        ORDER BY t.rn
+    """
+    return _copy(con, query, paths.OUTPUT_DIR / f"candidate_finance_summary_{cycle}.csv")
+
+
+def _vote_summary(con: duckdb.DuckDBPyConnection, congress: int) -> Path:
+    """See :func:`pipeline.metrics._vote_summary`; writes the same tally table."""
+    aliases = " ".join(f"WHEN {_quote(k)} THEN {_quote(v)}" for k, v in metrics.POSITION_ALIASES.items())
+    counts = ", ".join(
+        f"COUNT(*) FILTER (WHERE position = {_quote(pos)}) AS {col}" for pos, col in metrics.POSITIONS.items()
+    )
+    con.execute(f"""
+        CREATE OR REPLACE TEMP VIEW congress_records AS
+        WITH votes AS (
+            SELECT vote_id FROM {_scan("votes")} WHERE congress = {int(congress)}
+        )
+        SELECT r.vote_id, r.bioguide_id, l.party,
+               CASE r.position {aliases} ELSE r.position END AS position
+        FROM {_scan("vote_records")} r
+        SEMI JOIN votes v ON r.vote_id = v.vote_id
+        LEFT JOIN {_scan("legislators")} l ON r.bioguide_id = l.bioguide_id
+    """)
+    tally_path = paths.table_path(f"vote_party_tally_{congress}")
+    tally_path.parent.mkdir(parents=True, exist_ok=True)
+    con.execute(f"""
+        COPY (
+            SELECT *, CASE WHEN yea > nay THEN 'Yea' WHEN nay > yea THEN 'Nay' END AS party_position
+            FROM (
+                SELECT vote_id, party, {counts}
+                FROM congress_records
+                WHERE party IS NOT NULL
+                GROUP BY vote_id, party
+            )
+            ORDER BY vote_id, party
+        ) TO {_quote(tally_path)} (FORMAT parquet, COMPRESSION zstd)
+    """)
+    query = f"""
+        WITH flags AS (
+            SELECT r.bioguide_id,
+                   r.position IN ('Yea', 'Nay', 'Present') AS cast_vote,
+                   r.position IN ('Yea', 'Nay') AND t.party_position IS NOT NULL AS party_vote,
+                   COALESCE(r.position <> t.party_position, false) AS differs
+            FROM congress_records r
+            LEFT JOIN read_parquet({_quote(tally_path)}) t ON r.vote_id = t.vote_id AND r.party = t.party
+        ), summary AS (
+            SELECT bioguide_id,
+                   COUNT(*) FILTER (WHERE cast_vote) AS cast_votes,
+                   COUNT(*) FILTER (WHERE party_vote) AS party_votes,
+                   COUNT(*) FILTER (WHERE party_vote AND differs) AS defections
+            FROM flags
+            GROUP BY bioguide_id
+        )
+        SELECT bioguide_id,
+               cast_votes / (SELECT COUNT(*) FROM {_scan("votes")} WHERE congress = {int(congress)})
+                   AS participation_rate,
+               1 - defections / NULLIF(party_votes, 0) AS unity,
+               party_votes,
+               defections,
+               defections / NULLIF(party_votes, 0) AS defection_rate
+        FROM summary
+        ORDER BY bioguide_id
+    """
+    return _copy(con, query, paths.OUTPUT_DIR / f"incumbent_vote_summary_{congress}.csv")
+
+
+def _alignment(con: duckdb.DuckDBPyConnection, cycle: int, congress: int) -> Path:
+    finance = _quote(paths.OUTPUT_DIR / f"candidate_finance_summary_{cycle}.csv")
+    votes = _quote(paths.OUTPUT_DIR / f"incumbent_vote_summary_{congress}.csv")
+    query = f"""
+        WITH links AS (
+            SELECT row_number() OVER () AS rn, * FROM {_scan("legislator_candidate_link")}
+        )
+        SELECT l.* EXCLUDE (rn), f.* EXCLUDE (cand_id), v.* EXCLUDE (bioguide_id),
+               COALESCE(f.total_receipts > 100000 AND v.unity < 0.5, false) AS flag
+        FROM links l
+        LEFT JOIN read_csv_auto({finance}) f ON l.cand_id = f.cand_id
+        LEFT JOIN read_csv_auto({votes}) v ON l.bioguide_id = v.bioguide_id
+        ORDER BY l.rn
+    """
+    return _copy(con, query, paths.OUTPUT_DIR / f"alignment_flags_{cycle}_{congress}.csv")
+
+
+def build_metrics(cycles: Iterable[int], congresses: Iterable[int],
+                  con: Optional[duckdb.DuckDBPyConnection] = None) -> None:
+    cycles, congresses = list(cycles), list(congresses)
+    paths.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    con = con or connect()
+    for cycle in cycles:
+        _finance_summary(con, cycle)
+    for congress in congresses:
+        _vote_summary(con, congress)
+    for cycle in cycles:
+        for congress in congresses:
+            _alignment(con, cycle, congress)
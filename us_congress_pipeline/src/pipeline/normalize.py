@@ -1,34 +1,234 @@
+"""Bulk load of the interim tables into the SQLite warehouse.
+
+Each table is streamed from Parquet into a temporary staging table with
+large ``executemany`` batches and then merged into its target with
+``INSERT ... ON CONFLICT DO UPDATE`` on the table's natural key, one
+transaction per table, so loading the same interim data twice leaves the
+database unchanged. Secondary indexes are dropped before the load and
+rebuilt once the data is in.
+"""
 from __future__ import annotations
 
+import time
 from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
 
-import pandas as pd
-from sqlalchemy import create_engine
+import pyarrow as pa
+from sqlalchemy import Column, Float, Index, Integer, MetaData, String, Table, create_engine, event
+from sqlalchemy.engine import Connection, Engine
 
 from . import paths
+from .extract_fec import FEC_FILES
 from .sql_models import Base
 
+# Interim tables with a model in sql_models, and the table they load into.
+MODEL_TABLES = {
+    "legislators": "legislators",
+    "votes": "votes",
+    "vote_records": "vote_records",
+    "legislator_candidate_link": "link_leg_cand",
+}
 
-def load_sqlite(db_path: Path | None = None) -> None:
-    db_path = db_path or (paths.WAREHOUSE_DIR / "congress.db")
+# Natural keys and secondary indexes of the FEC bulk files, by FEC_FILES key.
+# Tables lacking their key columns (e.g. header-style samples) are replaced
+# wholesale instead of merged.
+FEC_KEYS = {
+    "candidates": ["CAND_ID"],
+    "committees": ["CMTE_ID"],
+    "candidate_totals": ["LINKAGE_ID"],
+    "committee_totals": ["CMTE_ID"],
+    "indiv_contrib": ["SUB_ID"],
+    "disbursements": ["SUB_ID"],
+}
+FEC_INDEXES = {
+    "committees": [["CAND_ID"]],
+    "candidate_totals": [["CAND_ID"]],
+    "indiv_contrib": [["CMTE_ID"]],
+    "disbursements": [["CMTE_ID"]],
+}
+
+# Rows per executemany call.
+BATCH_SIZE = 50_000
+# Set on every warehouse connection. With synchronous off a crash can lose
+# the last transactions but the load is idempotent, so rerunning it repairs
+# the database.
+PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "OFF",
+    "cache_size": -(512 << 10),  # KiB, i.e. 512 MiB
+    "temp_store": "MEMORY",
+}
+
+
+class LoadStats(NamedTuple):
+    table: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else float("inf")
+
+
+def _ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def connect(db_path: Path) -> Engine:
+    """Return an engine for ``db_path`` whose connections use :data:`PRAGMAS`."""
     engine = create_engine(f"sqlite:///{db_path}")
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_con, _record) -> None:
+        for name, value in PRAGMAS.items():
+            dbapi_con.execute(f"PRAGMA {name} = {value}")
+
+    return engine
+
+
+def _fec_key(name: str) -> Optional[str]:
+    prefix = name.rsplit("_", 1)[0]
+    for key, template in FEC_FILES.items():
+        if template.rsplit("_", 1)[0] == prefix:
+            return key
+    return None
+
+
+def _sql_type(typ: pa.DataType):
+    if pa.types.is_integer(typ):
+        return Integer
+    if pa.types.is_floating(typ):
+        return Float
+    return String
+
+
+def _fec_table(name: str, metadata: MetaData) -> Table:
+    """Describe an FEC interim table, which has no model, from its Parquet schema."""
+    schema = paths.table_schema(name)
+    key = _fec_key(name)
+    indexes = []
+    if set(FEC_KEYS.get(key, [])) <= set(schema.names):
+        indexes.append(Index(f"uq_{name}", *FEC_KEYS[key], unique=True))
+    for cols in FEC_INDEXES.get(key, []):
+        if set(cols) <= set(schema.names):
+            indexes.append(Index(f"ix_{name}_{'_'.join(cols).lower()}", *cols))
+    return Table(name, metadata, *(Column(f.name, _sql_type(f.type)) for f in schema), *indexes)
+
+
+def _conflict_key(table: Table, columns: List[str]) -> List[str]:
+    """The unique index or natural primary key the merge upserts on, if loaded."""
+    keys = [[c.name for c in index.columns] for index in table.indexes if index.unique]
+    keys.append([c.name for c in table.primary_key.columns])
+    for key in keys:
+        if key and set(key) <= set(columns):
+            return key
+    return []
+
+
+def _rows(batch: pa.RecordBatch) -> List[tuple]:
+    # sqlite3's date adapters are deprecated; dates are stored as ISO text.
+    columns = [col.cast(pa.string()) if pa.types.is_temporal(col.type) else col for col in batch.columns]
+    return list(zip(*(col.to_pylist() for col in columns)))
+
+
+def _table_columns(conn: Connection, table: Table) -> List[str]:
+    """Columns of ``table`` as it exists in the database, which may predate the current schema."""
+    return [row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({_ident(table.name)})")]
+
+
+def _index_exists(conn: Connection, index: Index) -> bool:
+    return conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (index.name,)
+    ).first() is not None
+
+
+def _add_unique_index(conn: Connection, index: Index) -> None:
+    """Create ``index`` after dropping duplicate keys, keeping the most recently inserted row.
+
+    Warehouses filled by the old append-only load hold duplicates that
+    would make ``CREATE UNIQUE INDEX`` fail.
+    """
+    if _index_exists(conn, index):
+        return
+    target = _ident(index.table.name)
+    key = ", ".join(_ident(c.name) for c in index.columns)
+    conn.exec_driver_sql(
+        f"DELETE FROM {target} WHERE rowid NOT IN (SELECT MAX(rowid) FROM {target} GROUP BY {key})"
+    )
+    index.create(conn)
+
+
+def _load_table(conn: Connection, name: str, table: Table, batch_size: int) -> int:
+    existing = set(_table_columns(conn, table))
+    columns = [c for c in paths.table_columns(name) if c in existing]
+    target, stage = _ident(table.name), _ident(f"stage_{table.name}")
+    cols = ", ".join(_ident(c) for c in columns)
+
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS temp.{stage}")
+    conn.exec_driver_sql(f"CREATE TEMP TABLE {stage} AS SELECT {cols} FROM {target} WHERE 0")
+    insert = f"INSERT INTO temp.{stage} VALUES ({', '.join('?' * len(columns))})"
+    rows = 0
+    for batch in paths.iter_batches(name, columns, batch_size):
+        if batch.num_rows:
+            conn.exec_driver_sql(insert, _rows(batch))
+            rows += batch.num_rows
+
+    key = _conflict_key(table, columns)
+    if key:
+        updates = [c for c in columns if c not in key]
+        action = (
+            "DO UPDATE SET " + ", ".join(f"{_ident(c)} = excluded.{_ident(c)}" for c in updates)
+            if updates else "DO NOTHING"
+        )
+        # ``WHERE true`` keeps SQLite from parsing ON CONFLICT as a join constraint.
+        conn.exec_driver_sql(
+            f"INSERT INTO {target} ({cols}) SELECT {cols} FROM temp.{stage} WHERE true "
+            f"ON CONFLICT ({', '.join(_ident(c) for c in key)}) {action}"
+        )
+    else:
+        conn.exec_driver_sql(f"DELETE FROM {target}")
+        conn.exec_driver_sql(f"INSERT INTO {target} ({cols}) SELECT {cols} FROM temp.{stage}")
+    conn.exec_driver_sql(f"DROP TABLE temp.{stage}")
+    return rows
+
+
+def load_sqlite(db_path: Path | None = None, batch_size: int = BATCH_SIZE) -> List[LoadStats]:
+    """Upsert every interim table into the warehouse and return per-table load stats.
+
+    Model tables merge on their unique index or primary key and FEC tables
+    on the ids in :data:`FEC_KEYS`; only columns the target table has are
+    loaded.
+    """
+    db_path = db_path or (paths.WAREHOUSE_DIR / "congress.db")
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    engine = connect(db_path)
     Base.metadata.create_all(engine)
-    # load CSVs if present
-    csv_map = {
-        "legislators.csv": "legislators",
-        "votes.csv": "votes",
-        "vote_records.csv": "vote_records",
-        # FEC
+
+    fec_metadata = MetaData()
+    tables: Dict[str, Table] = {
+        name: Base.metadata.tables[target] for name, target in MODEL_TABLES.items()
     }
-    for name, table in csv_map.items():
-        fpath = paths.INTERIM_DIR / name
-        if fpath.exists():
-            df = pd.read_csv(fpath)
-            df.to_sql(table, engine, if_exists="append", index=False)
-    for fpath in paths.INTERIM_DIR.glob("fec_*_*.csv"):
-        table = fpath.stem
-        df = pd.read_csv(fpath)
-        df.to_sql(table, engine, if_exists="append", index=False)
-    link_path = paths.INTERIM_DIR / "legislator_candidate_link.csv"
-    if link_path.exists():
-        pd.read_csv(link_path).to_sql("link_leg_cand", engine, if_exists="append", index=False)
+    tables.update({name: _fec_table(name, fec_metadata) for name in paths.table_names("fec_*_*")})
+
+    stats = []
+    for name, table in tables.items():
+        if not paths.table_exists(name):
+            continue
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            table.create(conn, checkfirst=True)
+            # A table created by an earlier schema may lack some indexed columns.
+            existing = set(_table_columns(conn, table))
+            indexes = [index for index in table.indexes if {c.name for c in index.columns} <= existing]
+            secondary = [index for index in indexes if not index.unique]
+            for index in indexes:
+                if index.unique:
+                    _add_unique_index(conn, index)
+            for index in secondary:
+                index.drop(conn, checkfirst=True)
+            rows = _load_table(conn, name, table, batch_size)
+            for index in secondary:
+                index.create(conn)
+        stats.append(LoadStats(table.name, rows, time.perf_counter() - start))
+    engine.dispose()
+    return stats
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
 
 ROOT: Path = Path(__file__).resolve().parents[2]
@@ -15,3 +23,113 @@ def init_dirs() -> None:
     """Create project directories."""
     for p in [RAW_DIR, INTERIM_DIR, WAREHOUSE_DIR, OUTPUT_DIR]:
         p.mkdir(parents=True, exist_ok=True)
+
+
+def table_path(name: str) -> Path:
+    """Location of the interim table ``name`` when stored as a single file."""
+    return INTERIM_DIR / f"{name}.parquet"
+
+
+def partition_path(name: str, part: str) -> Path:
+    """Location of partition ``part`` of a partitioned interim table."""
+    return INTERIM_DIR / name / f"{part}.parquet"
+
+
+def table_source(name: str) -> Path:
+    """The file, or for partitioned tables the directory, holding ``name``."""
+    directory = INTERIM_DIR / name
+    return directory if directory.is_dir() else table_path(name)
+
+
+def table_exists(name: str) -> bool:
+    source = table_source(name)
+    return source.exists() and (source.is_file() or any(source.glob("*.parquet")))
+
+
+def table_schema(name: str) -> pa.Schema:
+    """Schema of an interim table, read from its footer without loading any data."""
+    return ds.dataset(table_source(name), format="parquet").schema
+
+
+def table_columns(name: str) -> List[str]:
+    """Column names of an interim table, read from its footer."""
+    return table_schema(name).names
+
+
+def table_names(pattern: str = "*") -> List[str]:
+    """Names of the interim tables matching a glob ``pattern``."""
+    names = {p.stem for p in INTERIM_DIR.glob(f"{pattern}.parquet")}
+    names.update(p.name for p in INTERIM_DIR.glob(pattern) if p.is_dir() and not p.name.startswith("_"))
+    return sorted(names)
+
+
+def _to_arrow(data: pd.DataFrame | pa.Table, schema: Optional[pa.Schema] = None) -> pa.Table:
+    if isinstance(data, pa.Table):
+        return data.cast(schema) if schema is not None else data
+    return pa.Table.from_pandas(data, schema=schema, preserve_index=False)
+
+
+def write_table(data: pd.DataFrame | pa.Table, name: str, schema: Optional[pa.Schema] = None) -> Path:
+    """Write an interim table as zstd-compressed Parquet, keeping column types.
+
+    Replaces the whole table, including any partitions.
+    """
+    path = table_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(_to_arrow(data, schema), path, compression="zstd")
+    if (INTERIM_DIR / name).is_dir():
+        shutil.rmtree(INTERIM_DIR / name)
+    return path
+
+
+def write_partition(data: pd.DataFrame | pa.Table, name: str, part: str,
+                    schema: Optional[pa.Schema] = None) -> Path:
+    """Write or replace one partition of ``name``, leaving the others alone.
+
+    Pass the table's ``schema`` so that every partition stores the same
+    column types. A single-file copy of the table is removed.
+    """
+    path = partition_path(name, part)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".parquet.tmp")
+    pq.write_table(_to_arrow(data, schema), tmp, compression="zstd")
+    tmp.replace(path)
+    table_path(name).unlink(missing_ok=True)
+    return path
+
+
+def drop_partition(name: str, part: str) -> None:
+    partition_path(name, part).unlink(missing_ok=True)
+
+
+def partitions(name: str) -> List[str]:
+    return sorted(p.stem for p in (INTERIM_DIR / name).glob("*.parquet"))
+
+
+def read_arrow(name: str, columns: Optional[Iterable[str]] = None, filters=None) -> pa.Table:
+    """Memory-map an interim table, reading only ``columns`` and rows matching ``filters``."""
+    return pq.read_table(
+        table_source(name),
+        columns=list(columns) if columns is not None else None,
+        filters=filters,
+        memory_map=True,
+    )
+
+
+def iter_batches(name: str, columns: Optional[Iterable[str]] = None,
+                 batch_size: int = 1 << 17) -> Iterator[pa.RecordBatch]:
+    """Stream an interim table in record batches of at most ``batch_size`` rows."""
+    dataset = ds.dataset(table_source(name), format="parquet")
+    yield from dataset.to_batches(columns=list(columns) if columns is not None else None, batch_size=batch_size)
+
+
+def read_table(name: str, columns: Optional[Iterable[str]] = None, filters=None) -> pd.DataFrame:
+    """Read an interim table into pandas; see :func:`read_arrow`."""
+    return read_arrow(name, columns, filters).to_pandas()
+
+
+def export_csv(name: str, out_dir: Path) -> Path:
+    """Write an interim table to ``out_dir`` as CSV."""
+    out = Path(out_dir) / f"{name}.csv"
+    pacsv.write_csv(read_arrow(name), out)
+    return out
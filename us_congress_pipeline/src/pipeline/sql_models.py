@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Column, Float, Integer, String, Date, ForeignKey
+from sqlalchemy import Column, Float, Integer, String, Date, ForeignKey, Index
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -37,6 +37,7 @@ class Vote(Base):
     question = Column(String)
     result = Column(String)
     bill_id = Column(String)
+    __table_args__ = (Index("ix_votes_congress", "congress"),)
     records = relationship("VoteRecord", back_populates="vote")
 
 
@@ -46,6 +47,10 @@ class VoteRecord(Base):
     vote_id = Column(String, ForeignKey("votes.vote_id"))
     bioguide_id = Column(String)
     position = Column(String)
+    __table_args__ = (
+        Index("uq_vote_records_vote_bioguide", "vote_id", "bioguide_id", unique=True),
+        Index("ix_vote_records_bioguide_id", "bioguide_id"),
+    )
     vote = relationship("Vote", back_populates="records")
 
 
@@ -82,3 +87,7 @@ class LinkLegislatorCandidate(Base):
     cand_id = Column(String)
     method = Column(String)
     score = Column(Float)
+    __table_args__ = (
+        Index("uq_link_leg_cand", "cycle", "bioguide_id", "cand_id", unique=True),
+        Index("ix_link_leg_cand_cand_id", "cand_id"),
+    )
@@ -0,0 +1,124 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from pipeline import download
+
+FILES = {"/a.zip": bytes(range(256)) * 4000, "/b.zip": b"b" * 50_000}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    etag = '"v1"'
+    truncate = set()
+    ranges = []
+    gets = []
+
+    def do_HEAD(self) -> None:  # noqa: N802 - stdlib naming
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(FILES[self.path])))
+        self.end_headers()
+
+    def do_GET(self) -> None:  # noqa: N802 - stdlib naming
+        self.gets.append(self.path)
+        body = FILES[self.path]
+        start = 0
+        requested = self.headers.get("Range")
+        if requested and self.headers.get("If-Range") == self.etag:
+            self.ranges.append((self.path, requested))
+            start = int(requested.split("=")[1].rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        if self.path in self.truncate:
+            self.truncate.discard(self.path)
+            self.wfile.write(body[start:start + 1000])
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server():
+    StubHandler.truncate = set()
+    StubHandler.ranges = []
+    StubHandler.gets = []
+    StubHandler.etag = '"v1"'
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+def test_interrupted_download_resumes_with_range(server, tmp_path):
+    dest = tmp_path / "a.zip"
+    StubHandler.truncate = {"/a.zip"}
+    with pytest.raises(requests.ConnectionError):
+        download._download(f"{server}/a.zip", dest)
+    part = tmp_path / "a.zip.part"
+    assert not dest.exists() and part.stat().st_size == 1000
+
+    download._download(f"{server}/a.zip", dest)
+    assert dest.read_bytes() == FILES["/a.zip"]
+    assert StubHandler.ranges == [("/a.zip", "bytes=1000-")]
+    assert not part.exists() and not (tmp_path / "a.zip.part.json").exists()
+
+
+def test_changed_file_restarts_from_zero(server, tmp_path):
+    dest = tmp_path / "a.zip"
+    (tmp_path / "a.zip.part").write_bytes(b"stale" * 10)
+    (tmp_path / "a.zip.part.json").write_text(json.dumps({"etag": '"v0"', "size": 999}))
+    download._download(f"{server}/a.zip", dest)
+    assert dest.read_bytes() == FILES["/a.zip"]
+    assert StubHandler.ranges == []
+
+
+def test_download_many_is_concurrent_and_capped(server, tmp_path):
+    jobs = [(f"{server}{name}", tmp_path / str(i) / name.lstrip("/")) for i in range(3) for name in FILES]
+    download.download_many(jobs, max_connections=3, max_bytes_per_sec=50e6)
+    for url, dest in jobs:
+        assert dest.read_bytes() == FILES["/" + dest.name]
+
+    with pytest.raises(RuntimeError, match="missing.zip"):
+        download.download_many([(f"{server}/a.zip", tmp_path / "x.zip"), (f"{server}/missing.zip", tmp_path / "m")])
+    assert (tmp_path / "x.zip").exists()
+
+
+def test_existing_file_is_kept_only_when_its_size_matches(server, tmp_path):
+    dest = tmp_path / "b.zip"
+    dest.write_bytes(FILES["/b.zip"])
+    download._download(f"{server}/b.zip", dest)
+    assert StubHandler.gets == []
+
+    dest.write_bytes(b"truncated")
+    download._download(f"{server}/b.zip", dest)
+    assert StubHandler.gets == ["/b.zip"]
+    assert dest.read_bytes() == FILES["/b.zip"]
+
+
+def test_throttle_spaces_out_consumers(monkeypatch):
+    slept = []
+    throttle = download.Throttle(1000)
+    monkeypatch.setattr(download.time, "sleep", slept.append)
+    throttle.consume(500)
+    throttle.consume(500)
+    assert len(slept) == 1 and slept[0] == pytest.approx(0.5, abs=0.05)
@@ -0,0 +1,118 @@
+import sys
+import zipfile
+from datetime import date
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from pipeline import extract_fec
+
+
+def _zip(path: Path, name: str, text: str) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(name, text.encode("latin-1"))
+    return path
+
+
+def test_itcont_streams_to_typed_parquet(tmp_path):
+    rows = []
+    for i in range(500):
+        rows.append(
+            f"C{i:08d}|N|Q1|P2024|2024{i}|15|IND|DOE, JOSÉ {i}|CITY|ST|12345|EMP|OCC|"
+            f"01{(i % 28) + 1:02d}2024|{i}.50||T{i}|{i}|||{4000000 + i}"
+        )
+    rows.insert(3, "broken|row")
+    zip_path = _zip(tmp_path / "indiv_contrib.zip", "itcont.txt", "\n".join(rows) + "\n")
+    out = tmp_path / "out.parquet"
+
+    stats = extract_fec.stream_extract(zip_path, "indiv_contrib", out, block_size=4096)
+
+    assert stats == (500, 1, 0)
+    pf = pq.ParquetFile(out)
+    assert pf.metadata.num_row_groups > 1
+    schema = pf.schema_arrow
+    assert schema.names == extract_fec.FEC_COLUMNS["indiv_contrib"]
+    assert schema.field("TRANSACTION_AMT").type == pa.float64()
+    assert schema.field("TRANSACTION_DT").type == pa.date32()
+    assert schema.field("SUB_ID").type == pa.int64()
+    assert schema.field("NAME").type == pa.string()
+    table = pq.read_table(out, columns=["NAME", "TRANSACTION_DT", "TRANSACTION_AMT"])
+    first = table.slice(0, 1).to_pylist()[0]
+    assert first == {"NAME": "DOE, JOSÉ 0", "TRANSACTION_DT": date(2024, 1, 1), "TRANSACTION_AMT": 0.5}
+
+
+def test_trailing_delimiter_and_headed_csv(tmp_path):
+    cols = extract_fec.FEC_COLUMNS["disbursements"]
+    line = "|".join(["C1", "N", "2024"] + [""] * 10 + ["12.5"] + [""] * (len(cols) - 14)) + "|"
+    zip_path = _zip(tmp_path / "disbursements.zip", "oppexp.txt", line + "\n")
+    out = tmp_path / "oppexp.parquet"
+    assert extract_fec.stream_extract(zip_path, "disbursements", out).rows == 1
+    table = pq.read_table(out)
+    assert table.schema.names == cols
+    assert table.column("TRANSACTION_AMT").to_pylist() == [12.5]
+    assert table.column("RPT_YR").to_pylist() == [2024]
+
+    zip_path = _zip(tmp_path / "candidates.zip", "cn.csv", "CAND_ID,NAME\nH0XX00001,\"Smith, Alice\"\n")
+    out = tmp_path / "cn.csv"
+    assert extract_fec.stream_extract(zip_path, "candidates", out, fmt="csv").rows == 1
+    assert out.read_text().splitlines() == ['"CAND_ID","NAME"', '"H0XX00001","Smith, Alice"']
+
+
+def test_bad_dates_and_amounts_are_nulled_and_counted(tmp_path):
+    def row(i, dt, amt):
+        return f"C{i:08d}|N|Q1|P2024|{i}|15|IND|DOE|CITY|ST|12345|EMP|OCC|{dt}|{amt}||T{i}|{i}|||{i}"
+
+    rows = [row(i, "01022024", "10") for i in range(300)]
+    rows[5] = row(5, "13452024", "10")
+    rows[7] = row(7, "01022024", "abc")
+    rows[9] = row(9, "", " ")
+    zip_path = _zip(tmp_path / "indiv_contrib.zip", "itcont.txt", "\n".join(rows) + "\n")
+    out = tmp_path / "out.parquet"
+
+    assert extract_fec.stream_extract(zip_path, "indiv_contrib", out) == (300, 0, 2)
+    table = pq.read_table(out, columns=["TRANSACTION_DT", "TRANSACTION_AMT"]).to_pylist()
+    assert table[4] == {"TRANSACTION_DT": date(2024, 1, 2), "TRANSACTION_AMT": 10.0}
+    assert table[5] == {"TRANSACTION_DT": None, "TRANSACTION_AMT": 10.0}
+    assert table[7] == {"TRANSACTION_DT": date(2024, 1, 2), "TRANSACTION_AMT": None}
+    assert table[9] == {"TRANSACTION_DT": None, "TRANSACTION_AMT": None}
+
+
+def test_layout_change_fails_instead_of_dropping_rows(tmp_path):
+    cols = extract_fec.FEC_COLUMNS["candidates"]
+    # Two new columns: more fields than the layout, even allowing a trailing delimiter.
+    rows = ["|".join([f"H{i}"] + [""] * (len(cols) + 1)) for i in range(50)]
+    zip_path = _zip(tmp_path / "candidates.zip", "cn.txt", "\n".join(rows) + "\n")
+    out = tmp_path / "cn.parquet"
+
+    with pytest.raises(ValueError, match="50 of 50 rows"):
+        extract_fec.stream_extract(zip_path, "candidates", out)
+    assert not out.exists()
+
+
+def test_extract_skips_unchanged_bulk_files(tmp_path, monkeypatch):
+    from pipeline import paths
+
+    monkeypatch.setattr(paths, "RAW_DIR", tmp_path / "raw")
+    monkeypatch.setattr(paths, "INTERIM_DIR", tmp_path / "interim")
+    cycle_dir = paths.RAW_DIR / "fec" / "2024"
+    cycle_dir.mkdir(parents=True)
+    _zip(cycle_dir / "candidates.zip", "cn.csv", "CAND_ID,NAME\nH0XX00001,Alice\n")
+    calls = []
+    real = extract_fec.stream_extract
+    monkeypatch.setattr(extract_fec, "stream_extract", lambda *a, **k: calls.append(a[1]) or real(*a, **k))
+
+    extract_fec.extract([2024])
+    extract_fec.extract([2024])
+    assert calls == ["candidates"]
+    _zip(cycle_dir / "candidates.zip", "cn.csv", "CAND_ID,NAME\nH0XX00002,Bob\n")
+    extract_fec.extract([2024])
+    assert paths.read_table("fec_candidates_2024")["CAND_ID"].tolist() == ["H0XX00002"]
+    extract_fec.extract([2024], full=True)
+    assert calls == ["candidates"] * 3
@@ -0,0 +1,126 @@
+import json
+import sys
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from pipeline import extract_votes, paths
+
+
+def _xml(vote_id: str, positions: dict) -> str:
+    records = "".join(f"<record><id>{b}</id><vote>{v}</vote></record>" for b, v in positions.items())
+    return (
+        f"<rollcall><vote_id>{vote_id}</vote_id><chamber>house</chamber><congress>118</congress>"
+        f"<rollnumber>{vote_id[1:]}</rollnumber><records>{records}</records></rollcall>"
+    )
+
+
+def test_extracts_zip_members_in_parallel(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "INTERIM_DIR", tmp_path / "interim")
+    monkeypatch.setattr(extract_votes, "BATCH_SIZE", 2)
+    roll_dir = tmp_path / "rollcalls" / "118"
+    roll_dir.mkdir(parents=True)
+    with zipfile.ZipFile(roll_dir / "house_rollcallvotes.zip", "w") as zf:
+        for i in range(1, 6):
+            zf.writestr(f"118/house/h{i}.xml", _xml(f"h{i}", {"A000001": "Yea", "B000001": "Nay"}))
+        zf.writestr("118/house/broken.xml", "<rollcall><vote_id>")
+        zf.writestr("118/house/README.txt", "not a roll call")
+    loose = {"vote_id": "s1", "chamber": "senate", "congress": 118, "rollnumber": 1,
+             "records": [{"id": "S000001", "vote": "Yea"}]}
+    (roll_dir / "s1.json").write_text(json.dumps(loose))
+
+    errors = extract_votes.extract(tmp_path / "rollcalls", workers=2)
+
+    assert [(Path(e["path"]).name, e["member"]) for e in errors] == [
+        ("house_rollcallvotes.zip", "118/house/broken.xml"),
+    ]
+    assert "XMLSyntaxError" in errors[0]["error"]
+    votes = paths.read_table("votes")
+    assert votes["vote_id"].tolist() == ["s1", "h1", "h2", "h3", "h4", "h5"]
+    assert votes["rollnumber"].tolist() == [1, 1, 2, 3, 4, 5]
+    records = paths.read_table("vote_records")
+    assert len(records) == 11
+    assert len(paths.read_table("vote_extract_errors")) == 1
+
+    extract_votes.extract(tmp_path / "rollcalls", workers=1)
+    assert paths.read_table("votes").equals(votes)
+
+
+def test_rows_are_plain_tuples_in_column_order():
+    parser = extract_votes.VoteParser()
+    xml = (
+        b"<rollcall><vote_id>h7</vote_id><congress>118</congress><bill>hr1</bill><date/>"
+        b"<records><record><id>A1</id><vote>Yea</vote></record><record><id>B2</id></record></records></rollcall>"
+    )
+    vote, records = parser.rows(xml, "h7.xml")
+    assert dict(zip(extract_votes.VOTE_COLUMNS, vote)) == {
+        "vote_id": "h7", "chamber": None, "congress": "118", "session": None, "rollnumber": None,
+        "date": "", "question": None, "result": None, "bill_id": "hr1",
+    }
+    assert records == [("h7", "A1", "Yea"), ("h7", "B2", None)]
+
+    buffers = extract_votes.VoteBuffers()
+    buffers.add(vote, records)
+    buffers.add(*parser.rows(b"<rollcall><records/></rollcall>", "x.xml"))
+    votes, recs = buffers.frames()
+    assert votes["vote_id"].tolist() == ["h7", "unknown"]
+    assert votes["congress"].tolist()[0] == 118
+    assert recs.shape == (2, 3)
+
+
+def test_same_named_nested_elements_are_ignored():
+    parser = extract_votes.VoteParser()
+    xml = (
+        b"<rollcall><vote_id>h8</vote_id><result>Passed</result>"
+        b"<amendment><date>2001-01-01</date><result>Failed</result></amendment>"
+        b"<records><id>STRAY</id>"
+        b"<record><id>A1</id><vote>Yea</vote><note><id>X9</id><vote>Nay</vote></note></record>"
+        b"<record><vote>Nay</vote></record></records>"
+        b"<other><record><id>Z1</id><vote>Yea</vote></record></other><date>2023-01-09</date></rollcall>"
+    )
+    vote, records = parser.rows(xml, "h8.xml")
+    fields = dict(zip(extract_votes.VOTE_COLUMNS, vote))
+    assert (fields["vote_id"], fields["date"], fields["result"]) == ("h8", "2023-01-09", "Passed")
+    assert records == [("h8", "A1", "Yea"), ("h8", None, "Nay")]
+
+
+def test_incremental_extract_rebuilds_only_changed_partitions(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "INTERIM_DIR", tmp_path / "interim")
+    rollcalls = tmp_path / "rollcalls"
+    house, senate = rollcalls / "118" / "house", rollcalls / "118" / "senate"
+    house.mkdir(parents=True)
+    senate.mkdir(parents=True)
+    (house / "h1.xml").write_text(_xml("h1", {"A000001": "Yea"}))
+    (senate / "s1.xml").write_text(_xml("s1", {"S000001": "Nay"}))
+    extract_votes.extract(rollcalls, workers=1)
+    house_part = paths.partition_path("votes", "118__house")
+    senate_part = paths.partition_path("votes", "118__senate")
+    stamps = {p: p.stat().st_mtime_ns for p in (house_part, senate_part)}
+
+    # Touching a file without changing it, or rerunning, rebuilds nothing.
+    (senate / "s1.xml").touch()
+    extract_votes.extract(rollcalls, workers=1)
+    assert {p: p.stat().st_mtime_ns for p in stamps} == stamps
+
+    (house / "h2.xml").write_text(_xml("h2", {"A000001": "Nay"}))
+    with zipfile.ZipFile(rollcalls / "117.zip", "w") as zf:
+        zf.writestr("h9.xml", _xml("h9", {"A000001": "Yea"}))
+    extract_votes.extract(rollcalls, workers=1)
+    assert senate_part.stat().st_mtime_ns == stamps[senate_part]
+    assert house_part.stat().st_mtime_ns != stamps[house_part]
+    assert sorted(paths.read_table("votes")["vote_id"]) == ["h1", "h2", "h9", "s1"]
+
+    (rollcalls / "117.zip").unlink()
+    (house / "h1.xml").unlink()
+    extract_votes.extract(rollcalls, workers=1)
+    assert paths.partitions("votes") == ["118__house", "118__senate"]
+    assert sorted(paths.read_table("votes")["vote_id"]) == ["h2", "s1"]
+    assert sorted(paths.read_table("vote_records")["vote_id"]) == ["h2", "s1"]
+
+    extract_votes.extract(rollcalls, workers=1, full=True)
+    assert senate_part.stat().st_mtime_ns != stamps[senate_part]
+    assert sorted(paths.read_table("votes")["vote_id"]) == ["h2", "s1"]
@@ -0,0 +1,55 @@
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from pipeline import legislators
+
+YAML = """
+- id: {bioguide: A000001, fec: [H0XX01001, S2XX00001], govtrack: 400001}
+  name: {first: Ann, last: Able}
+  terms:
+  - {type: rep, start: '2019-01-03', end: '2021-01-03', state: XX, district: 1, party: Democrat}
+  - {type: sen, start: '2021-01-03', end: '2027-01-03', state: XX, party: Democrat}
+- id: {bioguide: B000002, fec: H0YY02002}
+  name: {first: Bob, last: Baker}
+  terms: []
+"""
+
+
+def test_snapshot_is_reused_until_the_file_changes(tmp_path, monkeypatch):
+    src = tmp_path / "legislators-current.yaml"
+    src.write_text(YAML)
+    cache = tmp_path / "snapshots"
+
+    first = legislators.load_legislators(src, cache)
+    ann, bob = first
+    assert ann.bioguide_id == "A000001"
+    assert (ann.term_type, ann.first_term_start, ann.last_term_end) == ("sen", "2019-01-03", "2027-01-03")
+    assert ann.fec_ids == ("H0XX01001", "S2XX00001")
+    assert [(t.type, t.district, t.start) for t in ann.terms] == [("rep", 1, "2019-01-03"), ("sen", None, "2021-01-03")]
+    assert bob.fec_ids == ("H0YY02002",)
+    assert bob.term_type is None and bob.first_term_start is None
+    assert len(list(cache.glob("*.pickle"))) == 1
+
+    def no_yaml(data):
+        raise AssertionError("snapshot should have been used")
+
+    monkeypatch.setattr(legislators, "parse", no_yaml)
+    assert legislators.load_legislators(src, cache) == first
+
+    monkeypatch.undo()
+    src.write_text(YAML.replace("Bob", "Robert"))
+    assert legislators.load_legislators(src, cache)[1].first_name == "Robert"
+    assert len(list(cache.glob("*.pickle"))) == 1
+
+
+def test_parse_rejects_unsafe_tags():
+    with pytest.raises(yaml.YAMLError):
+        legislators.parse(b"- !!python/object/apply:os.system ['true']")
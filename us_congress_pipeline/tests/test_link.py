@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from pipeline import link, paths
+
+
+def test_links_all_cycles_in_one_join(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "INTERIM_DIR", tmp_path)
+    paths.write_table(pd.DataFrame({"bioguide_id": ["A1", "B2", "C3"]}), "legislators")
+    xwalk = pd.DataFrame({
+        "bioguide_id": ["A1", "B2", "C3", "Z9"],
+        "fec_candidate_ids": ["H1;S1", None, "H3;", "H9"],
+    }).astype({"fec_candidate_ids": "string"})
+    paths.write_table(xwalk, "xwalk_ids")
+    paths.write_table(pd.DataFrame({"CAND_ID": ["S1", "H3", "H9", "H1"]}), "fec_candidates_2022")
+    paths.write_table(pd.DataFrame({"CAND_ID": ["H1", "H1"]}), "fec_candidates_2024")
+
+    link.link_legislators_candidates([2022, 2024])
+
+    links = paths.read_table("legislator_candidate_link")
+    assert list(links.columns) == link.LINK_COLUMNS
+    assert links[["cycle", "bioguide_id", "cand_id"]].values.tolist() == [
+        [2022, "A1", "H1"], [2022, "A1", "S1"], [2022, "C3", "H3"], [2024, "A1", "H1"],
+    ]
+    assert set(links["method"]) == {"yaml_direct"}
+
+
+def test_fuzzy_pass_links_legislators_without_fec_ids(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "INTERIM_DIR", tmp_path)
+    legislators = pd.DataFrame({
+        "bioguide_id": ["A1", "G1", "O1", "N1", "S1"],
+        "first_name": ["Alice", "Joe", "Old", "Nobody", "Sam"],
+        "last_name": ["Smith", "García", "Timer", "Here", "Senator"],
+        "party": ["Democrat", "Republican", "Democrat", "Democrat", "Independent"],
+        "state": ["XX", "YY", "XX", "XX", "XX"],
+        "district": pd.array([1, 2, 1, 3, None], dtype="Int64"),
+        "office": ["H", "H", "H", "H", "S"],
+        "first_year": pd.array([2019, 2021, 1901, 2019, 2013], dtype="Int64"),
+        "last_year": pd.array([2025, 2025, 1911, 2025, 2025], dtype="Int64"),
+    })
+    paths.write_table(legislators, "legislators")
+    paths.write_table(legislators.drop(columns=["first_name", "last_name"]), "legislator_terms")
+    xwalk = pd.DataFrame({"bioguide_id": ["A1", "G1", "O1", "N1", "S1"],
+                          "fec_candidate_ids": ["H0XX01001", None, None, None, None]})
+    paths.write_table(xwalk.astype({"fec_candidate_ids": "string"}), "xwalk_ids")
+    cn = pd.DataFrame(
+        [
+            ["H0XX01001", "SMITH, ALICE", "DEM", "XX", "H", "01"],
+            ["H0YY02002", "GARCIA, JOSE A. JR.", "REP", "YY", "H", "02"],
+            ["H0YY02003", "GARCIA, MARIA", "DEM", "YY", "H", "02"],
+            ["H0XX01004", "TIMER, OLD", "DEM", "XX", "H", "01"],
+            ["H0XX03005", "HEREFORD, JOHN", "REP", "XX", "H", "03"],
+            ["S0XX00006", "SENATOR, SAMUEL", "IND", "XX", "S", "00"],
+        ],
+        columns=list(link.CANDIDATE_COLUMNS),
+    )
+    paths.write_table(cn, "fec_candidates_2024")
+
+    link.link_legislators_candidates([2024])
+
+    links = paths.read_table("legislator_candidate_link").set_index("bioguide_id")
+    assert links.loc["A1", "method"] == "yaml_direct"
+    assert links.loc["G1", ["cand_id", "method"]].tolist() == ["H0YY02002", "fuzzy"]
+    assert 0.75 <= links.loc["G1", "score"] < 1
+    assert links.loc["S1", "cand_id"] == "S0XX00006"
+    # Out of office in 2024, and a different person in the same block.
+    assert "O1" not in links.index and "N1" not in links.index
+
+
+def test_fuzzy_pass_matches_every_term_of_a_member_who_changed_chambers(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "INTERIM_DIR", tmp_path)
+    paths.write_table(pd.DataFrame({"bioguide_id": ["C1"], "first_name": ["Carl"], "last_name": ["Chambers"]}),
+                      "legislators")
+    terms = pd.DataFrame({
+        "bioguide_id": ["C1", "C1"],
+        "party": ["Republican", "Republican"],
+        "state": ["XX", "XX"],
+        "district": pd.array([2, None], dtype="Int64"),
+        "office": ["H", "S"],
+        "first_year": pd.array([2013, 2019], dtype="Int64"),
+        "last_year": pd.array([2019, 2025], dtype="Int64"),
+    })
+    paths.write_table(terms, "legislator_terms")
+    paths.write_table(pd.DataFrame({"bioguide_id": ["C1"], "fec_candidate_ids": [None]}).astype(
+        {"fec_candidate_ids": "string"}), "xwalk_ids")
+    house = ["H2XX02001", "CHAMBERS, CARL", "REP", "XX", "H", "02"]
+    senate = ["S8XX00002", "CHAMBERS, CARL", "REP", "XX", "S", "00"]
+    for cycle, rows in {2014: [house], 2018: [house, senate], 2024: [senate]}.items():
+        paths.write_table(pd.DataFrame(rows, columns=list(link.CANDIDATE_COLUMNS)), f"fec_candidates_{cycle}")
+
+    links = link.fuzzy_links([2014, 2018, 2024])
+
+    assert links[["cycle", "cand_id"]].values.tolist() == [
+        [2014, "H2XX02001"], [2018, "H2XX02001"], [2024, "S8XX00002"],
+    ]
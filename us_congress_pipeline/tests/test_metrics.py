@@ -0,0 +1,122 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from pipeline import metrics, paths
+
+
+@pytest.fixture
+def interim(tmp_path, monkeypatch):
+    for name in ["INTERIM_DIR", "OUTPUT_DIR", "WAREHOUSE_DIR"]:
+        monkeypatch.setattr(paths, name, tmp_path / name.lower())
+    members = [
+        ("A000001", "Democrat"), ("A000002", "Democrat"), ("A000003", "Democrat"),
+        ("B000001", "Republican"), ("B000002", "Republican"), ("B000003", "Republican"),
+        ("C000001", None),
+    ]
+    paths.write_table(pd.DataFrame(members, columns=["bioguide_id", "party"]), "legislators")
+    positions = {
+        "h1": ["Yea", "Yea", "Nay", "Nay", "Nay", "Yea", "Yea"],
+        "h2": ["Yea", "Yea", "Nay", "Yea", "Yea", "Not Voting", "Nay"],
+        "h3": ["Nay", "Nay", "Nay", "Yea", "Nay", "Yea", "Yea"],
+        "h5": ["Aye", "No", "Yea", "Yea", "Nay", "Not Voting", "Yea"],
+        "h117": ["Nay", "Nay", "Nay", "Nay", "Nay", "Nay", "Nay"],
+    }
+    records = [
+        (vote_id, bioguide_id, pos)
+        for vote_id, votes in positions.items()
+        for (bioguide_id, _), pos in zip(members, votes)
+    ]
+    records = [r for r in records if r[:2] != ("h3", "A000003")]
+    paths.write_table(pd.DataFrame(records, columns=["vote_id", "bioguide_id", "position"]), "vote_records")
+    votes = pd.DataFrame({
+        "vote_id": ["h1", "h2", "h3", "h4", "h5", "h117"],
+        "congress": pd.array([118] * 5 + [117], dtype="Int64"),
+    })
+    paths.write_table(votes, "votes")
+    paths.write_table(
+        pd.DataFrame({"CAND_ID": ["H1", "H2", "H3"], "TOTAL_RECEIPTS": ["250000", "1000", "n/a"]}),
+        "fec_candidate_totals_2024",
+    )
+    paths.write_table(
+        pd.DataFrame({
+            "CAND_ID": ["H1", "H1", "H2", "H9", "H1", "H2", "H2"],
+            "TRANSACTION_AMT": [50.0, 500.0, 200.0, 10.0, 2500.0, None, 2000.0],
+        }),
+        "fec_indiv_contrib_2024",
+    )
+    links = pd.DataFrame({
+        "cycle": [2024, 2024, 2024], "bioguide_id": ["A000003", "B000001", "C000001"],
+        "cand_id": ["H1", "H2", "H7"], "method": ["yaml_direct"] * 3, "score": [1.0] * 3,
+    })
+    paths.write_table(links, "legislator_candidate_link")
+    return tmp_path
+
+
+def _outputs():
+    return {f.name: pd.read_csv(f) for f in sorted(paths.OUTPUT_DIR.glob("*.csv"))}
+
+
+def test_vote_summary_uses_party_tally(interim):
+    metrics.build_metrics([], [118])
+    tally = paths.read_table("vote_party_tally_118").set_index(["vote_id", "party"])
+    assert "h117" not in tally.index.get_level_values("vote_id")
+    assert tally.loc[("h5", "Democrat"), ["yea", "nay", "present", "not_voting"]].tolist() == [2, 1, 0, 0]
+    assert tally.loc[("h5", "Democrat"), "party_position"] == "Yea"
+    assert pd.isna(tally.loc[("h5", "Republican"), "party_position"])
+    assert tally.loc[("h2", "Republican"), "not_voting"] == 1
+
+    summary = pd.read_csv(paths.OUTPUT_DIR / "incumbent_vote_summary_118.csv").set_index("bioguide_id")
+    # A000003 defected on h1 and h2, voted with the party on h5 and skipped h3.
+    assert summary.loc["A000003", ["party_votes", "defections"]].tolist() == [3, 2]
+    assert summary.loc["A000003", "unity"] == pytest.approx(1 / 3)
+    assert summary.loc["A000003", "participation_rate"] == pytest.approx(3 / 5)
+    # The Republican tie on h5 does not count towards unity.
+    assert summary.loc["B000002", "party_votes"] == 3
+    assert summary.loc["B000003", "participation_rate"] == pytest.approx(2 / 5)
+    assert pd.isna(summary.loc["C000001", "unity"])
+
+
+def test_finance_bands_stream_in_batches(interim):
+    one_pass = metrics._receipt_bands(2024)
+    assert metrics._receipt_bands(2024, batch_size=2).equals(one_pass)
+    assert one_pass.loc["H1"].tolist() == [50.0, 500.0, 2500.0, 3.0]
+    assert one_pass.loc["H2"].tolist() == [200.0, 2000.0, 0.0, 2.0]
+
+    metrics.build_metrics([2024], [])
+    summary = pd.read_csv(paths.OUTPUT_DIR / "candidate_finance_summary_2024.csv")
+    assert list(summary.columns) == [
+        "cand_id", "total_receipts", "small_dollar", "mid_dollar", "large_dollar", "contributions",
+    ]
+    assert summary["contributions"].tolist() == [3, 2, 0]
+
+
+def test_duckdb_engine_matches_pandas(interim):
+    metrics.build_metrics([2024], [118])
+    expected = _outputs()
+    expected_tally = paths.read_table("vote_party_tally_118")
+    for f in paths.OUTPUT_DIR.glob("*.csv"):
+        f.unlink()
+    metrics.build_metrics([2024], [118], engine="duckdb")
+    actual = _outputs()
+    pd.testing.assert_frame_equal(paths.read_table("vote_party_tally_118"), expected_tally, check_dtype=False)
+
+    assert list(actual) == list(expected) == [
+        "alignment_flags_2024_118.csv", "candidate_finance_summary_2024.csv", "incumbent_vote_summary_118.csv",
+    ]
+    for name, df in expected.items():
+        pd.testing.assert_frame_equal(actual[name], df, check_dtype=False)
+    flags = expected["alignment_flags_2024_118.csv"]
+    assert flags["flag"].tolist() == [True, False, False]
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        metrics.build_metrics([], [], engine="spark")
@@ -0,0 +1,101 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from pipeline import normalize, paths
+
+
+def _write_interim():
+    paths.write_table(pd.DataFrame({
+        "bioguide_id": ["A1", "B2"], "first_name": ["Ann", "Bob"], "last_name": ["Able", "Baker"],
+        "party": ["Democrat", "Republican"], "state": ["XX", "YY"],
+    }), "legislators")
+    paths.write_table(pd.DataFrame({
+        "vote_id": ["v1", "v2"], "chamber": ["h", "s"], "congress": [118, 118], "session": ["1", "1"],
+        "rollnumber": [1, 1], "date": ["2023-01-03", "2023-01-04"], "question": ["q", "q"],
+        "result": ["Passed", "Failed"], "bill_id": [None, "hr1"],
+    }), "votes")
+    paths.write_table(pd.DataFrame({
+        "vote_id": ["v1", "v1", "v2"], "bioguide_id": ["A1", "B2", "A1"], "position": ["Yea", "Nay", "Nay"],
+    }), "vote_records")
+    paths.write_table(pd.DataFrame({
+        "CAND_ID": ["H1", "S2"], "CAND_NAME": ["ABLE, ANN", "BAKER, BOB"],
+        "CAND_ELECTION_YR": [2024, 2024],
+    }), "fec_candidates_2024")
+    paths.write_table(pd.DataFrame({"CAND_ID": ["H1"], "TRANSACTION_AMT": [50.0]}), "fec_indiv_contrib_2024")
+
+
+def _counts(db):
+    con = sqlite3.connect(db)
+    try:
+        return {
+            t: con.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+            for t in ["legislators", "votes", "vote_records", "fec_candidates_2024", "fec_indiv_contrib_2024"]
+        }
+    finally:
+        con.close()
+
+
+def test_reloading_upserts_instead_of_duplicating(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "INTERIM_DIR", tmp_path / "interim")
+    db = tmp_path / "congress.db"
+    _write_interim()
+
+    stats = normalize.load_sqlite(db, batch_size=1)
+    assert {s.table: s.rows for s in stats} == {
+        "legislators": 2, "votes": 2, "vote_records": 3, "fec_candidates_2024": 2, "fec_indiv_contrib_2024": 1,
+    }
+    assert all(s.rows_per_sec > 0 for s in stats)
+    first = _counts(db)
+
+    paths.write_table(pd.DataFrame({
+        "vote_id": ["v1", "v1", "v2"], "bioguide_id": ["A1", "B2", "A1"], "position": ["Yea", "Yea", "Nay"],
+    }), "vote_records")
+    normalize.load_sqlite(db)
+    assert _counts(db) == first
+
+    con = sqlite3.connect(db)
+    try:
+        assert con.execute(
+            "SELECT position FROM vote_records WHERE vote_id = 'v1' AND bioguide_id = 'B2'"
+        ).fetchone() == ("Yea",)
+        assert con.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        indexes = {row[1] for row in con.execute("SELECT * FROM sqlite_master WHERE type = 'index'")}
+    finally:
+        con.close()
+    assert {"ix_vote_records_bioguide_id", "ix_votes_congress", "uq_fec_candidates_2024"} <= indexes
+
+
+def test_first_load_repairs_an_append_only_warehouse(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "INTERIM_DIR", tmp_path / "interim")
+    db = tmp_path / "congress.db"
+    _write_interim()
+    con = sqlite3.connect(db)
+    con.executescript("""
+        CREATE TABLE vote_records (id INTEGER PRIMARY KEY, vote_id VARCHAR, bioguide_id VARCHAR, position VARCHAR);
+        INSERT INTO vote_records (vote_id, bioguide_id, position) VALUES
+            ('v1', 'A1', 'Nay'), ('v1', 'A1', 'Yea'), ('v9', 'Z9', 'Nay'), ('v9', 'Z9', 'Present');
+        CREATE TABLE fec_candidates_2024 (CAND_ID VARCHAR, CAND_NAME VARCHAR, OLD_COLUMN VARCHAR);
+        INSERT INTO fec_candidates_2024 VALUES ('H1', 'OLD NAME', 'x'), ('H1', 'OLD NAME', 'y');
+    """)
+    con.close()
+
+    normalize.load_sqlite(db)
+
+    con = sqlite3.connect(db)
+    try:
+        records = con.execute("SELECT vote_id, bioguide_id, position FROM vote_records ORDER BY vote_id, bioguide_id")
+        assert records.fetchall() == [
+            ("v1", "A1", "Yea"), ("v1", "B2", "Nay"), ("v2", "A1", "Nay"), ("v9", "Z9", "Present"),
+        ]
+        candidates = con.execute("SELECT CAND_ID, CAND_NAME, OLD_COLUMN FROM fec_candidates_2024 ORDER BY CAND_ID")
+        assert candidates.fetchall() == [("H1", "ABLE, ANN", "y"), ("S2", "BAKER, BOB", None)]
+    finally:
+        con.close()
@@ -0,0 +1,34 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from pipeline import paths
+
+
+def test_interim_tables_keep_types(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "INTERIM_DIR", tmp_path / "interim")
+    df = pd.DataFrame({
+        "vote_id": ["h1-118.2023", "h2-118.2023"],
+        "congress": pd.array([118, 118], dtype="Int64"),
+        "amount": [1.5, None],
+    })
+    paths.write_table(df, "votes")
+    paths.write_table(df.head(1), "fec_candidates_2024")
+
+    assert paths.table_exists("votes")
+    assert paths.table_names("fec_candidates_*") == ["fec_candidates_2024"]
+    back = paths.read_table("votes")
+    assert back.dtypes.to_dict() == df.dtypes.to_dict()
+    assert list(paths.read_table("votes", columns=["congress"]).columns) == ["congress"]
+    assert str(paths.table_schema("votes").field("congress").type) == "int64"
+    only = paths.read_table("votes", filters=[("vote_id", "==", "h2-118.2023")])
+    assert only["vote_id"].tolist() == ["h2-118.2023"]
+
+    out = paths.export_csv("votes", tmp_path)
+    assert pd.read_csv(out)["congress"].tolist() == [118, 118]
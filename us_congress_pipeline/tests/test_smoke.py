@@ -86,5 +86,6 @@ def test_pipeline_smoke(tmp_path):
     assert out.exists()
     df = pd.read_csv(out)
     assert "cand_id" in df.columns
+    assert paths.table_exists("votes") and paths.table_exists("fec_candidates_2024")
     vote_out = paths.OUTPUT_DIR / "incumbent_vote_summary_118.csv"
     assert vote_out.exists()